@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""Computerized adaptive testing: IRT calibration and a batched item selector.
+
+Calibration fits a three-parameter logistic model with the guessing floor
+fixed at 1 / options (a four-option question is right a quarter of the time
+by chance):
+
+    P(correct | theta) = c + (1 - c) / (1 + exp(-a (theta - b)))
+
+from response logs in bulk_grader's row format, by joint maximum likelihood:
+alternating Fisher-scoring steps for every student ability, item difficulty
+b and discrimination a, each step one set of NumPy bincounts over all rows.
+The parameters are saved as irt_params.json.
+
+At runtime ItemTables precomputes, for an ability grid of GRID points, the
+item information, log P and log (1 - P) of every question. A SessionPool
+holds thousands of sessions as arrays (log posterior over the grid, used
+questions), so for all of them at once:
+
+  * the next question is an argmax over the information row of each
+    session's ability estimate, with used questions masked
+  * an answer adds the question's log P or log (1 - P) column to the
+    posterior; the estimate and its standard error are the posterior mean
+    and spread (EAP)
+
+A session stops once its standard error drops below SE_STOP:
+
+    python adaptive_test.py calibrate logs.csv          # -> irt_params.json
+    python adaptive_test.py simulate                    # accuracy vs fixed tests
+    python adaptive_test.py bench --sessions 10000      # selector throughput
+"""
+import argparse, json, os, time
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PARAMS_PATH = os.path.join(SCRIPT_DIR, 'irt_params.json')
+
+GRID = np.linspace(-4, 4, 81)
+SE_STOP = 0.3
+MAX_ITEMS = 40
+THETA_LIMIT = 4.0
+A_RANGE = (0.2, 3.0)
+B_LIMIT = 4.0
+
+def probability(theta, a, b, c):
+    return c + (1 - c) / (1 + np.exp(-a * (theta - b)))
+
+# -- calibration -----------------------------------------------------------------
+
+def calibrate(students, items, correct, guess, iterations=40):
+    """Joint ML fit; students / items are integer codes per response row,
+    guess the fixed c of each item. Returns (theta, a, b)"""
+    n_s, n_i = students.max() + 1, len(guess)
+    u = correct.astype(float)
+    c = guess[items]
+    # start from the logits of the proportions correct
+    ps = (np.bincount(students, u, n_s) + 0.5) / (np.bincount(students, minlength=n_s) + 1)
+    pi = (np.bincount(items, u, n_i) + 0.5) / (np.bincount(items, minlength=n_i) + 1)
+    theta = np.log(ps / (1 - ps))
+    theta = (theta - theta.mean()) / max(theta.std(), 1e-9)
+    b = np.clip(-np.log(pi / (1 - pi)), -B_LIMIT, B_LIMIT)
+    a = np.ones(n_i)
+
+    def step(codes, grad, size):
+        # Fisher scoring: sum(score) / sum(information), damped to one logit
+        num = np.bincount(codes, r * grad, size)
+        den = np.bincount(codes, info * grad * grad, size)
+        return np.clip(num / np.maximum(den, 1e-9), -1, 1)
+
+    for _ in range(iterations):
+        for target in ('theta', 'b', 'a'):
+            ai, bi, th = a[items], b[items], theta[students]
+            s = 1 / (1 + np.exp(-ai * (th - bi)))
+            p = np.clip(c + (1 - c) * s, 1e-6, 1 - 1e-6)
+            r = (u - p) / (p * (1 - p))
+            info = 1 / (p * (1 - p))
+            dz = (1 - c) * s * (1 - s)          # dP / dz for z = a (theta - b)
+            if target == 'theta':
+                theta = np.clip(theta + step(students, dz * ai, n_s), -THETA_LIMIT, THETA_LIMIT)
+                # fix the scale: abilities standardized, items follow
+                theta = (theta - theta.mean()) / max(theta.std(), 1e-9)
+            elif target == 'b':
+                b = np.clip(b + step(items, -dz * ai, n_i), -B_LIMIT, B_LIMIT)
+            else:
+                a = np.clip(a + step(items, dz * (th - bi), n_i), *A_RANGE)
+    return theta, a, b
+
+def calibrate_logs(paths, questions):
+    """irt parameters {qid: {a, b, c, n}} from submission files"""
+    from bulk_grader import read_rows
+    from quiz_server import answer_key
+    key = np.frombuffer(answer_key(questions), dtype=np.int8).astype(np.int64)
+    position = np.full(len(key), -1, dtype=np.int64)
+    for i, q in enumerate(questions):
+        position[q['id']] = i
+    guess = np.array([1 / len(q['options']) for q in questions])
+    codes, s_all, i_all, u_all = {}, [], [], []
+    for path in paths:
+        for students, qids, answers in read_rows(path):
+            qids = np.asarray(qids, dtype=np.int64)
+            answers = np.asarray(answers, dtype=np.int64)
+            ok = (qids >= 0) & (qids < len(key))
+            ok[ok] = position[qids[ok]] >= 0
+            s = np.fromiter((codes.setdefault(x, len(codes)) for x in students),
+                            dtype=np.int64, count=len(students))
+            s_all.append(s[ok])
+            i_all.append(position[qids[ok]])
+            u_all.append(key[qids[ok]] == answers[ok])
+    students, items = np.concatenate(s_all), np.concatenate(i_all)
+    _, a, b = calibrate(students, items, np.concatenate(u_all), guess)
+    counts = np.bincount(items, minlength=len(questions))
+    return {q['id']: {'a': round(float(a[i]), 4), 'b': round(float(b[i]), 4),
+                      'c': round(float(guess[i]), 4), 'n': int(counts[i])}
+            for i, q in enumerate(questions) if counts[i]}
+
+# -- runtime ---------------------------------------------------------------------
+
+class ItemTables:
+    """Grid x item tables of information, log P and log (1 - P)"""
+
+    def __init__(self, ids, a, b, c, grid=GRID):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.grid = grid
+        self.step = grid[1] - grid[0]
+        self.a, self.b, self.c = (np.asarray(x, dtype=float) for x in (a, b, c))
+        a, b, c = self.a[None, :], self.b[None, :], self.c[None, :]
+        p = probability(grid[:, None], a, b, c)
+        self.info = (a * a * ((p - c) / (1 - c)) ** 2 * (1 - p) / p).astype(np.float32)
+        self.log_p = np.log(p).astype(np.float32)
+        self.log_q = np.log1p(-p).astype(np.float32)
+        self.prior = (-0.5 * grid * grid).astype(np.float32)
+
+    @classmethod
+    def load(cls, path=PARAMS_PATH, grid=GRID):
+        with open(path, 'r', encoding='utf-8') as f:
+            params = json.load(f)
+        ids = sorted(params, key=int)
+        return cls([int(q) for q in ids], *([params[q][k] for q in ids] for k in 'abc'),
+                   grid=grid)
+
+    def grid_index(self, theta):
+        return np.clip(np.rint((theta - self.grid[0]) / self.step), 0, len(self.grid) - 1).astype(np.int64)
+
+class SessionPool:
+    """Many CAT sessions as rows of NumPy arrays"""
+
+    def __init__(self, tables, capacity):
+        self.t = tables
+        self.log_post = np.tile(tables.prior, (capacity, 1))
+        self.used = np.zeros((capacity, len(tables.ids)), dtype=bool)
+        self.count = np.zeros(capacity, dtype=np.int64)
+        self.active = np.zeros(capacity, dtype=bool)
+        self._free = list(range(capacity - 1, -1, -1))
+
+    def start(self, n=1):
+        """Open n sessions; returns their slots"""
+        if n > len(self._free):
+            raise RuntimeError("session pool is full")
+        slots = np.array([self._free.pop() for _ in range(n)], dtype=np.int64)
+        self.log_post[slots] = self.t.prior
+        self.used[slots] = False
+        self.count[slots] = 0
+        self.active[slots] = True
+        return slots
+
+    def close(self, slots):
+        self.active[slots] = False
+        self._free.extend(int(s) for s in slots)
+
+    def estimate(self, slots):
+        """(EAP ability, standard error) per slot"""
+        lp = self.log_post[slots]
+        w = np.exp(lp - lp.max(axis=1, keepdims=True))
+        w /= w.sum(axis=1, keepdims=True)
+        grid = self.t.grid
+        mean = w @ grid
+        return mean, np.sqrt(np.maximum(w @ (grid * grid) - mean * mean, 0))
+
+    def next_items(self, slots):
+        """Column (index into tables.ids) of the most informative unused question per slot"""
+        theta, _ = self.estimate(slots)
+        scores = self.t.info[self.t.grid_index(theta)]
+        scores[self.used[slots]] = -1
+        return scores.argmax(axis=1)
+
+    def record(self, slots, items, correct):
+        """Add answers: items are columns from next_items, correct booleans"""
+        correct = np.asarray(correct, dtype=bool)
+        self.log_post[slots] += np.where(correct[:, None], self.t.log_p[:, items].T,
+                                         self.t.log_q[:, items].T)
+        self.used[slots, items] = True
+        self.count[slots] += 1
+
+    def done(self, slots, se_stop=SE_STOP, max_items=MAX_ITEMS):
+        _, se = self.estimate(slots)
+        return (se < se_stop) | (self.count[slots] >= max_items) \
+            | (self.count[slots] >= len(self.t.ids))
+
+# -- simulation ------------------------------------------------------------------
+
+def simulated_bank(n_items, rng):
+    a = np.clip(rng.lognormal(0, 0.3, n_items), *A_RANGE)
+    b = rng.normal(0, 1, n_items)
+    return a, b, np.full(n_items, 0.25)
+
+def run_cat(tables, true_theta, rng, se_stop=SE_STOP, max_items=MAX_ITEMS):
+    """Simulate one CAT session per true ability, all in one pool;
+    returns (estimates, items used)"""
+    pool = SessionPool(tables, len(true_theta))
+    slots = pool.start(len(true_theta))
+    a_all, b_all, c_all = tables.a, tables.b, tables.c
+    live = slots
+    while len(live):
+        items = pool.next_items(live)
+        p = probability(true_theta[live], a_all[items], b_all[items], c_all[items])
+        pool.record(live, items, rng.random(len(live)) < p)
+        live = live[~pool.done(live, se_stop, max_items)]
+    theta, _ = pool.estimate(slots)
+    return theta, pool.count[slots]
+
+def run_fixed(tables, true_theta, n_items, rng):
+    """Same students on a random fixed-length test, scored by the same EAP"""
+    pool = SessionPool(tables, len(true_theta))
+    slots = pool.start(len(true_theta))
+    a_all, b_all, c_all = tables.a, tables.b, tables.c
+    for _ in range(n_items):
+        scores = rng.random((len(slots), len(tables.ids)))
+        scores[pool.used[slots]] = -1
+        items = scores.argmax(axis=1)
+        p = probability(true_theta, a_all[items], b_all[items], c_all[items])
+        pool.record(slots, items, rng.random(len(slots)) < p)
+    return pool.estimate(slots)[0]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='IRT calibration and adaptive testing.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('calibrate', help='fit item parameters from response logs')
+    p.add_argument('logs', nargs='+')
+    p.add_argument('-o', '--output', default=PARAMS_PATH)
+    p = sub.add_parser('simulate', help='compare CAT with fixed tests on simulated students')
+    p.add_argument('--students', type=int, default=2000)
+    p.add_argument('--params', help='irt_params.json to use (default: a simulated bank)')
+    p = sub.add_parser('bench', help='time the batched selector')
+    p.add_argument('--sessions', type=int, default=10000)
+    p.add_argument('--items', type=int, default=180)
+    args = parser.parse_args(argv)
+    rng = np.random.default_rng(0)
+
+    if args.command == 'calibrate':
+        with open(os.path.join(SCRIPT_DIR, 'questions.json'), 'r', encoding='utf-8') as f:
+            questions = json.load(f)
+        start = time.perf_counter()
+        params = calibrate_logs(args.logs, questions)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(params, f, indent=1)
+        print(f"Calibrated {len(params)} questions in {time.perf_counter() - start:.2f}s "
+              f"-> {args.output}")
+    elif args.command == 'simulate':
+        if args.params:
+            tables = ItemTables.load(args.params)
+        else:
+            tables = ItemTables(np.arange(1, 181), *simulated_bank(180, rng))
+        true_theta = rng.normal(0, 1, args.students)
+        for max_items in (10, 20, MAX_ITEMS):
+            theta, used = run_cat(tables, true_theta, rng, max_items=max_items)
+            rmse = np.sqrt(np.mean((theta - true_theta) ** 2))
+            print(f"CAT (SE < {SE_STOP} or {max_items} questions): {used.mean():.1f} "
+                  f"questions on average, RMSE {rmse:.3f}")
+        for n in (10, 20, 40, 80, len(tables.ids)):
+            est = run_fixed(tables, true_theta, n, rng)
+            print(f"fixed random test of {n:3}: RMSE {np.sqrt(np.mean((est - true_theta) ** 2)):.3f}")
+    else:
+        tables = ItemTables(np.arange(args.items), *simulated_bank(args.items, rng))
+        pool = SessionPool(tables, args.sessions)
+        slots = pool.start(args.sessions)
+        start = time.perf_counter()
+        steps = 20
+        for _ in range(steps):
+            items = pool.next_items(slots)
+            pool.record(slots, items, rng.random(len(slots)) < 0.6)
+        elapsed = time.perf_counter() - start
+        print(f"{args.sessions} sessions x {steps} questions in {elapsed:.2f}s: "
+              f"{args.sessions * steps / elapsed:,.0f} selections+updates/s")
+
+if __name__ == '__main__':
+    main()
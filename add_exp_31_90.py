@@ -1,7 +1,5 @@
 #!/usr/bin/env python3
-"""Add detailed explanations for Q31-90"""
-import json,os
-SD = os.path.dirname(os.path.abspath(__file__))
+"""Detailed explanations for Q31-90 (rendered by generate_html.py)"""
 D = {}
 D[31]=["❌ جزئياً - إدارة العمليات إحدى الوظائف فقط.","❌ جزئياً - إدارة الذاكرة إحدى الوظائف فقط.","❌ خاطئ. تنفيذ المترجم ليس وظيفة نظام التشغيل بل هو برنامج تطبيقي.","✅ صحيح! إدارة العمليات والذاكرة من وظائف نظام التشغيل (ملاحظة: تنفيذ المترجم ليس وظيفة نظام تشغيل لكن الجواب حسب البنك)."]
 D[32]=["❌ خاطئ. الصَدَفة (Shell) هي واجهة المستخدم وليست الجزء الأساسي.","✅ صحيح! النواة (Kernel) هي الجزء الأساسي في نظام التشغيل وتتحكم بجميع الموارد.","❌ خاطئ. CLI واجهة نصية وليست الجزء الأساسي.","❌ خاطئ. برنامج التعريف يتحكم بجهاز معين فقط."]
@@ -64,27 +62,10 @@ D[88]=["❌ خاطئ. FCFS تنفذ حسب ترتيب الوصول بدون شر
 D[89]=["✅ صحيح! في الجدولة الاستباقية، يمكن مقاطعة العملية الجارية ونقلها لطابور الاستعداد لتنفيذ عملية أخرى ذات أولوية أعلى.","❌ خاطئ. هذا وصف الجدولة غير الاستباقية (Non-preemptive).","❌ خاطئ. الأولوية قابلة للتغيير وليست دائمة.","❌ خاطئ. العملية لا تُمنع من المعالج بل تُقاطع مؤقتاً."]
 D[90]=["❌ خاطئ. Round Robin للأغراض العامة وليس حصرياً للوقت الحقيقي.","❌ خاطئ. SRTF جيدة لتقليل وقت الانتظار لكنها ليست الأنسب لأنظمة الوقت الحقيقي.","✅ صحيح! EDF (أقرب موعد نهائي أولاً) مصممة خصيصاً لأنظمة الوقت الحقيقي حيث تعطي الأولوية للمهام ذات المواعيد الأقرب.","❌ خاطئ. Multilevel Feedback Queue للأغراض العامة."]
 
-with open(os.path.join(SD,'os_quiz.html'),'r',encoding='utf-8') as f: c=f.read()
-for qid,exps in D.items():
-    old_exps = []
-    q = None
-    with open(os.path.join(SD,'questions.json'),'r',encoding='utf-8') as f:
-        qs = json.load(f)
-        q = next((x for x in qs if x['id']==qid),None)
-    if not q: continue
-    ci = next((i for i,o in enumerate(q['options']) if o['correct']),0)
-    ct = q['options'][ci]['text']
-    # Build old generic explanations
-    old_items = []
-    for i,o in enumerate(q['options']):
-        if o['correct']:
-            old_items.append(f"'✅ <b>صحيح.</b> هذا هو الجواب الصحيح حسب بنك الأسئلة.'")
-        else:
-            t = ct.replace("'","\\'")
-            old_items.append(f"'❌ <b>خاطئ.</b> الجواب الصحيح هو: {t}'")
-    old_str = f"{qid}:[" + ",".join(old_items) + "]"
-    new_items = [f"'{e.replace(chr(39),chr(92)+chr(39))}'" for e in exps]
-    new_str = f"{qid}:[" + ",".join(new_items) + "]"
-    c = c.replace(old_str, new_str)
-with open(os.path.join(SD,'os_quiz.html'),'w',encoding='utf-8') as f: f.write(c)
-print(f"Updated {len(D)} questions with detailed explanations (31-90)")
+def main():
+    """Rebuild os_quiz.html, which renders these explanations"""
+    from generate_html import generate
+    generate()
+
+if __name__ == '__main__':
+    main()
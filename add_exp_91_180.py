@@ -1,8 +1,5 @@
 #!/usr/bin/env python3
-"""Replace generic explanations for Q91-180 with detailed Arabic ones."""
-import json, os, re
-
-SD = os.path.dirname(os.path.abspath(__file__))
+"""Detailed Arabic explanations for Q91-180 (rendered by generate_html.py)."""
 
 # Detailed explanations: qid -> list of explanation strings per option
 D = {
@@ -98,71 +95,10 @@ D = {
 180:["✅ صحيح! متصفح الويب يحمّل عدة صفحات بشكل متزامن باستخدام خيوط متعددة.","❌ خاطئ. محرر نصوص يعدل ملفاً واحداً ليس متعدد الخيوط.","❌ خاطئ. DBMS بدون استعلامات متوازية ليس مثالاً.","❌ خاطئ. مترجم ينفذ ملفاً واحداً بالتتابع ليس متعدد الخيوط."],
 }
 
-# Load questions
-with open(os.path.join(SD, 'questions.json'), 'r', encoding='utf-8') as f:
-    qs = json.load(f)
-
-# Read HTML
-with open(os.path.join(SD, 'os_quiz.html'), 'r', encoding='utf-8') as f:
-    content = f.read()
-
-count = 0
-for qid in range(91, 181):
-    exps = D.get(qid)
-    if not exps:
-        continue
-    q = next((x for x in qs if x['id'] == qid), None)
-    if not q:
-        continue
-
-    # Find the correct option index and text
-    ci = next((i for i, o in enumerate(q['options']) if o['correct']), 0)
-    ct = q['options'][ci]['text']
-
-    # Build the OLD generic explanation entries
-    old_items = []
-    for i, o in enumerate(q['options']):
-        if o['correct']:
-            old_items.append('"✅ <b>صحيح.</b> هذا هو الجواب الصحيح حسب بنك الأسئلة."')
-        else:
-            t = ct.replace('"', '\\"')
-            old_items.append(f'"❌ <b>خاطئ.</b> الجواب الصحيح هو: {t}"')
-
-    # Build old string: e.g. 91: [\n  "...",\n  "...",\n]
-    # But we need to match the exact format in the file. Let's use regex.
-    # The format in the file is like:
-    #   91: [
-    #     "✅ <b>صحيح.</b> ...",
-    #     "❌ <b>خاطئ.</b> ...",
-    #   ],
-    
-    # Use regex to find the block for this question ID
-    pattern = rf'(\s+){qid}: \[\s*\n((?:\s+"[^"]*",?\s*\n)+)\s+\]'
-    match = re.search(pattern, content)
-    if not match:
-        # Try alternate pattern without trailing comma issues
-        pattern2 = rf'{qid}: \[([^\]]*)\]'
-        match2 = re.search(pattern2, content)
-        if not match2:
-            print(f"  Q{qid}: pattern not found")
-            continue
-        # Replace the whole block
-        indent = "          "  # typical indentation
-        new_items_str = ",\n".join([f'{indent}  "{e}"' for e in exps])
-        new_block = f"{qid}: [\n{new_items_str},\n{indent}]"
-        old_block = match2.group(0)
-        content = content.replace(old_block, new_block, 1)
-        count += 1
-    else:
-        indent = match.group(1)
-        new_items_str = ",\n".join([f'{indent}  "{e}"' for e in exps])
-        new_block = f"{indent}{qid}: [\n{new_items_str},\n{indent}]"
-        old_block = match.group(0)
-        content = content.replace(old_block, new_block, 1)
-        count += 1
-
-# Write back
-with open(os.path.join(SD, 'os_quiz.html'), 'w', encoding='utf-8') as f:
-    f.write(content)
+def main():
+    """Rebuild os_quiz.html, which renders these explanations"""
+    from generate_html import generate
+    generate()
 
-print(f"Updated {count} questions with detailed explanations (91-180)")
+if __name__ == '__main__':
+    main()
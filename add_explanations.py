@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
-"""Add Arabic explanations and tooltips to os_quiz.html"""
-import json, os, re
+"""Arabic explanations and tooltips of the questions (rendered by generate_html.py)"""
+import json, os
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -287,48 +287,9 @@ def get_all_explanations(questions):
     return result
 
 def main():
-    questions = load_questions()
-    explanations = get_all_explanations(questions)
-    
-    # Read current HTML
-    html_path = os.path.join(SCRIPT_DIR, 'os_quiz.html')
-    with open(html_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Build explanations JS object
-    exp_lines = []
-    for qid, exps in sorted(explanations.items()):
-        exp_strs = []
-        for e in exps:
-            escaped = e.replace('\\','\\\\').replace("'","\\'").replace('\n',' ')
-            exp_strs.append(f"'{escaped}'")
-        exp_lines.append(f"{qid}:[{','.join(exp_strs)}]")
-    
-    exp_js = '{' + ',\n'.join(exp_lines) + '}'
-    
-    # Build tooltips (Arabic translations) JS object
-    tooltip_lines = []
-    for qid, ar in sorted(QAR.items()):
-        escaped = ar.replace('\\','\\\\').replace("'","\\'")
-        tooltip_lines.append(f"{qid}:'{escaped}'")
-    tooltip_js = '{' + ','.join(tooltip_lines) + '}'
-    
-    # Replace the empty EXPLANATIONS object
-    content = content.replace(
-        'const EXPLANATIONS = {};',
-        f'const EXPLANATIONS = {exp_js};'
-    )
-    
-    # Replace the empty getTooltip function
-    content = content.replace(
-        "function getTooltip(q) {\n  // Return Arabic tooltip for question\n  return '';  // Will be populated by enrichment\n}",
-        f"const QAR = {tooltip_js};\nfunction getTooltip(q) {{ return QAR[q.id] || ''; }}"
-    )
-    
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print(f"Updated {html_path} with {len(explanations)} explanations and {len(QAR)} tooltips")
+    """Rebuild os_quiz.html, which renders these explanations"""
+    from generate_html import generate
+    generate()
 
 if __name__ == '__main__':
     main()
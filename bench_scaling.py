@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Scaling benchmark of the bank pipeline on synthetic banks (synth_bank.py).
+
+For each size a scratch copy of the scripts gets a synthetic
+QuestionsBank.txt, and every stage runs in its own child process there, so
+the real bank, reports and pages are never touched and a slow stage can be
+stopped by its timeout. Only the stage itself is timed, not the interpreter
+start or loading questions.json:
+
+  parse         parse_questions on the TCPDF text
+  json          writing questions.json
+  solve         simulate_v3.solve
+  <analysis>    each report of osquiz.ANALYSES
+  html          generate_html.generate (os_quiz.html)
+  data-js       gen_data_js.gen_data (questions_data.js)
+  search-index  search_index.build
+  trainer-spans trainer_spans.build
+
+A stage that times out is skipped at the larger sizes. The results carry
+each stage's scaling exponent, the log-log slope of time over size: about
+1 for a linear stage, 2 for a quadratic one. Exponents don't depend on the
+machine, so they are the main regression check. Times are compared only
+relative to a calibration run (a fixed workload timed on the same machine,
+recorded with the machine in every saved run), so a baseline saved on one
+machine still works on another.
+
+A saved run is the regression baseline, kept to BASELINE_SIZES so that
+--compare, which reruns the baseline's sizes, takes minutes. It fails when
+a stage times out, its exponent grew by more than SLOPE_TOLERANCE, or its
+time at the largest size, relative to the calibration, grew TOLERANCE
+times:
+
+    python bench_scaling.py                              # 1k .. 1M
+    python bench_scaling.py --sizes 1000 10000 --stages parse solve
+    python bench_scaling.py --save bench_baseline.json   # BASELINE_SIZES
+    python bench_scaling.py --compare bench_baseline.json
+"""
+import argparse, glob, json, os, platform, shutil, subprocess, sys, tempfile, time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SIZES = [1000, 10000, 100000, 1000000]
+BASELINE_SIZES = [1000, 3000, 10000, 30000]
+STAGE_TIMEOUT = 900
+TOLERANCE = 1.5
+SLOPE_TOLERANCE = 0.3
+# stages too fast to time reliably are left out of the comparison
+MIN_SECONDS = 0.05
+
+def _analysis(name):
+    def run(questions):
+        import importlib
+        from osquiz import ANALYSES
+        importlib.import_module(ANALYSES[name][0]).main(questions)
+    return run
+
+def _parse(questions):
+    from parse_questions import parse_questions
+    return parse_questions(os.path.join(SCRIPT_DIR, 'QuestionsBank.txt'))
+
+def _json(questions):
+    with open(os.path.join(SCRIPT_DIR, 'questions.json'), 'w', encoding='utf-8') as f:
+        json.dump(questions, f, ensure_ascii=False, indent=2)
+
+def _solve(questions):
+    from simulate_v3 import solve
+    solve(questions)
+
+def _html(questions):
+    from generate_html import generate
+    generate()
+
+def _data_js(questions):
+    from gen_data_js import gen_data
+    gen_data(questions)
+
+def _search_index(questions):
+    from search_index import build
+    build()
+
+def _trainer_spans(questions):
+    from trainer_spans import build
+    build(questions=questions)
+
+def _calibrate(questions):
+    """Fixed reference workload: dict and string work in Python, a NumPy sort"""
+    import numpy as np
+    counts = {}
+    for i in range(300000):
+        word = str(i * 7919 % 10007)
+        counts[word] = counts.get(word, 0) + 1
+    np.sort(np.random.default_rng(0).random(2000000))
+
+def stages():
+    """{name: function(questions)} in run order"""
+    from osquiz import ANALYSES
+    out = {'parse': _parse, 'json': _json, 'solve': _solve}
+    out.update((name, _analysis(name)) for name in ANALYSES)
+    out.update({'html': _html, 'data-js': _data_js, 'search-index': _search_index,
+                'trainer-spans': _trainer_spans})
+    return out
+
+def run_stage(name):
+    """Child process: time one stage in this (scratch) directory; prints JSON"""
+    import contextlib
+    if name in ('parse', 'calibrate'):
+        questions = None
+    elif name == 'json':
+        questions = _parse(None)
+    else:
+        with open(os.path.join(SCRIPT_DIR, 'questions.json'), 'r', encoding='utf-8') as f:
+            questions = json.load(f)
+    with open(os.devnull, 'w') as null, contextlib.redirect_stdout(null):
+        start = time.perf_counter()
+        (_calibrate if name == 'calibrate' else stages()[name])(questions)
+        elapsed = time.perf_counter() - start
+    print(json.dumps({'seconds': elapsed}))
+
+def workspace(size, seed=0):
+    """Scratch directory with copies of the scripts and a synthetic bank"""
+    from synth_bank import load_templates, write_bank
+    work = tempfile.mkdtemp(prefix=f'osquiz_bench_{size}_')
+    for path in glob.glob(os.path.join(SCRIPT_DIR, '*.py')):
+        shutil.copy(path, work)
+    write_bank(os.path.join(work, 'QuestionsBank.txt'), load_templates(), size, seed)
+    return work
+
+def bench(sizes, names=None, timeout=STAGE_TIMEOUT, seed=0, log=print):
+    """{stage: {size: seconds, or None if it timed out}}"""
+    names = list(names or stages())
+    results = {name: {} for name in names}
+    for size in sizes:
+        start = time.perf_counter()
+        work = workspace(size, seed)
+        log(f"{size} questions (bank written in {time.perf_counter() - start:.1f}s)")
+        try:
+            # later stages read the questions.json the json stage writes
+            if 'json' not in names:
+                _child(work, 'json', timeout)
+            for name in names:
+                if None in results[name].values():
+                    continue
+                results[name][size] = seconds = _child(work, name, timeout)
+                log(f"  {name:<16}{'timeout' if seconds is None else f'{seconds:9.3f}s'}")
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+    return results
+
+def _child(work, name, timeout):
+    try:
+        proc = subprocess.run([sys.executable, os.path.join(work, 'bench_scaling.py'), '--stage', name],
+                              cwd=work, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None
+    if proc.returncode:
+        raise RuntimeError(f"stage {name} failed:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])['seconds']
+
+def exponent(times):
+    """Log-log slope of {size: seconds} (None with fewer than two usable sizes)"""
+    import numpy as np
+    points = [(int(n), t) for n, t in times.items() if t is not None and t >= MIN_SECONDS]
+    if len(points) < 2:
+        return None
+    x, y = np.log([p[0] for p in points]), np.log([p[1] for p in points])
+    return round(float(np.polyfit(x, y, 1)[0]), 2)
+
+def calibrate(runs=3):
+    """Best of `runs` timings of the calibration workload on this machine"""
+    return min(_child(SCRIPT_DIR, 'calibrate', STAGE_TIMEOUT) for _ in range(runs))
+
+def record(results, calibration):
+    """A saved run: machine, calibration, times and scaling exponents"""
+    return {'python': platform.python_version(), 'machine': platform.machine(),
+            'processor': platform.processor() or platform.machine(),
+            'cpus': os.cpu_count(),
+            'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'calibration': round(calibration, 4),
+            'results': {name: {str(n): None if t is None else round(t, 4) for n, t in times.items()}
+                        for name, times in results.items()},
+            'exponents': {name: exponent(times) for name, times in results.items()}}
+
+def compare(baseline, current):
+    """Regression messages of a run against a baseline record: exponents, and
+    the time at the largest size in units of each run's calibration (small
+    sizes are too noisy to compare one by one)"""
+    problems = []
+    # baselines without a calibration are compared on exponents only
+    scale = baseline.get('calibration') and current['calibration'] / baseline['calibration']
+    for name, times in current['results'].items():
+        old_times = baseline['results'].get(name, {})
+        both = [n for n, t in times.items() if t is not None and old_times.get(n) is not None]
+        for n, t in times.items():
+            if t is None and old_times.get(n) is not None:
+                problems.append(f"{name} at {n}: timed out (was {old_times[n]:.3f}s)")
+        if scale and both:
+            n = max(both, key=int)
+            t, old = times[n], old_times[n] * scale
+            if max(old, t) >= MIN_SECONDS and t > old * TOLERANCE:
+                problems.append(f"{name} at {n}: {t:.3f}s, {t / old:.1f}x the baseline "
+                                f"{old_times[n]:.3f}s scaled to this machine ({old:.3f}s)")
+        old, new = baseline['exponents'].get(name), current['exponents'].get(name)
+        if old is not None and new is not None and new > old + SLOPE_TOLERANCE:
+            problems.append(f"{name}: scales as n^{new} (was n^{old})")
+    return problems
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time the bank pipeline on synthetic banks.')
+    parser.add_argument('--sizes', type=int, nargs='+', help=f'bank sizes (default {SIZES})')
+    parser.add_argument('--stages', nargs='+', help='stages to time (default: all)')
+    parser.add_argument('--timeout', type=float, default=STAGE_TIMEOUT, help='seconds per stage')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--save', help='write the run as a baseline JSON')
+    parser.add_argument('--compare', help='rerun a baseline\'s sizes and stages and compare')
+    parser.add_argument('--stage', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.stage:
+        return run_stage(args.stage)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    sizes = args.sizes or (sorted({int(n) for t in baseline['results'].values() for n in t})
+                           if baseline else BASELINE_SIZES if args.save else SIZES)
+    names = args.stages or (list(baseline['results']) if baseline else None)
+    unknown = set(names or ()) - set(stages())
+    if unknown:
+        parser.error(f"unknown stage: {', '.join(sorted(unknown))} (one of {', '.join(stages())})")
+
+    calibration = calibrate()
+    print(f"Calibration: {calibration:.3f}s")
+    current = record(bench(sizes, names, args.timeout, args.seed), calibration)
+    print('Scaling exponents: ' + ', '.join(f"{name} n^{e}" for name, e in current['exponents'].items()
+                                            if e is not None))
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=1)
+        print(f"Saved baseline to {args.save}")
+    if baseline:
+        if baseline.get('calibration'):
+            print(f"Baseline times scaled by {calibration / baseline['calibration']:.2f} "
+                  f"(calibration {baseline['calibration']:.3f}s on {baseline['processor']})")
+        problems = compare(baseline, current)
+        for line in problems:
+            print(f"  REGRESSION {line}")
+        print(f"{len(problems)} regressions against {args.compare}")
+        if problems:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
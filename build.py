@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""Incremental build of the generated data files, reports and pages.
+
+Every artifact records a fingerprint of its inputs (data file hashes plus the
+source hash of the scripts that produce it) in .build_state.json. Only stale
+artifacts are rebuilt, independent ones in parallel.
+
+    python build.py              # rebuild what is stale
+    python build.py -n           # dry run: list what would rebuild
+    python build.py -f os_quiz.html
+"""
+import argparse, hashlib, json, os, subprocess, sys
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+STATE_FILE = os.path.join(SCRIPT_DIR, '.build_state.json')
+
+# name -> outputs written, data files read, scripts run (in order). Outputs
+# are always generated files; hand-written docs (خوارزمية_الاختبار.md) and old
+# console logs (answer_key_output.txt) are never listed, so a build cannot
+# overwrite them.
+ARTIFACTS = {
+    'questions.json': {
+        'outputs': ['questions.json'],
+        'inputs': ['QuestionsBank.txt'],
+        'scripts': ['parse_questions.py'],
+    },
+    'questions_data.js': {
+        'outputs': ['questions_data.js'],
+        'inputs': ['questions.json'],
+        'scripts': ['gen_data_js.py'],
+    },
+    'answer_key.md': {
+        'outputs': ['answer_key.md'],
+        'inputs': ['questions.json'],
+        'scripts': ['build_answer_key.py'],
+    },
+    'keyword_deep_analysis.txt': {
+        'outputs': ['keyword_deep_analysis.txt'],
+        'inputs': ['questions.json'],
+        'scripts': ['keyword_deep.py'],
+    },
+    'longest_analysis.txt': {
+        'outputs': ['longest_analysis.txt'],
+        'inputs': ['questions.json'],
+        'scripts': ['longest_analysis.py'],
+    },
+    'priority_analysis.txt': {
+        'outputs': ['priority_analysis.txt'],
+        'inputs': ['questions.json'],
+        'scripts': ['priority_analysis.py'],
+    },
+    'topic_analysis_output.txt': {
+        'outputs': ['topic_analysis_output.txt'],
+        'inputs': ['questions.json'],
+        'scripts': ['topic_analysis.py'],
+    },
+    'pattern_verification.txt': {
+        'outputs': ['pattern_verification.txt'],
+        'inputs': ['questions.json'],
+        'scripts': ['verify_patterns.py'],
+    },
+    'os_quiz.html': {
+        'outputs': ['os_quiz.html'],
+        'inputs': ['questions.json', 'topic_index.py', 'add_explanations.py',
+                   'add_exp_31_90.py', 'add_exp_91_180.py'],
+        'scripts': ['generate_html.py'],
+    },
+    # index.html is hand-edited; only its marked regions are generated
+    'index.html': {
+        'outputs': ['index.html'],
+        'inputs': ['questions.json', 'generate_html.py', 'topic_index.py',
+                   'add_explanations.py', 'add_exp_31_90.py', 'add_exp_91_180.py'],
+        'scripts': ['build_index.py'],
+    },
+    'search_index.js': {
+        'outputs': ['search_index.js'],
+        'inputs': ['questions.json', 'generate_html.py', 'topic_index.py',
+                   'add_explanations.py', 'add_exp_31_90.py', 'add_exp_91_180.py'],
+        'scripts': ['search_index.py'],
+    },
+    'trainer_spans.js': {
+        'outputs': ['trainer_spans.js'],
+        'inputs': ['questions.json', 'generate_html.py', 'simulate_v3.py'],
+        'scripts': ['trainer_spans.py'],
+    },
+    'sw.js': {
+        'outputs': ['sw.js', 'asset-manifest.json'],
+        'inputs': ['index.html', 'algorithm_reference.html', 'algorithm_trainer.html',
+                   'questions_data.js', 'search_index.js', 'trainer_spans.js'],
+        'scripts': ['build_sw.py'],
+    },
+}
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(os.path.join(SCRIPT_DIR, path), 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            h.update(block)
+    return h.hexdigest()
+
+def fingerprint(name):
+    """Hash of every input and script of an artifact, or None if one is missing"""
+    spec = ARTIFACTS[name]
+    h = hashlib.sha256()
+    for path in spec['inputs'] + spec['scripts']:
+        if not os.path.exists(os.path.join(SCRIPT_DIR, path)):
+            return None
+        h.update(path.encode('utf-8') + b'\0' + file_hash(path).encode() + b'\0')
+    return h.hexdigest()
+
+def dependencies(name):
+    """Artifacts whose outputs are inputs of `name`"""
+    inputs = set(ARTIFACTS[name]['inputs'])
+    return [other for other, spec in ARTIFACTS.items()
+            if other != name and inputs & set(spec['outputs'])]
+
+def with_dependencies(targets):
+    """Targets plus everything upstream of them"""
+    seen = set()
+    stack = list(targets)
+    while stack:
+        name = stack.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        stack.extend(dependencies(name))
+    return seen
+
+def load_state():
+    if not os.path.exists(STATE_FILE):
+        return {}
+    with open(STATE_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_state(state):
+    with open(STATE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+def is_stale(name, state):
+    spec = ARTIFACTS[name]
+    if any(not os.path.exists(os.path.join(SCRIPT_DIR, p)) for p in spec['outputs']):
+        return True
+    fp = fingerprint(name)
+    return fp is None or state.get(name) != fp
+
+def run_artifact(name):
+    """Run the scripts of one artifact; returns (ok, log)"""
+    spec = ARTIFACTS[name]
+    env = dict(os.environ, PYTHONIOENCODING='utf-8')
+    log = []
+    for script in spec['scripts']:
+        proc = subprocess.run([sys.executable, script], cwd=SCRIPT_DIR, env=env,
+                              capture_output=True, text=True, encoding='utf-8')
+        log.append(proc.stdout)
+        if proc.returncode != 0:
+            log.append(proc.stderr)
+            return False, ''.join(log)
+    return True, ''.join(log)
+
+def plan(targets, state, force=False):
+    """Artifacts that would rebuild, assuming a rebuilt input always changes"""
+    order = topo_order(targets)
+    rebuild = []
+    for name in order:
+        if force or is_stale(name, state) or any(d in rebuild for d in dependencies(name)):
+            rebuild.append(name)
+    return rebuild
+
+def topo_order(names):
+    names = set(names)
+    order, done = [], set()
+    def visit(name):
+        if name in done:
+            return
+        done.add(name)
+        for dep in dependencies(name):
+            if dep in names:
+                visit(dep)
+        order.append(name)
+    for name in sorted(names):
+        visit(name)
+    return order
+
+def build(targets=None, jobs=None, force=False, dry_run=False, verbose=False):
+    """Rebuild stale artifacts; returns the list of names that were (or would be) rebuilt"""
+    targets = with_dependencies(targets or ARTIFACTS)
+    state = load_state()
+
+    if dry_run:
+        return plan(targets, state, force)
+
+    pending = set(targets)
+    finished, rebuilt, failed = set(), [], []
+    running = {}
+
+    def ready(name):
+        return all(d in finished for d in dependencies(name) if d in targets)
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        while pending or running:
+            for name in sorted(pending):
+                if not ready(name):
+                    continue
+                pending.discard(name)
+                if any(d in failed for d in dependencies(name)):
+                    failed.append(name)
+                    finished.add(name)
+                    print(f"  skip  {name} (dependency failed)")
+                    continue
+                if not force and not is_stale(name, state):
+                    finished.add(name)
+                    continue
+                print(f"  build {name}")
+                running[pool.submit(run_artifact, name)] = name
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                ok, log = future.result()
+                finished.add(name)
+                if ok:
+                    rebuilt.append(name)
+                    state[name] = fingerprint(name)
+                    save_state(state)
+                else:
+                    failed.append(name)
+                    print(f"  FAILED {name}\n{log}")
+                if ok and verbose and log.strip():
+                    print(log.rstrip())
+
+    if failed:
+        raise SystemExit(f"{len(failed)} artifact(s) failed: {', '.join(failed)}")
+    return rebuilt
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Rebuild stale generated files.')
+    parser.add_argument('targets', nargs='*', help='artifacts to build (default: all)')
+    parser.add_argument('-n', '--dry-run', action='store_true', help='list what would rebuild')
+    parser.add_argument('-f', '--force', action='store_true', help='rebuild even if up to date')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='parallel builds')
+    parser.add_argument('-v', '--verbose', action='store_true', help='show script output')
+    parser.add_argument('--list', action='store_true', help='list artifacts and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, spec in ARTIFACTS.items():
+            deps = ', '.join(dependencies(name)) or '-'
+            print(f"{name:28} <- {', '.join(spec['scripts'])} (after: {deps})")
+        return
+
+    unknown = [t for t in args.targets if t not in ARTIFACTS]
+    if unknown:
+        parser.error(f"unknown artifact(s): {', '.join(unknown)}")
+
+    names = build(args.targets, jobs=args.jobs, force=args.force,
+                  dry_run=args.dry_run, verbose=args.verbose)
+    if args.dry_run:
+        if names:
+            print("Would rebuild:")
+            for name in names:
+                print(f"  {name}")
+        else:
+            print("Everything is up to date")
+    else:
+        print(f"Rebuilt {len(names)} artifact(s)" if names else "Everything is up to date")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Build-time parts of index.html.
+
+index.html is edited by hand, but the regions between <!-- name:start --> and
+<!-- name:end --> markers are generated here from questions.json, TOPIC_MAP
+and the explanation scripts, so the page's data and its pre-rendered markup
+always come from the same bank:
+
+  data          the QUESTIONS list ({id, q, topic, opts: [{t, c}]}, one
+                question per line) the page grades against, and the QAR
+                Arabic tooltips
+  cards         markup of the first PRERENDER q-cards inside
+                #questionsContainer, so the first paint needs no JS and does
+                not grow with the bank; the virtual list adopts these nodes
+                instead of recreating them
+  explanations  EXPLANATION_CHUNKS, the [first id, last id, file] list of the
+                explanation chunks written to explanations/ (EXP_CHUNK
+                questions each, content-hashed names); the page loads a
+                chunk only when one of its questions shows its explanation
+
+    python build_index.py
+"""
+import glob, html, json, os, re
+
+from generate_html import (TOPIC_INDEX, load_questions, load_explanations, write_if_changed,
+                           content_hash)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_PATH = os.path.join(SCRIPT_DIR, 'index.html')
+EXP_DIR = os.path.join(SCRIPT_DIR, 'explanations')
+
+# enough cards to fill a tall screen before the virtual list takes over
+PRERENDER = 24
+# questions per explanation chunk
+EXP_CHUNK = 30
+
+LETTERS = ['A', 'B', 'C', 'D']
+COLORS = ['red', 'yellow', 'green', 'blue']
+
+def escape(text):
+    # same as the page's escapeHtml (textContent -> innerHTML)
+    return html.escape(text, quote=False)
+
+def escape_attr(text):
+    # attribute values: quotes too (the page's escapeAttr)
+    return html.escape(text, quote=True)
+
+def render_card(q, topic, tooltip):
+    """Markup of an unanswered, unbookmarked card, as renderQuestions builds it"""
+    qid = q['id']
+    menu = ''.join(
+        f'<button class="bm-color-btn " style="background:var(--bookmark-{c})" '
+        f'onclick="toggleBookmark({qid},\'{c}\')"></button>' for c in COLORS)
+    opts = ''.join(
+        f'<button class="opt-btn" onclick="selectAnswer({qid},{i})" >'
+        f'<span class="opt-letter">{LETTERS[i] if i < len(LETTERS) else i + 1}</span>'
+        f'<span class="en">{escape(o["text"])}</span></button>'
+        for i, o in enumerate(q['options']))
+    return (
+        f'<div class="q-card" id="q-{qid}" data-qid="{qid}">'
+        f'<div class="q-header"><span class="q-number">{qid}</span>'
+        f'<div class="q-text"><span class="en" data-tooltip="{escape_attr(tooltip)}">{escape(q["text"])}</span></div>'
+        f'<div class="q-actions"><button class="btn" onclick="openBmMenu({qid})">🔖</button>'
+        f'<div class="bm-menu" id="bm-menu-{qid}">{menu}'
+        f'<button class="btn" style="font-size:.7rem;margin-top:4px" onclick="renameBmPrompt(event)">✏️ تسمية</button>'
+        f'</div></div></div>'
+        f'<div class="q-topic" style="font-size:.75rem;color:var(--text3);margin-bottom:10px">📁 {topic}</div>'
+        f'<div class="opts">{opts}</div></div>')
+
+def _js(value):
+    # JSON inside a <script>: "</" would end the element
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+
+def render_data(questions, tooltips):
+    """The QUESTIONS and QAR script the rest of the page reads"""
+    lines = ['    <script>', '      const QUESTIONS = [']
+    for q in questions:
+        lines.append('        ' + _js({'id': q['id'], 'q': q['text'],
+                                       'topic': TOPIC_INDEX.primary(q['id']),
+                                       'opts': [{'t': o['text'], 'c': o['correct']}
+                                                for o in q['options']]}) + ',')
+    lines += ['      ];', '      const QAR = {']
+    lines += [f'        {qid}: {_js(text)},' for qid, text in sorted(tooltips.items())]
+    lines += ['      };', '    </script>']
+    return '\n'.join(lines)
+
+def render_cards(questions, tooltips, count=PRERENDER):
+    return '\n'.join(render_card(q, TOPIC_INDEX.primary(q['id']), tooltips.get(q['id'], ''))
+                     for q in questions[:count])
+
+def write_explanation_chunks(questions, explanations, size=EXP_CHUNK):
+    """Write explanations/q<first>-<last>.<hash>.js, drop stale chunks;
+    returns [[first id, last id, relative path]]"""
+    os.makedirs(EXP_DIR, exist_ok=True)
+    ids = sorted(q['id'] for q in questions if explanations.get(q['id']))
+    chunks, keep = [], set()
+    for start in range(0, len(ids), size):
+        part = ids[start:start + size]
+        data = {qid: explanations[qid] for qid in part}
+        text = ('explanationChunk('
+                + json.dumps(data, ensure_ascii=False, separators=(',', ':')) + ');\n')
+        name = f'q{part[0]}-{part[-1]}.{content_hash(text)[:10]}.js'
+        write_if_changed(os.path.join(EXP_DIR, name), text)
+        keep.add(name)
+        chunks.append([part[0], part[-1], f'explanations/{name}'])
+    for path in glob.glob(os.path.join(EXP_DIR, 'q*-*.*.js')):
+        if os.path.basename(path) not in keep:
+            os.remove(path)
+    return chunks
+
+def render_chunk_list(chunks):
+    return ('    <script>\n'
+            f'      const EXPLANATION_CHUNKS = {json.dumps(chunks)};\n'
+            '    </script>')
+
+def replace_region(content, name, body):
+    """Replace the text between the <!-- name:start/end --> markers"""
+    pattern = re.compile(rf'(<!-- {name}:start -->).*?(<!-- {name}:end -->)', re.S)
+    if not pattern.search(content):
+        raise ValueError(f"index.html has no {name} markers")
+    return pattern.sub(lambda m: m.group(1) + '\n' + body + '\n' + m.group(2), content, count=1)
+
+def build(path=INDEX_PATH):
+    """Regenerate the marked regions of index.html; returns True if it changed"""
+    questions = load_questions()
+    explanations, tooltips = load_explanations(questions)
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    content = replace_region(content, 'data', render_data(questions, tooltips))
+    content = replace_region(content, 'cards', render_cards(questions, tooltips))
+    chunks = write_explanation_chunks(questions, explanations)
+    content = replace_region(content, 'explanations', render_chunk_list(chunks))
+    return write_if_changed(path, content)
+
+def main():
+    changed = build()
+    print(f"{'Updated' if changed else 'Unchanged'} {INDEX_PATH}")
+
+if __name__ == '__main__':
+    main()
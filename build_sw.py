@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Service worker and asset manifest for offline use of the quiz pages.
+
+asset-manifest.json maps every precached URL (the HTML shells, the data
+scripts and the explanation chunks of explanations/) to a hash of its content, and sw.js embeds the same map, so any
+content change is also a byte change of sw.js and the browser installs the
+new worker. The worker caches each file under "<url>?v=<hash>":
+
+  * install downloads only the entries whose hash it does not hold yet, so
+    after a bank update just the changed chunks are fetched
+  * precached URLs are answered from the cache; the browser revalidates
+    sw.js in the background, so a repeat visit loads fully from cache and
+    picks up the new version on the next one (stale-while-revalidate)
+  * everything else of the same origin, and the Google Fonts CSS and font
+    files, go through a runtime cache, also stale-while-revalidate, so the
+    fonts work offline after the first visit. Only ok responses are
+    cached, so the pages load the font stylesheet with crossorigin (CORS,
+    not opaque)
+
+    python build_sw.py
+"""
+import glob, hashlib, json, os
+
+from generate_html import write_if_changed
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SW_PATH = os.path.join(SCRIPT_DIR, 'sw.js')
+MANIFEST_PATH = os.path.join(SCRIPT_DIR, 'asset-manifest.json')
+HASH_LEN = 10
+
+# the app shells and the data scripts they load, relative to the site root
+PRECACHE = [
+    'index.html',
+    'algorithm_reference.html',
+    'algorithm_trainer.html',
+    'questions_data.js',
+    'search_index.js',
+    'trainer_spans.js',
+]
+
+# content-hashed explanation chunks written by build_index.py
+PRECACHE_GLOBS = ['explanations/*.js']
+
+FONT_HOSTS = ['fonts.googleapis.com', 'fonts.gstatic.com']
+
+SW_TEMPLATE = '''// Generated by build_sw.py - do not edit
+const PRECACHE = {manifest};
+const FONT_HOSTS = {font_hosts};
+const CACHE = "os-quiz-precache";
+const RUNTIME = "os-quiz-runtime";
+const SCOPE = new URL(self.registration.scope).pathname;
+
+const versioned = (url) => url + "?v=" + PRECACHE[url];
+
+self.addEventListener("install", (event) => {{
+  event.waitUntil(
+    (async () => {{
+      const cache = await caches.open(CACHE);
+      await Promise.all(
+        Object.keys(PRECACHE).map(async (url) => {{
+          if (await cache.match(versioned(url))) return; // unchanged
+          const res = await fetch(url, {{ cache: "no-cache" }});
+          if (!res.ok) throw new Error(url + ": " + res.status);
+          await cache.put(versioned(url), res);
+        }})
+      );
+      await self.skipWaiting();
+    }})()
+  );
+}});
+
+self.addEventListener("activate", (event) => {{
+  event.waitUntil(
+    (async () => {{
+      const cache = await caches.open(CACHE);
+      const keep = new Set(
+        Object.keys(PRECACHE).map((url) => new URL(versioned(url), location).href)
+      );
+      for (const req of await cache.keys()) {{
+        if (!keep.has(req.url)) await cache.delete(req);
+      }}
+      await self.clients.claim();
+    }})()
+  );
+}});
+
+self.addEventListener("fetch", (event) => {{
+  const req = event.request;
+  if (req.method !== "GET") return;
+  const url = new URL(req.url);
+  if (url.origin === location.origin && url.pathname.startsWith(SCOPE)) {{
+    const path = url.pathname.slice(SCOPE.length) || "index.html";
+    if (path in PRECACHE) {{
+      event.respondWith(
+        caches
+          .open(CACHE)
+          .then((cache) => cache.match(versioned(path)))
+          .then((res) => res || fetch(req))
+      );
+      return;
+    }}
+  }}
+  if (url.origin === location.origin || FONT_HOSTS.includes(url.host)) {{
+    event.respondWith(staleWhileRevalidate(event, req));
+  }}
+}});
+
+async function staleWhileRevalidate(event, req) {{
+  const cache = await caches.open(RUNTIME);
+  const cached = await cache.match(req);
+  const network = fetch(req).then((res) => {{
+    if (res.ok) cache.put(req, res.clone());
+    return res;
+  }});
+  if (!cached) return network;
+  event.waitUntil(network.catch(() => {{}}));
+  return cached;
+}}
+'''
+
+def content_hash(path):
+    with open(os.path.join(SCRIPT_DIR, path), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:HASH_LEN]
+
+def precache_paths():
+    paths = list(PRECACHE)
+    for pattern in PRECACHE_GLOBS:
+        paths += sorted(os.path.relpath(p, SCRIPT_DIR).replace(os.sep, '/')
+                        for p in glob.glob(os.path.join(SCRIPT_DIR, pattern)))
+    return paths
+
+def manifest(paths=None):
+    """{url: content hash} of the precached files that exist"""
+    if paths is None:
+        paths = precache_paths()
+    return {p: content_hash(p) for p in paths if os.path.exists(os.path.join(SCRIPT_DIR, p))}
+
+def build():
+    """Write sw.js and asset-manifest.json; returns True if either changed"""
+    entries = manifest()
+    text = json.dumps(entries, indent=2) + '\n'
+    changed = write_if_changed(MANIFEST_PATH, text)
+    sw = SW_TEMPLATE.format(manifest=json.dumps(entries), font_hosts=json.dumps(FONT_HOSTS))
+    return write_if_changed(SW_PATH, sw) or changed
+
+def main():
+    changed = build()
+    print(f"{'Updated' if changed else 'Unchanged'} {SW_PATH} ({len(manifest())} precached files)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""Vectorized bulk grading of submission files.
+
+A submission file has one row per answer: student, question ID, chosen
+option index (0-based, the order of questions.json). CSV needs a header
+naming the columns (student, qid or question, answer or chosen); JSONL uses
+the same keys. Rows are graded as given, a repeated answer counts twice;
+malformed rows and unknown question IDs are skipped and counted.
+
+The answer key is a NumPy array indexed by question ID (quiz_server's
+answer_key) and the topics of each question (TOPIC_INDEX.topics_of) are a
+row of a question x topic boolean matrix, so a chunk of rows is graded with
+one gather and one compare, and per-student and per-topic totals are bincounts over
+student * topics + topic. Rows are read CHUNK at a time; memory grows with
+the number of students and wrong answers, not with the file:
+
+    python bulk_grader.py submissions.csv                # summary
+    python bulk_grader.py submissions.jsonl -o scores.csv
+    python bulk_grader.py submissions.csv -o scores.json
+"""
+import argparse, csv, itertools, json, operator, os
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CHUNK = 1 << 16
+# wrong (student, qid) pairs collected before they are deduplicated
+WRONG_COMPACT = 1 << 20
+
+STUDENT_KEYS = ('student',)
+QID_KEYS = ('qid', 'question', 'question_id')
+ANSWER_KEYS = ('answer', 'chosen', 'choice')
+
+def _column(names, keys, path):
+    for key in keys:
+        if key in names:
+            return key
+    raise ValueError(f"{path}: no {keys[0]!r} column (have {', '.join(names)})")
+
+def _json_rows(f):
+    """Parsed JSONL lines, None for a line that is not valid JSON"""
+    for line in f:
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except ValueError:
+                yield None
+
+class SubmissionRows:
+    """Iterable of (students, qids, answers) chunks of up to `chunk` rows of a
+    submission file, question IDs and answers as int64 arrays. A malformed row
+    (short, a blank or non-numeric ID or answer, bad JSON) is left out and
+    counted in `bad`, so one bad line doesn't stop a long run"""
+
+    def __init__(self, path, chunk=CHUNK):
+        self.path, self.chunk = path, chunk
+        self.bad = 0
+
+    def __iter__(self):
+        path = self.path
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            if path.endswith(('.jsonl', '.ndjson')):
+                rows = _json_rows(f)
+                first = None
+                for first in rows:
+                    if isinstance(first, dict):
+                        break
+                    self.bad += 1
+                else:
+                    return
+                cols = [_column(first, keys, path) for keys in (STUDENT_KEYS, QID_KEYS, ANSWER_KEYS)]
+                rows = itertools.chain([first], rows)
+            else:
+                rows = csv.reader(f)
+                header = [h.strip().lower() for h in next(rows, [])]
+                cols = [header.index(_column(header, keys, path))
+                        for keys in (STUDENT_KEYS, QID_KEYS, ANSWER_KEYS)]
+            pick = operator.itemgetter(*cols)
+            while True:
+                block = [r for r in itertools.islice(rows, self.chunk) if r != []]
+                if not block:
+                    return
+                try:
+                    students, qids, answers = zip(*map(pick, block))
+                    qids = np.asarray(qids, dtype=np.int64)
+                    answers = np.asarray(answers, dtype=np.int64)
+                except (LookupError, TypeError, ValueError):
+                    students, qids, answers = self._parse(block, pick)
+                if len(qids):
+                    yield students, qids, answers
+
+    def _parse(self, block, pick):
+        """Row by row conversion of a chunk that has malformed rows"""
+        students, qids, answers = [], [], []
+        for r in block:
+            try:
+                student, qid, answer = pick(r)
+                qid, answer = int(qid), int(answer)
+            except (LookupError, TypeError, ValueError):
+                self.bad += 1
+                continue
+            students.append(student)
+            qids.append(qid)
+            answers.append(answer)
+        return (tuple(students), np.array(qids, dtype=np.int64),
+                np.array(answers, dtype=np.int64))
+
+def read_rows(path, chunk=CHUNK):
+    """SubmissionRows of a file: iterate for (students, qids, answers) chunks"""
+    return SubmissionRows(path, chunk)
+
+class BulkGrader:
+    def __init__(self, questions, topic_index):
+        from quiz_server import answer_key
+        self.key = np.frombuffer(answer_key(questions), dtype=np.int8).astype(np.int16)
+        self.topics = topic_index.topics
+        # [qid, topic] -> the question is in the topic; topics_of, so a
+        # question no topic lists counts for the default like everywhere else
+        self.in_topic = np.zeros((len(self.key), len(self.topics)), dtype=bool)
+        column = {t: i for i, t in enumerate(self.topics)}
+        for qid in np.flatnonzero(self.key >= 0).tolist():
+            self.in_topic[qid, [column[t] for t in topic_index.topics_of(qid)]] = True
+        self.codes = {}          # student -> row of the totals
+        self.answered = np.zeros(0, dtype=np.int64)
+        self.correct = np.zeros(0, dtype=np.int64)
+        self.topic_answered = np.zeros((0, len(self.topics)), dtype=np.int64)
+        self.topic_correct = np.zeros((0, len(self.topics)), dtype=np.int64)
+        self._wrong = []         # student << 32 | qid of wrong answers, per chunk
+        self._pending = 0        # pairs added since the last compaction
+        self.rows = self.skipped = 0
+
+    def _student_codes(self, students):
+        codes = self.codes
+        out = np.fromiter((codes.setdefault(str(s), len(codes)) for s in students),
+                          dtype=np.int64, count=len(students))
+        n = len(codes)
+        if n > len(self.answered):
+            grow = max(n, 2 * len(self.answered))
+            for name in ('answered', 'correct', 'topic_answered', 'topic_correct'):
+                old = getattr(self, name)
+                new = np.zeros((grow,) + old.shape[1:], dtype=old.dtype)
+                new[:len(old)] = old
+                setattr(self, name, new)
+        return out
+
+    def grade_chunk(self, students, qids, answers):
+        qids = np.asarray(qids, dtype=np.int64)
+        answers = np.asarray(answers, dtype=np.int64)
+        codes = self._student_codes(students)
+        self.rows += len(qids)
+        # unknown question IDs are skipped, not counted wrong
+        valid = (qids >= 0) & (qids < len(self.key))
+        valid[valid] = self.key[qids[valid]] >= 0
+        if not valid.all():
+            self.skipped += int((~valid).sum())
+            qids, answers, codes = qids[valid], answers[valid], codes[valid]
+        ok = self.key[qids] == answers
+
+        size = len(self.answered)
+        self.answered += np.bincount(codes, minlength=size)
+        self.correct += np.bincount(codes, weights=ok, minlength=size).astype(np.int64)
+
+        t = len(self.topics)
+        rows, topics = np.nonzero(self.in_topic[qids])
+        flat = codes[rows] * t + topics
+        self.topic_answered += np.bincount(flat, minlength=size * t).reshape(size, t)
+        self.topic_correct += np.bincount(flat, weights=ok[rows],
+                                          minlength=size * t).reshape(size, t).astype(np.int64)
+
+        wrong = ~ok
+        self._wrong.append(codes[wrong] << 32 | qids[wrong])
+        self._pending += int(wrong.sum())
+        if self._pending > WRONG_COMPACT:
+            self._compact_wrong()
+
+    def _compact_wrong(self):
+        """Merge the wrong-answer chunks into one sorted array of unique
+        student << 32 | qid pairs, so they are bounded by students x questions"""
+        self._wrong = [np.unique(np.concatenate(self._wrong))] if self._wrong else []
+        self._pending = 0
+
+    def grade_file(self, path, chunk=CHUNK):
+        rows = read_rows(path, chunk)
+        for students, qids, answers in rows:
+            self.grade_chunk(students, qids, answers)
+        self.rows += rows.bad
+        self.skipped += rows.bad
+        return self
+
+    def wrong_ids(self):
+        """List per student row of the sorted distinct question IDs answered wrong"""
+        self._compact_wrong()
+        pairs = self._wrong[0] if self._wrong else np.zeros(0, dtype=np.int64)
+        codes, qids = pairs >> 32, (pairs & 0xFFFFFFFF).astype(np.int32)
+        bounds = np.searchsorted(codes, np.arange(len(self.codes) + 1))
+        return [qids[bounds[i]:bounds[i + 1]] for i in range(len(self.codes))]
+
+    def results(self):
+        """[{student, answered, correct, score, topics: {topic: [correct, answered]}, wrong}]"""
+        wrong = self.wrong_ids()
+        out = []
+        for student, i in self.codes.items():
+            answered = int(self.answered[i])
+            out.append({
+                'student': student,
+                'answered': answered,
+                'correct': int(self.correct[i]),
+                'score': round(100 * int(self.correct[i]) / answered, 1) if answered else 0.0,
+                'topics': {topic: [int(self.topic_correct[i, t]), int(self.topic_answered[i, t])]
+                           for t, topic in enumerate(self.topics) if self.topic_answered[i, t]},
+                'wrong': wrong[i].tolist(),
+            })
+        return out
+
+def write_csv(path, grader):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(['student', 'answered', 'correct', 'score']
+                   + [f'{t} ({c})' for t in grader.topics for c in ('correct', 'answered')]
+                   + ['wrong'])
+        for r in grader.results():
+            w.writerow([r['student'], r['answered'], r['correct'], r['score']]
+                       + [n for t in grader.topics for n in r['topics'].get(t, [0, 0])]
+                       + [' '.join(map(str, r['wrong']))])
+
+def grade(path, output=None, questions=None, chunk=CHUNK):
+    """Grade a submission file; writes CSV or JSON when `output` is given"""
+    from generate_html import TOPIC_INDEX
+    if questions is None:
+        with open(os.path.join(SCRIPT_DIR, 'questions.json'), 'r', encoding='utf-8') as f:
+            questions = json.load(f)
+    grader = BulkGrader(questions, TOPIC_INDEX).grade_file(path, chunk)
+    if output and output.endswith('.json'):
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(grader.results(), f, ensure_ascii=False, indent=1)
+    elif output:
+        write_csv(output, grader)
+    return grader
+
+def main(argv=None):
+    import time
+    parser = argparse.ArgumentParser(description='Grade CSV/JSONL submission files.')
+    parser.add_argument('submissions')
+    parser.add_argument('-o', '--output', help='per-student report (.csv or .json)')
+    parser.add_argument('--chunk', type=int, default=CHUNK, help='rows graded per batch')
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    grader = grade(args.submissions, args.output, chunk=args.chunk)
+    elapsed = time.perf_counter() - start
+    n = len(grader.codes)
+    answered = int(grader.answered[:n].sum())
+    correct = int(grader.correct[:n].sum())
+    print(f"Graded {grader.rows} rows for {n} students in {elapsed:.2f}s "
+          f"({grader.rows / max(elapsed, 1e-9):,.0f} rows/s)")
+    if grader.skipped:
+        print(f"  skipped {grader.skipped} malformed rows or rows with unknown question IDs")
+    print(f"  {correct}/{answered} correct = {100 * correct / max(answered, 1):.1f}%")
+    totals_c = grader.topic_correct[:n].sum(axis=0)
+    totals_a = grader.topic_answered[:n].sum(axis=0)
+    for t, topic in enumerate(grader.topics):
+        if totals_a[t]:
+            print(f"  {topic}: {totals_c[t]}/{totals_a[t]} = {100 * totals_c[t] / totals_a[t]:.1f}%")
+    if args.output:
+        print(f"Saved to {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""Stratified exam sampler: draws exams that meet topic, type and difficulty quotas.
+
+Every question falls in exactly one stratum (its set of topics, type,
+difficulty), and each stratum keeps its question IDs in a NumPy array. A
+question counts toward every topic of TOPIC_INDEX.topics_of, not just the
+primary one, so topic quotas may overlap (a Basics question also labelled
+I/O counts for both); type and difficulty are one per question.
+Types are 'tf' (two options), 'not' (NOT/EXCEPT questions), 'all-of' (an
+"all of the mentioned/above" option) and 'mcq'. Difficulty comes from a
+{qid: level} map, by default the answer algorithm's verdict: 'easy' when it
+is certain and right, 'medium' when probable and right, 'hard' otherwise.
+
+Constraints are a dict (or JSON file) of exact counts or [min, max] bounds,
+None for an open end; topics are resolved like TOPIC_INDEX.query names:
+
+    {"size": 30,
+     "topic": {"Deadlock": 5, "Memory": [8, 12]},
+     "type": {"tf": [0, 2], "not": [1, null]},
+     "difficulty": {"hard": [5, null]}}
+
+A plan (how many questions from each stratum) is a randomized greedy fill
+that covers the minimums first and never passes a maximum. A cohort reuses
+a pool of plans, and each stratum hands out its questions from a shuffled
+cursor, so a draw is O(exam size) and question exposure stays even across
+the cohort:
+
+    python exam_sampler.py constraints.json -n 500 -o exams.json
+    python exam_sampler.py --bench 10000
+"""
+import argparse, json, os, re, time
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+TYPES = ['tf', 'not', 'all-of', 'mcq']
+LEVELS = ['easy', 'medium', 'hard']
+DIMENSIONS = ['topic', 'type', 'difficulty']
+# dimensions with exactly one value per question; their counts add up to the size
+EXCLUSIVE = ['type', 'difficulty']
+# distinct plans computed for a cohort; exams beyond that reuse them
+PLAN_POOL = 256
+PLAN_TRIES = 50
+
+_NOT = re.compile(r'\b(not|except)\b', re.I)
+_ALL_OF = re.compile(r'\ball of the (mentioned|above)\b', re.I)
+
+def question_type(q):
+    if len(q['options']) == 2:
+        return 'tf'
+    if _NOT.search(q['text']):
+        return 'not'
+    if any(_ALL_OF.search(o['text']) for o in q['options']):
+        return 'all-of'
+    return 'mcq'
+
+def solver_difficulty(questions):
+    """{qid: level} from the answer algorithm's confidence and correctness"""
+    from simulate_v3 import solve
+    levels = {}
+    for qid, ok, conf, _ in solve(questions):
+        levels[qid] = 'easy' if ok and conf == 'certain' else 'medium' if ok and conf == 'probable' else 'hard'
+    return levels
+
+class ExamSampler:
+    def __init__(self, questions, topic_index, difficulty=None, seed=None):
+        if difficulty is None:
+            difficulty = solver_difficulty(questions)
+        self.topic_index = topic_index
+        self.topics = list(topic_index.topics)
+        if topic_index.default and topic_index.default not in self.topics:
+            self.topics.append(topic_index.default)
+        self.values = {'topic': self.topics, 'type': TYPES, 'difficulty': LEVELS}
+        self.rng = np.random.default_rng(seed)
+
+        members = {}
+        for q in questions:
+            key = (tuple(self.topics.index(t) for t in topic_index.topics_of(q['id'])),
+                   TYPES.index(question_type(q)),
+                   LEVELS.index(difficulty.get(q['id'], 'medium')))
+            members.setdefault(key, []).append(q['id'])
+        self.strata = sorted(members)
+        self.ids = [np.array(members[key], dtype=np.int64) for key in self.strata]
+        self.sizes = np.array([len(ids) for ids in self.ids], dtype=np.int64)
+        # groups are the values of all dimensions, numbered across dimensions
+        self.slices, start = {}, 0
+        for d in DIMENSIONS:
+            self.slices[d] = slice(start, start + len(self.values[d]))
+            start += len(self.values[d])
+        self.n_groups = start
+        # [stratum, group] -> the stratum's questions count toward the group
+        self.member = np.zeros((len(self.strata), self.n_groups), dtype=bool)
+        for s, (topics, qtype, level) in enumerate(self.strata):
+            self.member[s, list(topics)] = True
+            self.member[s, self.slices['type'].start + qtype] = True
+            self.member[s, self.slices['difficulty'].start + level] = True
+        # per stratum: shuffled question order and the next position to hand out
+        self._order = [self.rng.permutation(ids) for ids in self.ids]
+        self._cursor = np.zeros(len(self.ids), dtype=np.int64)
+
+    def _named(self, totals):
+        """{dimension: {value: count}} of an array over groups, zeros left out"""
+        return {d: {name: int(n) for name, n in zip(self.values[d], totals[self.slices[d]]) if n}
+                for d in DIMENSIONS}
+
+    def counts(self):
+        """{dimension: {value: questions}} of the bank"""
+        return self._named(self.sizes @ self.member)
+
+    def bounds(self, constraints):
+        """(size, lo, hi) arrays over all groups from a constraints dict"""
+        size = int(constraints['size'])
+        lo = np.zeros(self.n_groups, dtype=np.int64)
+        hi = np.full(self.n_groups, size, dtype=np.int64)
+        for d in DIMENSIONS:
+            for name, bound in (constraints.get(d) or {}).items():
+                if d == 'topic':
+                    name = self.topic_index.resolve(name)
+                if name not in self.values[d]:
+                    raise KeyError(f"unknown {d}: {name!r} (one of {', '.join(self.values[d])})")
+                g = self.slices[d].start + self.values[d].index(name)
+                low, high = (bound, bound) if isinstance(bound, int) else bound
+                lo[g] = low or 0
+                hi[g] = size if high is None else high
+        if (lo > hi).any():
+            raise ValueError("a minimum exceeds its maximum")
+        available = self.sizes @ self.member
+        for g in np.flatnonzero(lo > available):
+            d = next(d for d in DIMENSIONS if self.slices[d].start <= g < self.slices[d].stop)
+            name = self.values[d][g - self.slices[d].start]
+            raise ValueError(f"{d} {name!r}: minimum {lo[g]} but the bank has {available[g]}")
+        for d in DIMENSIONS:
+            # every question has at least one topic, exactly one type and level
+            if hi[self.slices[d]].sum() < size or (d in EXCLUSIVE and lo[self.slices[d]].sum() > size):
+                raise ValueError(f"the {d} quotas cannot add up to {size} questions")
+        return size, lo, hi
+
+    def plan(self, constraints):
+        """Questions to take from each stratum, as an array over self.strata"""
+        size, lo, hi = self.bounds(constraints)
+        if size > self.sizes.sum():
+            raise ValueError(f"exam of {size} from a bank of {self.sizes.sum()}")
+        for _ in range(PLAN_TRIES):
+            plan = self._try_plan(size, lo, hi)
+            if plan is not None:
+                return plan
+        raise ValueError("constraints could not be met; check that the quotas are feasible")
+
+    def _try_plan(self, size, lo, hi):
+        take = np.zeros(len(self.sizes), dtype=np.int64)
+        used = np.zeros(self.n_groups, dtype=np.int64)
+        member = self.member
+        for filled in range(size):
+            open_ = (take < self.sizes) & ~member[:, used >= hi].any(axis=1)
+            short = (used < lo)
+            if short.any():
+                # only strata covering the most unmet minimums are candidates
+                cover = member[:, short].sum(axis=1)
+                best = cover[open_].max(initial=0)
+                if best == 0:
+                    return None
+                open_ &= cover == best
+            elif not open_.any():
+                return None
+            weights = np.where(open_, self.sizes - take, 0).astype(float)
+            s = self.rng.choice(len(weights), p=weights / weights.sum())
+            take[s] += 1
+            used += member[s]
+            left = size - filled - 1
+            deficit = np.maximum(lo - used, 0)
+            if deficit.max(initial=0) > left:
+                return None
+            if any(deficit[self.slices[d]].sum() > left for d in EXCLUSIVE):
+                return None
+        return take
+
+    def draw(self, plan):
+        """Question IDs of one exam following `plan`, from the stratum cursors"""
+        out = []
+        for s in np.flatnonzero(plan):
+            k, order, pos = int(plan[s]), self._order[s], int(self._cursor[s])
+            if pos + k <= len(order):
+                out.append(order[pos:pos + k])
+                self._cursor[s] = pos + k
+                continue
+            # wrap: the tail of this pass, then the head of a fresh shuffle
+            tail = order[pos:]
+            fresh = self.rng.permutation(self.ids[s])
+            fresh = np.concatenate([fresh[~np.isin(fresh, tail)], tail])
+            head = fresh[:k - len(tail)]
+            out.append(np.concatenate([tail, head]))
+            self._order[s] = fresh
+            self._cursor[s] = len(head)
+        exam = np.concatenate(out) if out else np.zeros(0, dtype=np.int64)
+        self.rng.shuffle(exam)
+        return exam
+
+    def exam(self, constraints):
+        return self.draw(self.plan(constraints))
+
+    def cohort(self, constraints, n):
+        """n exams; plans come from a pool of up to PLAN_POOL"""
+        pool = [self.plan(constraints) for _ in range(min(n, PLAN_POOL))]
+        return [self.draw(pool[i % len(pool)]) for i in range(n)]
+
+    def describe(self, exam):
+        """{dimension: {value: count}} of one exam"""
+        lookup = {int(qid): s for s, ids in enumerate(self.ids) for qid in ids}
+        strata = np.fromiter((lookup[int(qid)] for qid in exam), dtype=np.int64, count=len(exam))
+        return self._named(np.bincount(strata, minlength=len(self.ids)) @ self.member)
+
+def main(argv=None):
+    from generate_html import TOPIC_INDEX
+    parser = argparse.ArgumentParser(description='Draw exams that meet topic/type/difficulty quotas.')
+    parser.add_argument('constraints', nargs='?', help='constraints JSON (default: 30 questions, no quotas)')
+    parser.add_argument('-n', '--count', type=int, default=1, help='exams to draw')
+    parser.add_argument('-o', '--output', help='write the exams as a JSON list of ID lists')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--difficulty', help='JSON {qid: easy|medium|hard} instead of the solver levels')
+    parser.add_argument('--bench', type=int, metavar='N', help='time drawing N exams')
+    parser.add_argument('--questions', default=os.path.join(SCRIPT_DIR, 'questions.json'))
+    args = parser.parse_args(argv)
+    with open(args.questions, 'r', encoding='utf-8') as f:
+        questions = json.load(f)
+    difficulty = None
+    if args.difficulty:
+        with open(args.difficulty, 'r', encoding='utf-8') as f:
+            difficulty = {int(k): v for k, v in json.load(f).items()}
+    constraints = {'size': 30}
+    if args.constraints:
+        with open(args.constraints, 'r', encoding='utf-8') as f:
+            constraints = json.load(f)
+    sampler = ExamSampler(questions, TOPIC_INDEX, difficulty, args.seed)
+
+    if args.bench:
+        start = time.perf_counter()
+        exams = sampler.cohort(constraints, args.bench)
+        elapsed = time.perf_counter() - start
+        distinct = len({tuple(sorted(e.tolist())) for e in exams})
+        print(f"{len(exams)} exams ({distinct} distinct) in {elapsed:.2f}s "
+              f"({len(exams) / elapsed:,.0f}/s)")
+        return
+    exams = sampler.cohort(constraints, args.count)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump([e.tolist() for e in exams], f)
+        print(f"Saved {len(exams)} exams to {args.output}")
+    else:
+        for exam in exams:
+            print(' '.join(map(str, exam.tolist())))
+    print(json.dumps(sampler.describe(exams[0]), ensure_ascii=False))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Deterministic exam variants from (exam seed, student ID).
+
+Nothing is stored per student: every random number of a variant is a
+counter-based hash (the splitmix64 finalizer) of a per-student key and a
+counter, so any part of any variant is recomputed on demand:
+
+  * question order   argsort of hash(order key, bank position)
+  * option order     permutation number hash(option key, qid) mod k! into a
+                     table of all k! permutations of k options (PERMS), so
+                     a shown index maps back to the bank's index with one
+                     table lookup, and the correct option's shown index is
+                     the inverse table (INVERSE)
+
+Batches of students are one NumPy hash over a students x questions grid and
+one argsort, so 100k variants take a few seconds:
+
+    python exam_variants.py --seed midterm-2024 --student 20231234
+    python exam_variants.py --seed midterm-2024 --bench 100000
+"""
+import argparse, hashlib, json, os, time
+from itertools import permutations
+from math import factorial
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+# students hashed per NumPy batch in generate()
+BATCH = 4096
+MAX_OPTIONS = 6
+
+# PERMS[k][p] is the p-th permutation of range(k): shown position -> bank index
+PERMS = {k: np.array(list(permutations(range(k))), dtype=np.int8) for k in range(1, MAX_OPTIONS + 1)}
+# INVERSE[k][p]: bank index -> shown position
+INVERSE = {k: np.argsort(p, axis=1).astype(np.int8) for k, p in PERMS.items()}
+
+def mix(x):
+    """splitmix64 finalizer over a uint64 array (wraps modulo 2**64)"""
+    x = np.asarray(x, dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        x = x ^ (x >> np.uint64(30))
+        x = x * np.uint64(0xBF58476D1CE4E5B9)
+        x = x ^ (x >> np.uint64(27))
+        x = x * np.uint64(0x94D049BB133111EB)
+        return x ^ (x >> np.uint64(31))
+
+def hash64(value):
+    """Stable 64-bit hash of a seed or student ID (int or str)"""
+    return int.from_bytes(hashlib.blake2b(str(value).encode('utf-8'), digest_size=8).digest(), 'little')
+
+def counter_hash(keys, counters):
+    """hash(key, counter) for every pair of a keys column and a counters row"""
+    keys = np.asarray(keys, dtype=np.uint64)
+    counters = np.asarray(counters, dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        return mix(keys[..., None] + counters * GOLDEN)
+
+class VariantEngine:
+    def __init__(self, questions, seed):
+        self.seed = hash64(seed)
+        self.ids = np.array([q['id'] for q in questions], dtype=np.int64)
+        self.position = {int(qid): i for i, qid in enumerate(self.ids)}
+        self.n_options = np.array([len(q['options']) for q in questions], dtype=np.int64)
+        if self.n_options.max(initial=1) > MAX_OPTIONS:
+            raise ValueError(f"questions with more than {MAX_OPTIONS} options")
+        self.n_perms = np.array([factorial(k) for k in self.n_options], dtype=np.uint64)
+        self.correct = np.array([next((i for i, o in enumerate(q['options']) if o['correct']), -1)
+                                 for q in questions], dtype=np.int64)
+        # counters are offset per stream so the order and option hashes differ
+        self._order_counters = np.arange(len(self.ids), dtype=np.uint64)
+        self._option_counters = self.ids.astype(np.uint64) + np.uint64(1 << 32)
+
+    def keys(self, students):
+        """Per-student uint64 keys"""
+        return mix(np.array([hash64(s) for s in students], dtype=np.uint64)
+                   ^ np.uint64(self.seed))
+
+    def _perm_ids(self, keys, positions=slice(None)):
+        h = counter_hash(keys, self._option_counters[positions])
+        return (h % self.n_perms[positions]).astype(np.int64)
+
+    def generate(self, students, batch=BATCH):
+        """Yield (students, order, perms) per batch: order[s] are bank positions
+        in exam order, perms[s][i] the permutation number of bank position i"""
+        students = list(students)
+        for start in range(0, len(students), batch):
+            part = students[start:start + batch]
+            keys = self.keys(part)
+            order = np.argsort(counter_hash(keys, self._order_counters), axis=1).astype(np.int32)
+            yield part, order, self._perm_ids(keys)
+
+    def variant(self, student):
+        """[{'id', 'options': bank option indices in shown order}] in exam order"""
+        _, order, perms = next(self.generate([student]))
+        return [{'id': int(self.ids[i]),
+                 'options': PERMS[int(self.n_options[i])][perms[0, i]].tolist()}
+                for i in order[0]]
+
+    def to_bank(self, student, qid, shown):
+        """Bank option index of the option `student` saw at position `shown`"""
+        i = self.position[qid]
+        perm = self._perm_ids(self.keys([student]), slice(i, i + 1))[0, 0]
+        return int(PERMS[int(self.n_options[i])][perm, shown])
+
+    def remap(self, students, qids, shown):
+        """Vectorized to_bank over parallel arrays of answers"""
+        pos = np.array([self.position[int(q)] for q in qids], dtype=np.int64)
+        keys = self.keys(students)
+        with np.errstate(over='ignore'):
+            h = mix(keys + self._option_counters[pos] * GOLDEN)
+        perm = (h % self.n_perms[pos]).astype(np.int64)
+        shown = np.asarray(shown, dtype=np.int64)
+        out = np.empty(len(pos), dtype=np.int64)
+        for k in np.unique(self.n_options[pos]):
+            sel = self.n_options[pos] == k
+            out[sel] = PERMS[int(k)][perm[sel], shown[sel]]
+        return out
+
+    def answer_key(self, student):
+        """{qid: shown index of the correct option} for one student's variant"""
+        _, _, perms = next(self.generate([student]))
+        return {int(qid): int(INVERSE[int(k)][p, c])
+                for qid, k, p, c in zip(self.ids, self.n_options, perms[0], self.correct)}
+
+    def grade(self, student, answers):
+        """Correct count of {qid: shown index} answers"""
+        return sum(self.to_bank(student, qid, shown) == self.correct[self.position[qid]]
+                   for qid, shown in answers.items())
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Seeded exam variants per student.')
+    parser.add_argument('--seed', required=True, help='exam seed (any string)')
+    parser.add_argument('--student', action='append', default=[], help='print this student\'s variant')
+    parser.add_argument('--bench', type=int, metavar='N', help='time generating N variants')
+    parser.add_argument('--questions', default=os.path.join(SCRIPT_DIR, 'questions.json'))
+    args = parser.parse_args(argv)
+    with open(args.questions, 'r', encoding='utf-8') as f:
+        engine = VariantEngine(json.load(f), args.seed)
+    for student in args.student:
+        print(f"{student}:")
+        for n, item in enumerate(engine.variant(student), 1):
+            print(f"  {n:3}. Q{item['id']} options {item['options']}")
+    if args.bench:
+        start = time.perf_counter()
+        count = 0
+        for part, order, perms in engine.generate(f's{i}' for i in range(args.bench)):
+            count += len(part)
+        elapsed = time.perf_counter() - start
+        print(f"{count} variants of {len(engine.ids)} questions in {elapsed:.2f}s "
+              f"({count / elapsed:,.0f}/s)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1 @@
+explanationChunk({"1":["جزئياً صحيح - هذه إحدى وظائف نظام التشغيل فقط. يكون صحيحاً إذا سُئلت عن وظيفة واحدة.","جزئياً صحيح - تقديم الخدمات للتطبيقات وظيفة واحدة فقط. يكون صحيحاً عند السؤال عن علاقة النظام بالتطبيقات.","جزئياً صحيح - الربط بين العتاد والبرمجيات جانب واحد. يكون صحيحاً عند السؤال عن دور النظام كوسيط.","✅ صحيح! نظام التشغيل يقوم بكل ما ذُكر: إدارة العتاد، خدمة التطبيقات، والربط بينهما."],"2":["❌ خاطئ. الجدولة تزيد استخدام المعالج ولا تنقصه.","❌ خاطئ. تقليل التكلفة ليس الهدف المباشر لجدولة المعالج.","✅ صحيح! الهدف الرئيسي من جدولة المعالج هو زيادة استغلاله وإبقائه مشغولاً دائماً.","❌ خاطئ. الجدولة لها أهداف واضحة وليست بلا فائدة."],"3":["✅ صحيح! حالة الاستعداد (Ready) تعني أن العملية جاهزة ومُجدولة للتنفيذ في المعالج.","❌ خاطئ. الانتظار في طابور العمل يصف حالة (New/Job Queue) وليس Ready. يكون صحيحاً عند السؤال عن حالة الانتظار.","❌ خاطئ. استخدام المعالج يصف حالة التنفيذ (Running) وليس الاستعداد.","❌ خاطئ. الجواب الأول هو الصحيح."],"4":["❌ خاطئ. إنهاء العمليات ليس جموداً بل هو إنهاء طبيعي. يكون صحيحاً عند السؤال عن حالة Terminated.","❌ خاطئ. هذا تعبير مجازي لا يصف الجمود تقنياً.","✅ صحيح! الجمود (Deadlock) يعني أن كل عملية محظورة وستبقى كذلك للأبد لأنها تنتظر موارد تحتجزها عمليات أخرى.","❌ خاطئ. الجمود له تعريف محدد وهو الخيار الثالث."],"5":["✅ صحيح! المجدول طويل المدى (Long-term) يختار العمليات من التخزين وينقلها إلى طابور الاستعداد.","❌ خاطئ. هذا وصف المجدول قصير المدى (Short-term). يكون صحيحاً عند السؤال عنه.","❌ خاطئ. هذا وصف المجدول متوسط المدى (Medium-term). يكون صحيحاً عند السؤال عن Swapping.","❌ خاطئ. الجواب الأول هو الصحيح."],"6":["❌ خاطئ. تخزين البيانات الوصفية من وظائف الـ inode وليس الدليل. يكون صحيحاً عند السؤال عن inode.","❌ خاطئ. تخصيص مساحة القرص من وظائف نظام الملفات نفسه.","✅ صحيح! الغرض الأساسي من بنية الدليل هو تنظيم الملفات بطريقة منظمة وسهلة الوصول.","❌ خاطئ. التحكم في تنفيذ العمليات من وظائف مدير العمليات."],"7":["✅ صحيح! التخصيص المتجاور يتطلب مساحة متصلة مما يسبب تجزئة خارجية عند حذف الملفات.","❌ خاطئ. التخصيص المتصل يستخدم مؤشرات فلا يعاني من تجزئة خارجية. يكون صحيحاً عند السؤال عن البطء في الوصول العشوائي.","❌ خاطئ. التخصيص المفهرس يستخدم كتلة فهرس فلا يعاني من تجزئة خارجية.","❌ خاطئ. التخصيص المتجاور يعاني من تجزئة خارجية فعلاً."],"8":["✅ صحيح! الـ inode يخزن البيانات الوصفية للملف مثل الحجم والصلاحيات والأوقات ومواقع الكتل.","❌ خاطئ. تخصيص موارد المعالج من وظائف المجدول.","❌ خاطئ. جدولة العمليات ليست من وظائف الـ inode.","❌ خاطئ. التشفير ليس من وظائف الـ inode بل من وظائف نظام الملفات أو أدوات الأمان."],"9":["✅ صحيح! نظام FAT طُوّر بواسطة Microsoft ويُستخدم بشكل رئيسي في أنظمة Windows وأجهزة التخزين المحمولة.","❌ خاطئ. Linux يستخدم ext4 افتراضياً. يكون صحيحاً عند السؤال عن ext4.","❌ خاطئ. macOS يستخدم APFS/HFS+.","❌ خاطئ. أنظمة UNIX تستخدم UFS أو ext."],"10":["❌ خاطئ. NTFS هو نظام ملفات Windows. يكون صحيحاً عند السؤال عن نظام ملفات Windows الافتراضي.","❌ خاطئ. FAT32 نظام قديم يُستخدم في وسائط التخزين المحمولة.","✅ صحيح! ext4 هو نظام الملفات الافتراضي في معظم توزيعات Linux الحديثة.","❌ خاطئ. HFS+ هو نظام ملفات macOS القديم."],"11":["❌ خاطئ. الترحيل (Paging) هو تقنية إدارة ذاكرة وليس برنامجاً قيد التنفيذ.","✅ صحيح! البرنامج قيد التنفيذ يسمى عملية (Process). العملية تشمل الكود والبيانات والمكدس وعداد البرنامج.","❌ خاطئ. الذاكرة الافتراضية تقنية وليست برنامجاً قيد التنفيذ.","❌ خاطئ. صفحة الطلب (Demand Page) مفهوم في إدارة الذاكرة."],"12":["✅ صحيح! جدول الصفحات يحتوي على العنوان الأساسي لكل إطار ورقم الصفحة المقابل لتحويل العناوين المنطقية إلى فيزيائية.","❌ خاطئ. جدول الصفحات لا يخزن عناوين الذاكرة العامة بل عناوين الإطارات.","❌ خاطئ. أسماء الملفات لا علاقة لها بجدول الصفحات.","❌ خاطئ. الجواب الأول هو الصحيح."],"13":["❌ خاطئ. الترحيل (Paging) تقنية تخصيص ذاكرة فعلاً.","❌ خاطئ. التقسيم (Segmentation) تقنية تخصيص ذاكرة فعلاً.","❌ خاطئ. التبديل (Swapping) تقنية إدارة ذاكرة فعلاً.","✅ صحيح! البرمجة المتعددة (Multiprogramming) مفهوم لتشغيل عدة برامج وليست تقنية تخصيص ذاكرة."],"14":["✅ صحيح! التجزئة الداخلية هي الذاكرة غير المستخدمة داخل المساحة المخصصة للعملية (مساحة ضائعة داخل الكتلة).","❌ خاطئ. هذا وصف التجزئة الخارجية وليس الداخلية. يكون صحيحاً عند السؤال عن External Fragmentation.","❌ خاطئ. هدر الذاكرة بسبب تبديل الصفحات ليس تجزئة داخلية.","❌ خاطئ. الذاكرة الضائعة بسبب الجمود مفهوم مختلف تماماً."],"15":["❌ جزئياً صحيح - First Fit إحدى الخوارزميات فقط. يختار أول كتلة مناسبة.","❌ جزئياً صحيح - Best Fit إحدى الخوارزميات فقط. يختار أصغر كتلة مناسبة.","❌ جزئياً صحيح - Worst Fit إحدى الخوارزميات فقط. يختار أكبر كتلة متاحة.","✅ صحيح! جميع الخوارزميات المذكورة (First Fit, Best Fit, Worst Fit) تُستخدم لوضع العمليات في كتل الذاكرة."],"16":["✅ صحيح! أنظمة الملفات المزودة بالتسجيل (Journaling) تمنع تلف الملفات عن طريق تسجيل التغييرات قبل تطبيقها فعلياً.","❌ خاطئ. التسجيل لا يزيد سرعة النقل بل قد يبطئها قليلاً بسبب الكتابة المزدوجة.","❌ خاطئ. التسجيل لا يقلل حجم الملفات.","❌ خاطئ. التسجيل لا يحسن إلغاء تجزئة القرص."],"17":["❌ خاطئ. FAT32 لا يدعم التشفير أصلاً لأنه نظام بسيط. يكون صحيحاً عند السؤال عن أبسط نظام ملفات.","✅ صحيح! NTFS يدعم تشفير الملفات أصلاً من خلال EFS (Encrypting File System).","❌ خاطئ. ext2 لا يوفر تشفيراً مدمجاً (ext4 مع fscrypt يدعمه).","❌ خاطئ. NTFS يدعم التشفير فعلاً."],"18":["❌ جزئياً صحيح - عداد البرنامج أحد مكونات الخيط فقط.","❌ جزئياً صحيح - السجلات أحد مكونات الخيط فقط.","❌ جزئياً صحيح - المكدس أحد مكونات الخيط فقط.","✅ صحيح! مكونات الخيط تشمل: عداد البرنامج، السجلات، والمكدس. كل خيط يملك نسخته الخاصة منها."],"19":["✅ صحيح! العمليتان الذريتان للإشارات (Semaphores) هما Wait (P) و Signal (V).","❌ خاطئ. لا توجد عملية Stop في الإشارات.","❌ خاطئ. لا توجد عملية Stop في الإشارات.","❌ خاطئ. Release ليست من العمليات القياسية للإشارات."],"20":["✅ صحيح! تأثير القافلة يحدث في FCFS عندما تكون العملية الأولى ذات أطول وقت تنفيذ فتحجز المعالج وتجعل البقية تنتظر.","❌ خاطئ. إذا كانت الأولى قصيرة فستنتهي سريعاً ولن يحدث تأثير القافلة.","❌ خاطئ. إذا كانت أوقات التنفيذ متساوية فلن يكون هناك تأخير نسبي كبير.","❌ خاطئ. تأثير القافلة مفهوم حقيقي في FCFS."],"21":["❌ خاطئ. العمليات المقيدة بالإدخال/الإخراج تقضي وقتاً أكثر في I/O وليس الحسابات.","✅ صحيح! العمليات المقيدة بالمعالج (CPU-bound) تقضي معظم وقتها في الحسابات.","❌ خاطئ. ليس كلاهما - CPU-bound تحديداً هي الأكثر حسابات.","❌ خاطئ. الجواب الثاني هو الصحيح."],"22":["❌ هذا ليس صحيحاً. وقت الانتظار ليس مقدار الوقت لتنفيذ العملية.","✅ صحيح! العبارة خاطئة. وقت الانتظار (Waiting Time) هو الوقت الذي تقضيه العملية في طابور الاستعداد، وليس وقت التنفيذ. وقت التنفيذ يسمى Burst Time."],"23":["✅ صحيح! كتلة تحكم العملية (PCB) فعلاً تحتوي على معلومات مرتبطة بكل عملية مثل معرف العملية وحالتها وسجلاتها.","❌ خاطئ. العبارة صحيحة، PCB بالفعل تحتوي على معلومات العملية."],"24":["✅ صحيح! pthread_create() هي الدالة المستخدمة في POSIX Threads لإنشاء خيط جديد.","❌ خاطئ. thread_start() ليست دالة POSIX قياسية.","❌ خاطئ. create_thread() ليست دالة POSIX قياسية.","❌ خاطئ. init_thread() ليست دالة POSIX قياسية."],"25":["❌ خاطئ. التحكم في تنفيذ العمليات من وظائف مدير العمليات.","❌ خاطئ. تحسين الوصول للقرص من وظائف نظام الملفات.","✅ صحيح! الغرض الرئيسي من إدارة الذاكرة هو تخصيص وإلغاء تخصيص الذاكرة بكفاءة للعمليات.","❌ خاطئ. تحسين جدولة المعالج من وظائف المجدول."],"26":["❌ جزئياً صحيح - واجهة المستخدم إحدى خدمات نظام التشغيل فقط.","❌ جزئياً صحيح - تنفيذ البرامج إحدى الخدمات فقط.","❌ جزئياً صحيح - عمليات الإدخال/الإخراج إحدى الخدمات فقط.","✅ صحيح! جميعها من خدمات نظام التشغيل: واجهة المستخدم، تنفيذ البرامج، وعمليات I/O."],"27":["❌ خاطئ. المعالجة أحادية الخيط تعني خيطاً واحداً فقط.","✅ صحيح! المعالجة متعددة النوى تسمح بتشغيل عدة خيوط فعلياً على معالجات متعددة بشكل متوازٍ.","❌ خاطئ. جدولة الطوابير المتعددة مفهوم جدولة وليس نوع تعدد خيوط.","❌ خاطئ. جدولة FIFO خوارزمية جدولة وليست نوع تعدد خيوط."],"28":["✅ صحيح! الميزة الرئيسية لتعدد الخيوط هي تحسين استغلال المعالج عبر تشغيل عدة خيوط.","❌ خاطئ. تعدد الخيوط يقلل استهلاك الذاكرة (الخيوط تتشارك الذاكرة) ولا يزيده.","❌ خاطئ. تعدد الخيوط لا يقلل وقت الوصول للقرص مباشرة.","❌ خاطئ. تعدد الخيوط لا يمنع الجمود بل قد يزيد احتمالية حدوثه."],"29":["❌ خاطئ. الإنتاجية (Throughput) تعني عدد العمليات المنجزة في وحدة زمنية. يكون صحيحاً عند السؤال عن عدد العمليات المنجزة.","✅ صحيح! استغلال المعالج (CPU Utilization) هو المعيار الذي يشير لإبقاء المعالج مشغولاً قدر الإمكان.","❌ خاطئ. وقت الاستجابة يقيس سرعة الرد على الطلب. يكون صحيحاً عند السؤال عن سرعة التفاعل.","❌ خاطئ. وقت الانتظار يقيس مدة بقاء العملية في طابور الاستعداد."],"30":["❌ خاطئ. قسم الخروج (Exit Section) يأتي بعد القسم الحرج ولا تحدث فيه حالة سباق.","✅ صحيح! القسم الحرج (Critical Section) هو الجزء من البرنامج الذي يصل فيه لموارد مشتركة ويمكن أن تحدث فيه حالة السباق.","❌ خاطئ. القسم المتبقي (Remainder Section) هو باقي الكود بعد القسم الحرج.","❌ خاطئ. قسم الدخول (Entry Section) يسبق القسم الحرج ويتحقق من إمكانية الدخول."]});
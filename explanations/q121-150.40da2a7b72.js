@@ -0,0 +1 @@
+explanationChunk({"121":["✅ صحيح! TLB ذاكرة تخزين مؤقت سريعة لتسريع ترجمة العناوين.","❌ خاطئ. TLB ليس جهاز تخزين ثانوي.","❌ خاطئ. TLB ليس مكوناً لنظام الملفات.","❌ خاطئ. TLB ليس خوارزمية جدولة أقراص."],"122":["✅ صحيح! نظام الملفات مسؤول عن إدارة الملفات والأدلة وتنظيمها.","❌ خاطئ. التحكم بجدولة المعالج من وظائف المجدول.","❌ خاطئ. التخصيص الديناميكي للذاكرة من وظائف مدير الذاكرة.","❌ خاطئ. التعامل مع تزامن العمليات من وظائف نظام التزامن."],"123":["❌ خاطئ. التصيد (Phishing) خداع للحصول على معلومات.","✅ صحيح! الانتحال (Spoofing) يتضمن التظاهر بأنك مستخدم آخر.","❌ خاطئ. هجوم DDoS يُغرق الخادم بالطلبات.","❌ خاطئ. هجوم التجزئة يستغل تجزئة الحزم."],"124":["❌ خاطئ. اسم الملف خاصية أساسية للملف.","❌ خاطئ. حجم الملف خاصية أساسية.","✅ صحيح! أولوية جدولة المعالج خاصية للعملية وليست خاصية للملف.","❌ خاطئ. صلاحيات الملف خاصية أساسية."],"125":["❌ خاطئ. إدارة الملفات خدمة مختلفة.","✅ صحيح! تنفيذ البرامج (Program Execution) تسمح للمستخدم بتنفيذ برنامج.","❌ خاطئ. الأمان خدمة حماية.","❌ خاطئ. عمليات I/O خدمة إدخال/إخراج."],"126":["❌ خاطئ. إدارة العمليات تتعامل مع العمليات.","❌ خاطئ. إدارة الذاكرة تتعامل مع تخصيص الذاكرة.","✅ صحيح! خدمة عمليات I/O مسؤولة عن الإدخال والإخراج.","❌ خاطئ. إدارة نظام الملفات تتعامل مع الملفات."],"127":["❌ خاطئ. إدارة الملفات تنظم الملفات.","✅ صحيح! خدمة الأمان (Security) تحمي من الوصول غير المصرح به.","❌ خاطئ. جدولة العمليات تدير تنفيذ العمليات.","❌ خاطئ. منع الجمود يتعامل مع مشاكل الموارد."],"128":["❌ خاطئ. التحكم بالعمليات يدير العمليات.","✅ صحيح! إدارة الملفات (File Management) تتتبع ملفات النظام والمستخدم.","❌ خاطئ. إدارة الذاكرة تتعامل مع تخصيص الذاكرة.","❌ خاطئ. عمليات I/O تتعامل مع الأجهزة."],"129":["✅ صحيح! خدمة التعامل مع الجمود (Deadlock Handling) مسؤولة عن منع وحل الجمود.","❌ خاطئ. جدولة العمليات تدير تنفيذ العمليات.","❌ خاطئ. تخصيص الذاكرة يدير الذاكرة.","❌ خاطئ. إدارة الملفات تنظم الملفات."],"130":["✅ صحيح! مشاركة الملفات (File Sharing) تسمح لعدة مستخدمين بالوصول للملفات.","❌ خاطئ. إدارة I/O تتعامل مع الأجهزة.","❌ خاطئ. الذاكرة الافتراضية تقنية إدارة ذاكرة.","❌ خاطئ. جدولة المهام تدير العمليات."],"131":["✅ صحيح! المترجم (Compiler) يحول الكود المصدري إلى كود الآلة.","❌ خاطئ. الرابط (Linker) يربط الملفات المترجمة.","❌ خاطئ. المحمّل (Loader) يحمّل البرنامج للذاكرة.","❌ خاطئ. المفسر (Interpreter) ينفذ سطراً بسطر."],"132":["❌ خاطئ. جدولة I/O تدير عمليات الإدخال/الإخراج.","✅ صحيح! جدولة العمليات (Process Scheduling) هي تخصيص وقت المعالج.","❌ خاطئ. ترحيل الذاكرة تقنية إدارة ذاكرة.","❌ خاطئ. منع الجمود يتعامل مع مشاكل الموارد."],"133":["❌ خاطئ. إدارة الملفات تنظم الملفات على القرص.","✅ صحيح! تزامن العمليات (Process Synchronization) يتعامل مع IPC.","❌ خاطئ. الشبكات تتعامل مع اتصالات الشبكة.","❌ خاطئ. تنفيذ البرامج يشغل البرامج."],"134":["❌ خاطئ. إدارة الذاكرة من وظائف مدير الذاكرة.","✅ صحيح! الدور الرئيسي لمفسر الأوامر هو تنفيذ أوامر المستخدم.","❌ خاطئ. تخصيص مساحة القرص من وظائف نظام الملفات.","❌ خاطئ. معالجة طلبات الشبكة من وظائف نظام الشبكات."],"135":["❌ خاطئ. إدارة الملفات تنظم الملفات.","❌ خاطئ. إدارة الذاكرة تخصص الذاكرة.","✅ صحيح! محمّل البرنامج (Program Loader) يحمّل البرنامج في الذاكرة للتنفيذ.","❌ خاطئ. إدارة الأجهزة تتحكم بالعتاد."],"136":["❌ خاطئ. إدارة الذاكرة تدير تخصيص الذاكرة.","✅ صحيح! نظام معالجة المقاطعات مسؤول عن التعامل مع المقاطعات.","❌ خاطئ. جدولة المعالج تدير تنفيذ العمليات.","❌ خاطئ. إدارة نظام الملفات تنظم الملفات."],"137":["❌ خاطئ. تشغيل العمليات على عدة معالجات من وظائف المعالجة المتوازية.","✅ صحيح! الذاكرة الافتراضية تحاكي ذاكرة أكبر من الذاكرة الفيزيائية.","❌ خاطئ. جدولة العمليات من وظائف المجدول.","❌ خاطئ. توفير واجهة رسومية من وظائف واجهة المستخدم."],"138":["❌ خاطئ. تخصيص وقت المعالج من وظائف المجدول.","✅ صحيح! إدارة I/O مسؤولة عن إدارة اتصالات الأجهزة ونقل البيانات.","❌ خاطئ. تنظيم الملفات من وظائف نظام الملفات.","❌ خاطئ. معالجة صفحات الذاكرة الافتراضية من وظائف مدير الذاكرة."],"139":["✅ صحيح! إدارة الملفات تشمل التحكم بالوصول وتخزين الملفات وبنية الأدلة.","❌ خاطئ. جدولة العمليات وتخصيص الذاكرة وظائف مختلفة.","❌ خاطئ. إدارة الذاكرة الافتراضية وظيفة مختلفة.","❌ خاطئ. التخزين المؤقت والترحيل وظائف مختلفة."],"140":["❌ خاطئ. إدارة الأجهزة تتحكم بالعتاد.","❌ خاطئ. إدارة الملفات تنظم الملفات.","❌ خاطئ. إدارة العمليات تدير العمليات.","✅ صحيح! معالجة الأخطاء (Error Handling) مسؤولة عن كشف وإدارة الأخطاء."],"141":["❌ خاطئ. معالجة المقاطعات جزء من خدمات النواة.","✅ صحيح! خدمات النواة مطلوبة للتعامل مع استدعاءات النظام.","❌ خاطئ. تخصيص الذاكرة خدمة محددة.","❌ خاطئ. التعامل مع الملفات خدمة محددة."],"142":["❌ خاطئ. إدارة الذاكرة تتعامل مع الذاكرة فقط.","✅ صحيح! تخصيص الموارد (Resource Allocation) يدير تخصيص جميع الموارد.","❌ خاطئ. إدارة العمليات تدير دورة حياة العمليات.","❌ خاطئ. إدارة الأجهزة تتحكم بالعتاد."],"143":["❌ خاطئ. جدولة العمليات تحدد أي عملية تُنفذ.","✅ صحيح! حماية الذاكرة تضمن عدم تجاوز أي عملية لمواردها.","❌ خاطئ. إدارة الملفات تنظم الملفات.","❌ خاطئ. منع الجمود يتعامل مع مشاكل الموارد."],"144":["✅ صحيح! إدارة واجهة المستخدم توفر واجهة سهلة الاستخدام.","❌ خاطئ. إدارة الملفات تنظم الملفات.","❌ خاطئ. إدارة الشبكة تدير الاتصالات.","❌ خاطئ. تزامن العمليات يتعامل مع التنسيق بين العمليات."],"145":["❌ خاطئ. تخصيص الموارد يوزع الموارد.","✅ صحيح! المحاسبة (Accounting) تتتبع موارد النظام مثل استخدام المعالج.","❌ خاطئ. إدارة الملفات تنظم الملفات.","❌ خاطئ. جدولة العمليات تدير التنفيذ."],"146":["❌ خاطئ. تخصيص وقت المعالج من وظائف المجدول.","✅ صحيح! خدمة الأمان مسؤولة عن حماية النظام والبيانات.","❌ خاطئ. جدولة تنفيذ البرامج من وظائف المجدول.","❌ خاطئ. إدارة أجهزة I/O من وظائف مدير الأجهزة."],"147":["❌ خاطئ. إدارة موارد العتاد وظيفة أساسية.","❌ خاطئ. توفير واجهة المستخدم وظيفة أساسية.","❌ خاطئ. تنفيذ برامج المستخدم وظيفة أساسية.","✅ صحيح! ترجمة البرامج (Compiling) ليست وظيفة نظام التشغيل بل المترجم."],"148":["✅ صحيح! المحاسبة (Accounting) تحتفظ بسجلات مفصلة لاستخدام النظام.","❌ خاطئ. التسجيل قريب لكن المحاسبة أدق.","❌ خاطئ. الأمان يحمي النظام من التهديدات.","❌ خاطئ. إدارة الملفات تنظم الملفات."],"149":["❌ خاطئ. إدارة العمليات خدمة فعلية.","❌ خاطئ. إدارة الذاكرة خدمة فعلية.","✅ صحيح! تصفح الشبكة (Network Browsing) ليست خدمة نظام تشغيل بل تطبيق مستخدم.","❌ خاطئ. إدارة نظام الملفات خدمة فعلية."],"150":["✅ صحيح! الرابط الصلب (Hard Link) يشير مباشرة لـ inode الملف.","❌ خاطئ. الرابط الصلب لا ينشئ نسخة بل يشير لنفس البيانات.","❌ خاطئ. البيانات الوصفية مخزنة في الـ inode.","❌ خاطئ. الرابط الصلب للملفات المحلية وليس الشبكة."]});
@@ -0,0 +1 @@
+explanationChunk({"151":["✅ صحيح! مزامنة الخيوط تُستخدم لإدارة العمليات المتزامنة بفعالية.","❌ خاطئ. الذاكرة الافتراضية تقنية إدارة ذاكرة.","❌ خاطئ. التخزين المؤقت لـ I/O تقنية مختلفة.","❌ خاطئ. كشف الجمود جزء من الحل وليس الإدارة الكاملة."],"152":["✅ صحيح! إدارة الأجهزة تدير اتصالات العتاد والتحكم بالأجهزة.","❌ خاطئ. إدارة الملفات تنظم الملفات.","❌ خاطئ. تخصيص الذاكرة يدير الذاكرة.","❌ خاطئ. جدولة المعالج تدير العمليات."],"153":["✅ صحيح! الذاكرة الافتراضية هي عملية تبادل البيانات بين RAM والقرص.","❌ خاطئ. إدارة الملفات تنظم الملفات.","❌ خاطئ. جدولة I/O تدير عمليات الإدخال/الإخراج.","❌ خاطئ. منع الجمود يتعامل مع مشاكل الموارد."],"154":["✅ صحيح! إدارة نظام الملفات تُستخدم لتنظيم الملفات في أدلة.","❌ خاطئ. جدولة العمليات تدير التنفيذ.","❌ خاطئ. التخزين المؤقت لـ I/O تقنية مختلفة.","❌ خاطئ. ترحيل الذاكرة تقنية إدارة ذاكرة."],"155":["❌ خاطئ. GUI واجهة رسومية تستخدم الفأرة والأيقونات.","✅ صحيح! واجهة سطر الأوامر (CLI) تسمح بكتابة أوامر نصية.","❌ خاطئ. مجدول العمليات يعمل في الخلفية.","❌ خاطئ. مدير الملفات تطبيق وليس واجهة أوامر."],"156":["✅ صحيح! تنفيذ البرامج يدير تنفيذ البرامج على مستوى النظام.","❌ خاطئ. تخصيص موارد النظام خدمة مختلفة.","❌ خاطئ. إدارة الشبكة تتعامل مع الاتصالات.","❌ خاطئ. الأمان يحمي النظام."],"157":["✅ صحيح! جدولة العمليات تضمن تشغيل النظام بكفاءة مع عدة برامج.","❌ خاطئ. إدارة الذاكرة تخصص الذاكرة.","❌ خاطئ. الذاكرة الافتراضية توسع الذاكرة.","❌ خاطئ. إدارة الأجهزة تتحكم بالعتاد."],"158":["❌ خاطئ. إدارة موارد المعالج من وظائف المجدول.","✅ صحيح! إدارة الشبكة مسؤولة عن التحكم بالوصول للموارد المتصلة.","❌ خاطئ. تخزين واسترجاع الملفات من وظائف نظام الملفات.","❌ خاطئ. معالجة المقاطعات من وظائف معالج المقاطعات."],"159":["❌ خاطئ. إدارة العمليات تدير العمليات.","❌ خاطئ. إدارة الملفات تنظم الملفات.","✅ صحيح! خدمة الأمان مسؤولة عن سجلات النظام ومسارات التدقيق.","❌ خاطئ. المحاسبة تتتبع استخدام الموارد."],"160":["❌ خاطئ. إدارة I/O تتعامل مع الأجهزة.","✅ صحيح! إدارة الذاكرة مسؤولة عن تخصيص المساحة وإدارة التسلسل الهرمي.","❌ خاطئ. إدارة العمليات تدير العمليات.","❌ خاطئ. إدارة الملفات تنظم الملفات."],"161":["✅ صحيح! الخيوط ضمن نفس العملية تتشارك نفس مساحة الذاكرة والموارد.","❌ خاطئ. الخيوط تتشارك الذاكرة ولا تملك مساحات منفصلة.","❌ خاطئ. الخيوط تستطيع التواصل عبر الذاكرة المشتركة.","❌ خاطئ. الخيوط يمكن أن تعمل على نفس المعالج أيضاً."],"162":["❌ خاطئ. حماية الذاكرة تمنع وصول العمليات لذاكرة بعضها.","✅ صحيح! تزامن العمليات يمنع تداخل أنشطة المستخدمين المتعددين.","❌ خاطئ. منع الجمود يتعامل مع الموارد المقفلة.","❌ خاطئ. الذاكرة الافتراضية تقنية إدارة ذاكرة."],"163":["✅ صحيح! الغرض الأساسي من التزامن هو منع العمليات/الخيوط من التداخل.","❌ خاطئ. التزامن لا يزيد عدد الخيوط بل ينظم تنفيذها.","❌ خاطئ. وصف جزئي - منع الأخطاء أهم.","❌ خاطئ. تخصيص الموارد بطريقة Round Robin ليس هدف التزامن."],"164":["✅ صحيح! تعدد الخيوط يحسن استخدام الموارد بمشاركتها بين عدة خيوط.","❌ خاطئ. الخيوط تتشارك الذاكرة فلا تزيد متطلباتها.","❌ خاطئ. تعدد الخيوط يزيد تعقيد الجدولة.","❌ خاطئ. التزامن قد يُبطئ التنفيذ لكنه ضروري."],"165":["✅ صحيح! تجمع الخيوط مجموعة خيوط جاهزة مسبقاً لتنفيذ المهام.","❌ خاطئ. تجمع الخيوط ليس موارد لخيط واحد.","❌ خاطئ. تجمع الخيوط ليس آلية للتحكم بالجمود.","❌ خاطئ. تجمع الخيوط لا يزيد عدد الخيوط بل يعيد استخدامها."],"166":["✅ صحيح! كثرة الخيوط تزيد الحمل بسبب تبديل السياق والتزامن.","❌ خاطئ. كثرة الخيوط لا تعني استخدام ذاكرة أكفأ.","❌ خاطئ. بعد حد معين، كثرة الخيوط تقلل الأداء.","❌ خاطئ. كثرة الخيوط تزيد تعقيد الإدارة."],"167":["✅ صحيح! join() تجعل الخيط المُستدعي ينتظر حتى اكتمال خيط آخر.","❌ خاطئ. start() هي التي تبدأ تنفيذ الخيط.","❌ خاطئ. join() لا تُنهي الخيط بل تنتظره.","❌ خاطئ. سلامة الوصول المشترك من وظائف أدوات التزامن مثل mutex."],"168":["✅ صحيح! التوازي يعني تنفيذ عدة خيوط فعلياً في نفس الوقت على معالجات متعددة.","❌ خاطئ. التوازي يختلف عن التزامن.","❌ خاطئ. التوازي يحتاج معالجات متعددة النوى.","❌ خاطئ. التوازي لا يلغي الحاجة للتزامن."],"169":["❌ خاطئ. Round Robin تعطي وقتاً متساوياً بدون أولويات.","✅ صحيح! جدولة الأولوية تعطي الأولوية بناءً على أهميتها ومواعيدها.","❌ خاطئ. FCFS تنفذ حسب الترتيب بدون أولويات.","❌ خاطئ. SJF تعتمد على الوقت وليس الأهمية."],"170":["❌ خاطئ. تعدد الخيوط لا يقلل استهلاك الذاكرة بشكل مباشر.","✅ صحيح! تعدد الخيوط يحسن استغلال المعالج بتنفيذ عدة خيوط.","❌ خاطئ. تعدد الخيوط لا يزيد استخدام القرص.","❌ خاطئ. تعدد الخيوط يزيد تعقيد الإدارة."],"171":["❌ خاطئ. التبديل بين مهام مختلفة وصف عام.","✅ صحيح! تبديل السياق هو حفظ حالة خيط واستعادة حالة خيط آخر.","❌ خاطئ. نقل التنفيذ بين معالجات مفهوم مختلف.","❌ خاطئ. تعيين أولويات جديدة ليس تبديل سياق."],"172":["❌ خاطئ. الخيوط تتشارك الموارد بسهولة فعلاً.","✅ صحيح! عيب الخيوط هو زيادة التعقيد بسبب التزامن وتكلفة تبديل السياق.","❌ خاطئ. الخيوط تستطيع مشاركة البيانات.","❌ خاطئ. الخيوط تستطيع التنفيذ بشكل متزامن."],"173":["✅ صحيح! الدور الأساسي لنظام التشغيل هو إدارة موارد العتاد والبرمجيات.","❌ خاطئ. توفير الترفيه ليس من أدوار نظام التشغيل.","❌ خاطئ. مضاد الفيروسات برنامج منفصل.","❌ خاطئ. تحسين سرعة الإنترنت ليس من وظائف نظام التشغيل."],"174":["❌ خاطئ. Windows 10 يدعم مستخدماً واحداً بشكل أساسي.","✅ صحيح! Linux نظام متعدد المستخدمين.","❌ خاطئ. MS-DOS نظام مستخدم واحد.","❌ خاطئ. macOS يدعم مستخدماً واحداً بشكل أساسي."],"175":["✅ صحيح! النواة هي الجزء الأساسي من نظام التشغيل الذي يدير موارد النظام.","❌ خاطئ. النواة ليست وحدة تخزين مؤقتة.","❌ خاطئ. النواة ليست برنامج ألعاب.","❌ خاطئ. النواة ليست أداة إدارة أقراص."],"176":["❌ خاطئ. Real-Time OS يوفر طبقة تجريد فوق العتاد.","❌ خاطئ. Network OS يوفر خدمات شبكية.","❌ خاطئ. Embedded OS يوفر واجهة محدودة.","✅ صحيح! Bare-metal OS يسمح بالتفاعل مباشرة مع العتاد."],"177":["❌ خاطئ. مدير الملفات ينظم الملفات.","❌ خاطئ. مدير الذاكرة يدير تخصيص الذاكرة.","✅ صحيح! مجدول المعالج (CPU Scheduler) مسؤول عن جدولة العمليات.","❌ خاطئ. برنامج التعريف يتحكم بجهاز معين."],"178":["❌ خاطئ. تخصيص الذاكرة من وظائف مدير الذاكرة.","❌ خاطئ. جدولة العمليات من وظائف المجدول.","✅ صحيح! إدارة الأجهزة مسؤولة عن التحكم بأجهزة العتاد وعمليات I/O.","❌ خاطئ. تتبع الملفات من وظائف نظام الملفات."],"179":["✅ صحيح! المعالجة متعددة النوى تسمح بتشغيل عدة خيوط على نوى مختلفة بشكل متزامن.","❌ خاطئ. الخيوط يمكنها العمل على عدة نوى.","❌ خاطئ. لا تقلل عدد الخيوط.","❌ خاطئ. لا تمنع الوصول للذاكرة المشتركة."],"180":["✅ صحيح! متصفح الويب يحمّل عدة صفحات بشكل متزامن باستخدام خيوط متعددة.","❌ خاطئ. محرر نصوص يعدل ملفاً واحداً ليس متعدد الخيوط.","❌ خاطئ. DBMS بدون استعلامات متوازية ليس مثالاً.","❌ خاطئ. مترجم ينفذ ملفاً واحداً بالتتابع ليس متعدد الخيوط."]});
@@ -0,0 +1 @@
+explanationChunk({"31":["❌ جزئياً - إدارة العمليات إحدى الوظائف فقط.","❌ جزئياً - إدارة الذاكرة إحدى الوظائف فقط.","❌ خاطئ. تنفيذ المترجم ليس وظيفة نظام التشغيل بل هو برنامج تطبيقي.","✅ صحيح! إدارة العمليات والذاكرة من وظائف نظام التشغيل (ملاحظة: تنفيذ المترجم ليس وظيفة نظام تشغيل لكن الجواب حسب البنك)."],"32":["❌ خاطئ. الصَدَفة (Shell) هي واجهة المستخدم وليست الجزء الأساسي.","✅ صحيح! النواة (Kernel) هي الجزء الأساسي في نظام التشغيل وتتحكم بجميع الموارد.","❌ خاطئ. CLI واجهة نصية وليست الجزء الأساسي.","❌ خاطئ. برنامج التعريف يتحكم بجهاز معين فقط."],"33":["❌ خاطئ. Windows 10 نظام تشغيل للأغراض العامة.","❌ خاطئ. Linux Ubuntu للأغراض العامة أيضاً.","✅ صحيح! RTOS مصمم خصيصاً للتطبيقات التي تحتاج استجابة فورية ومحددة زمنياً.","❌ خاطئ. macOS نظام للأغراض العامة."],"34":["❌ خاطئ. الترجمة من وظائف المترجم (Compiler) وليس نظام التشغيل.","✅ صحيح! الوظيفة الرئيسية لنظام التشغيل هي إدارة موارد العتاد والبرمجيات.","❌ خاطئ. تحرير المستندات وظيفة التطبيقات.","❌ خاطئ. تشغيل مضاد الفيروسات وظيفة تطبيقية."],"35":["❌ خاطئ. Round Robin تعطي كل عملية شريحة زمنية ثابتة. يكون صحيحاً عند السؤال عن Time Quantum.","❌ خاطئ. SJN تنفذ الأقصر أولاً وليس الأول وصولاً.","✅ صحيح! FCFS (أولاً يأتي أولاً يُخدم) تنفذ العمليات حسب ترتيب وصولها.","❌ خاطئ. Priority Scheduling تعتمد على الأولوية وليس ترتيب الوصول."],"36":["✅ صحيح! الترحيل (Paging) يقسم الذاكرة إلى إطارات (Frames) ثابتة الحجم والبرنامج إلى صفحات (Pages) بنفس الحجم.","❌ خاطئ. التقسيم (Segmentation) يقسم الذاكرة إلى أجزاء متفاوتة الحجم حسب المنطق.","❌ خاطئ. التخصيص المتجاور يعطي كتلة واحدة متصلة.","❌ خاطئ. التبديل (Swapping) ينقل عمليات بين الذاكرة والقرص."],"37":["✅ صحيح! PCB تحتوي على معرف العملية (PID)، عداد البرنامج (PC)، حالة العملية، والسجلات وغيرها.","❌ خاطئ. PCB تحتوي على أكثر من مجرد معرف العملية.","❌ خاطئ. PCB تحتوي على أكثر من تفاصيل الذاكرة فقط.","❌ خاطئ. PCB خاصة بعملية واحدة وليست قائمة بجميع العمليات."],"38":["❌ خاطئ. التحكم في العمليات نوع فعلي من استدعاءات النظام (fork, exit, wait).","❌ خاطئ. إدارة الذاكرة نوع فعلي من استدعاءات النظام.","❌ خاطئ. التعامل مع الملفات نوع فعلي (open, read, write, close).","✅ صحيح! تصفح الويب ليس نوعاً من استدعاءات النظام بل هو تطبيق مستخدم."],"39":["❌ خاطئ. انخفاض استغلال المعالج قد يكون نتيجة للتخبط وليس سببه.","✅ صحيح! التخبط (Thrashing) يحدث بسبب الترحيل المفرط - النظام يقضي وقتاً أكثر في تبديل الصفحات من التنفيذ الفعلي.","❌ خاطئ. الجدولة منخفضة الأولوية لا تسبب تخبطاً.","❌ خاطئ. الشريحة الزمنية الكبيرة لا تسبب تخبطاً."],"40":["✅ صحيح! fork() في UNIX ينشئ عملية جديدة (عملية ابن) نسخة من العملية الأب.","❌ خاطئ. لإنهاء عملية نستخدم exit() أو kill(). يكون صحيحاً عند السؤال عنهما.","❌ خاطئ. لتخصيص الذاكرة نستخدم malloc() أو brk().","❌ خاطئ. للتبديل بين العمليات يستخدم المجدول Context Switch."],"41":["✅ صحيح! نظام التشغيل هو مجموعة برمجيات تدير موارد العتاد وتوفر خدمات للمستخدم والتطبيقات.","❌ خاطئ. نظام التشغيل برمجية وليس مكوناً مادياً.","❌ خاطئ. نظام التشغيل ليس لغة برمجة بل نظام يدير الموارد.","❌ خاطئ. نظام إدارة قواعد البيانات (DBMS) برنامج مختلف تماماً."],"42":["❌ خاطئ. Microsoft Word تطبيق معالجة نصوص.","✅ صحيح! Windows 10 نظام تشغيل للحواسيب الشخصية من Microsoft.","❌ خاطئ. Google Chrome متصفح ويب وليس نظام تشغيل.","❌ خاطئ. Python لغة برمجة وليست نظام تشغيل."],"43":["❌ خاطئ. الصدفة (Shell) واجهة بين المستخدم ونظام التشغيل ولا تتفاعل مباشرة مع العتاد.","❌ خاطئ. البرامج التطبيقية تعمل فوق نظام التشغيل.","✅ صحيح! النواة (Kernel) هي المكون الذي يتفاعل مباشرة مع العتاد ويدير الموارد.","❌ خاطئ. نظام الملفات ينظم البيانات على القرص لكنه لا يتفاعل مباشرة مع كل العتاد."],"44":["❌ خاطئ. إدارة الذاكرة وظيفة أساسية لنظام التشغيل.","❌ خاطئ. إدارة العمليات وظيفة أساسية لنظام التشغيل.","✅ صحيح! ترجمة البرامج (Compiling) ليست وظيفة نظام التشغيل بل وظيفة المترجم (Compiler) وهو برنامج منفصل.","❌ خاطئ. إدارة نظام الملفات وظيفة أساسية لنظام التشغيل."],"45":["❌ خاطئ. نظام المشاركة الزمنية يهدف لمشاركة المعالج بين عدة مستخدمين.","❌ خاطئ. النظام الموزع يوزع المهام على عدة حواسيب.","✅ صحيح! نظام الوقت الحقيقي (Real-Time OS) مصمم لتطبيقات تحتاج استجابة محددة زمنياً كأنظمة التحكم الصناعي.","❌ خاطئ. نظام الدُفعات (Batch OS) ينفذ المهام بالتتابع بدون تفاعل."],"46":["✅ صحيح! البرمجة المتعددة (Multiprogramming) تزيد استغلال المعالج بتشغيل عدة برامج حيث ينتقل المعالج لبرنامج آخر عند انتظار I/O.","❌ خاطئ. البرمجة المتعددة تزيد عدد العمليات في الذاكرة.","❌ خاطئ. البرمجة المتعددة تحتاج ذاكرة أكثر لتحميل عدة برامج.","❌ خاطئ. تحسين وقت تنفيذ عملية واحدة ليس هدف البرمجة المتعددة."],"47":["✅ صحيح! الهدف الأساسي لنظام المشاركة الزمنية هو تقليل وقت الاستجابة بإعطاء كل مستخدم شريحة زمنية من المعالج.","❌ خاطئ. تعظيم استغلال المعالج هدف البرمجة المتعددة أكثر.","❌ خاطئ. زيادة أولوية العمليات ليس هدف المشاركة الزمنية.","❌ خاطئ. منع تجزئة الذاكرة ليس هدف المشاركة الزمنية."],"48":["❌ خاطئ. نظام المستخدم الواحد يسمح لمستخدم واحد فقط.","✅ صحيح! نظام متعدد المستخدمين (Multi-User OS) يسمح لعدة مستخدمين بالعمل على النظام في نفس الوقت.","❌ خاطئ. Real-Time OS مصمم للاستجابة الفورية وليس بالضرورة متعدد المستخدمين.","❌ خاطئ. النظام المدمج (Embedded OS) مخصص لأجهزة محددة."],"49":["❌ خاطئ. إدارة جدولة المعالج من وظائف المجدول.","✅ صحيح! برنامج تعريف الجهاز (Device Driver) يتحكم في أجهزة العتاد ويوفر واجهة بين نظام التشغيل والجهاز.","❌ خاطئ. تنظيم الملفات والأدلة من وظائف نظام الملفات.","❌ خاطئ. تخصيص الذاكرة من وظائف مدير الذاكرة."],"50":["❌ خاطئ. Windows 11 نظام مملوك لـ Microsoft.","❌ خاطئ. macOS نظام مملوك لـ Apple.","✅ صحيح! Linux نظام تشغيل مفتوح المصدر يمكن لأي شخص استخدامه وتعديله وتوزيعه مجاناً.","❌ خاطئ. iOS نظام مملوك لـ Apple."],"51":["❌ خاطئ. نظام الدفعات (Batch OS) نوع فعلي من أنظمة التشغيل.","❌ خاطئ. نظام الوقت الحقيقي نوع فعلي.","❌ خاطئ. نظام الشبكات (Network OS) نوع فعلي.","✅ صحيح! لا يوجد شيء اسمه Compiler OS - المترجم برنامج وليس نوع نظام تشغيل."],"52":["❌ خاطئ. نظام الملفات ينظم الملفات على القرص.","❌ خاطئ. مدير الذاكرة يدير تخصيص الذاكرة.","✅ صحيح! مجدول العمليات (Process Scheduler) مسؤول عن تحديد أي عملية تُنفذ ومتى.","❌ خاطئ. برنامج التعريف يتحكم بجهاز معين."],"53":["❌ خاطئ. مساحة الذاكرة الكبيرة ليست هدف جدولة المشاركة الزمنية.","✅ صحيح! في نظام المشاركة الزمنية، تتم الجدولة لتوفير وقت استجابة سريع للمستخدمين.","❌ خاطئ. الإنتاجية العالية هدف لكنها ليست الهدف الرئيسي للمشاركة الزمنية.","❌ خاطئ. استهلاك الطاقة المنخفض ليس هدف هذا النوع."],"54":["❌ خاطئ. Linux مبني على معمارية UNIX (نواة مشابهة).","✅ صحيح! Windows ليس مبنياً على UNIX بل له معمارية خاصة (NT Kernel).","❌ خاطئ. macOS مبني على Darwin وهو مبني على UNIX (BSD).","❌ خاطئ. Android مبني على نواة Linux المشابهة لـ UNIX."],"55":["✅ صحيح! مجدول العمليات (Process Scheduler) هو المكون المسؤول عن إدارة العمليات وجدولتها.","❌ خاطئ. CLI واجهة لتلقي أوامر المستخدم وليست لإدارة العمليات.","❌ خاطئ. المجمّع (Assembler) يحول لغة التجميع لكود الآلة.","❌ خاطئ. الرابط (Linker) يربط ملفات الكود المترجمة معاً."],"56":["❌ خاطئ. MS-DOS نظام مستخدم واحد.","❌ خاطئ. Windows XP يدعم مستخدمين لكنه ليس متعدد المستخدمين بالمعنى التقليدي.","✅ صحيح! UNIX نظام تشغيل متعدد المستخدمين يسمح لعدة مستخدمين بالعمل في نفس الوقت عبر طرفيات مختلفة.","❌ خاطئ. Android مصمم لمستخدم واحد على الجهاز."],"57":["❌ خاطئ. المقاطعة لا تزيد سرعة المعالج.","✅ صحيح! المقاطعة (Interrupt) تُستخدم لإعلام المعالج بأحداث مثل اكتمال عملية إدخال/إخراج أو طلب من جهاز.","❌ خاطئ. المقاطعة لا تحسن وقت الوصول للقرص مباشرة.","❌ خاطئ. تخصيص الذاكرة الديناميكي ليس من وظائف المقاطعة."],"58":["❌ خاطئ. الافتراضية (Virtualization) تشغيل عدة أنظمة على نفس العتاد وليس مجرد عدة برامج.","✅ صحيح! البرمجة المتعددة (Multiprogramming) تسمح بتشغيل عدة برامج في نفس الوقت عبر تبديل المعالج بينها.","❌ خاطئ. التنقيح (Debugging) عملية إصلاح الأخطاء في البرامج.","❌ خاطئ. التشفير (Encryption) حماية البيانات وليس تشغيل عدة برامج."],"59":["❌ خاطئ. النواة تتفاعل مع العتاد وليس المستخدم مباشرة.","✅ صحيح! الصدفة (Shell) هي الجزء الذي يتفاعل مع المستخدم سواء كانت نصية (CLI) أو رسومية (GUI).","❌ خاطئ. مدير الذاكرة يعمل في الخلفية ولا يتفاعل مع المستخدم.","❌ خاطئ. جدول العمليات بنية بيانات داخلية."],"60":["✅ صحيح! محمل الإقلاع (Bootloader) مسؤول عن تحميل نظام التشغيل في الذاكرة عند تشغيل الحاسوب.","❌ خاطئ. إدارة العمليات تبدأ بعد تحميل النظام.","❌ خاطئ. معالجة أوامر المستخدم من وظائف الصدفة.","❌ خاطئ. التحكم في نظام الملفات يبدأ بعد الإقلاع."]});
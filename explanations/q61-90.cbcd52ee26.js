@@ -0,0 +1 @@
+explanationChunk({"61":["✅ صحيح! العملية (Process) هي برنامج قيد التنفيذ، تشمل الكود والبيانات والمكدس وعداد البرنامج.","❌ خاطئ. التعليمة الواحدة جزء من البرنامج وليست عملية.","❌ خاطئ. طلب استدعاء النظام آلية اتصال وليس عملية.","❌ خاطئ. تقنية إدارة الذاكرة شيء مختلف عن العملية."],"62":["❌ خاطئ. Ready حالة فعلية - العملية جاهزة للتنفيذ.","❌ خاطئ. Running حالة فعلية - العملية تُنفذ حالياً.","❌ خاطئ. Terminated حالة فعلية - العملية انتهت.","✅ صحيح! Queued ليست حالة قياسية للعمليات. الحالات القياسية هي: New, Ready, Running, Waiting, Terminated."],"63":["❌ خاطئ. FCFS تنفذ حسب ترتيب الوصول وليس أقصر وقت.","✅ صحيح! SJN (أقصر عمل أولاً) تختار العملية ذات أقصر وقت تنفيذ (Burst Time) وتنفذها أولاً.","❌ خاطئ. Round Robin تعطي شرائح زمنية متساوية.","❌ خاطئ. Priority Scheduling تعتمد على الأولوية وليس وقت التنفيذ."],"64":["❌ خاطئ. جدولة الأولوية قد تسبب مجاعة للعمليات منخفضة الأولوية.","❌ خاطئ. SJN قد تسبب مجاعة للعمليات الطويلة.","✅ صحيح! Round Robin تمنع المجاعة لأنها تعطي كل عملية شريحة زمنية متساوية، فلا تُحرم أي عملية من المعالج.","❌ خاطئ. FCFS لا تسبب مجاعة لكنها تعاني من تأثير القافلة."],"65":["❌ خاطئ. لإنهاء عملية نستخدم exit() أو kill().","✅ صحيح! fork() ينشئ عملية جديدة (ابن) نسخة من العملية الأصلية (الأب) في UNIX.","❌ خاطئ. تخصيص الذاكرة يتم عبر malloc() وليس fork().","❌ خاطئ. لتنفيذ أمر جديد نستخدم exec() بعد fork()."],"66":["✅ صحيح! الترحيل (Paging) يسمح بتخصيص ذاكرة غير متجاورة للعمليات عبر تقسيمها إلى صفحات.","❌ خاطئ. التخصيص المتجاور يعطي كتلة واحدة متصلة بالتعريف.","❌ خاطئ. التبديل (Swapping) ينقل العملية كاملة وليس أجزاء منها.","❌ خاطئ. التجزئة مشكلة وليست تقنية تخصيص."],"67":["✅ صحيح! التخصيص المتجاور يسبب تجزئة خارجية (External Fragmentation) بسبب الفراغات بين الكتل المخصصة.","❌ خاطئ. مجاعة العمليات مشكلة جدولة وليست مشكلة تخصيص ذاكرة.","❌ خاطئ. الجمود مشكلة تزامن وليست مشكلة تخصيص ذاكرة.","❌ خاطئ. أخطاء الصفحات مشكلة ذاكرة افتراضية وليست تخصيص متجاور."],"68":["❌ خاطئ. الترحيل تقنية إدارة ذاكرة فعلاً.","❌ خاطئ. التقسيم تقنية إدارة ذاكرة فعلاً.","✅ صحيح! جدولة المعالج (CPU Scheduling) ليست تقنية إدارة ذاكرة بل تقنية إدارة العمليات.","❌ خاطئ. التبديل تقنية إدارة ذاكرة فعلاً."],"69":["❌ خاطئ. الذاكرة الافتراضية لا تزيد حجم RAM الفعلي بل تحاكي ذاكرة أكبر.","✅ صحيح! الذاكرة الافتراضية تسمح بتنفيذ برامج أكبر من الذاكرة الفيزيائية عبر استخدام القرص كامتداد.","❌ خاطئ. تقليل حمل المعالج ليس الغرض الرئيسي.","❌ خاطئ. الذاكرة الافتراضية تزيد استخدام القرص ولا تنقصه."],"70":["❌ خاطئ. قلة استغلال المعالج قد تكون نتيجة للتخبط وليس سببه.","✅ صحيح! التخبط يحدث عندما تحدث أخطاء صفحات بتكرار عالٍ فيقضي النظام معظم وقته في تبديل الصفحات.","❌ خاطئ. تنفيذ العمليات بدون انتظار حالة طبيعية.","❌ خاطئ. زيادة حجم RAM تقلل التخبط ولا تسببه."],"71":["❌ خاطئ. ext4 نظام ملفات Linux.","✅ صحيح! NTFS (New Technology File System) هو نظام الملفات الرئيسي المستخدم في أنظمة Windows.","❌ خاطئ. HFS+ نظام ملفات macOS القديم.","❌ خاطئ. ZFS نظام ملفات متقدم يُستخدم في Solaris وFreeBSD."],"72":["❌ خاطئ. إدارة صلاحيات المستخدمين من وظائف نظام الأمان.","✅ صحيح! الدليل (Directory) يُستخدم لتخزين البيانات الوصفية عن الملفات مثل الاسم والموقع والحجم.","❌ خاطئ. التحكم ببرامج التعريف من وظائف مدير الأجهزة.","❌ خاطئ. تخصيص الذاكرة من وظائف مدير الذاكرة."],"73":["❌ خاطئ. الامتداد لا يحدد اسم الملف.","❌ خاطئ. الامتداد لا يحدد حجم الملف.","✅ صحيح! امتداد الملف يحدد نوع الملف والبرنامج المرتبط به (مثل .txt للنصوص و.exe للتنفيذ).","❌ خاطئ. الامتداد لا يخصص مساحة القرص."],"74":["❌ خاطئ. التخصيص المتجاور يعاني من التجزئة الخارجية.","❌ خاطئ. التخصيص المتصل يعاني من بطء الوصول العشوائي.","✅ صحيح! التخصيص المفهرس (Indexed) يقلل التجزئة باستخدام كتلة فهرس تشير لجميع كتل الملف.","❌ خاطئ. التعيين المباشر ليس طريقة تخصيص ملفات قياسية."],"75":["✅ صحيح! الـ inode يخزن صلاحيات الملف وحجمه والبيانات الوصفية ومواقع كتل البيانات على القرص.","❌ خاطئ. زيادة سرعة التخزين ليست وظيفة الـ inode.","❌ خاطئ. جدولة القرص من وظائف مجدول I/O.","❌ خاطئ. تشفير الملفات ليس من وظائف الـ inode."],"76":["✅ صحيح! الشروط الأربعة للجمود: الاستبعاد المتبادل، الاحتفاظ والانتظار، عدم الاستباق، والانتظار الدائري.","❌ خاطئ. هذه مفاهيم مختلفة وليست شروط الجمود.","❌ خاطئ. هذه مفاهيم مختلفة لا تمثل شروط الجمود.","❌ خاطئ. هذه مفاهيم متنوعة وليست شروط الجمود."],"77":["✅ صحيح! يمكن منع الجمود بتجنب الانتظار الدائري (Circular Wait) عبر ترتيب طلب الموارد.","❌ خاطئ. السماح بالاحتفاظ بعدة موارد يزيد احتمالية الجمود.","❌ خاطئ. زيادة أولوية الجدولة لا تمنع الجمود.","❌ خاطئ. الترحيل تقنية ذاكرة وليست لمنع الجمود."],"78":["✅ صحيح! رسم تخصيص الموارد (RAG) يساعد في تحديد الانتظار الدائري الذي يدل على وجود جمود.","❌ خاطئ. RAG لا يحسن كفاءة نظام الملفات.","❌ خاطئ. RAG ليس لجدولة العمليات.","❌ خاطئ. RAG ليس لتخصيص الذاكرة."],"79":["❌ جزئياً صحيح - المنع إحدى التقنيات فقط.","❌ جزئياً صحيح - التجنب إحدى التقنيات فقط.","❌ جزئياً صحيح - الكشف والاستعادة إحدى التقنيات فقط.","✅ صحيح! جميع التقنيات المذكورة (المنع، التجنب، الكشف والاستعادة) تُستخدم للتعامل مع الجمود."],"80":["✅ صحيح! خوارزمية المصرفي (Banker's Algorithm) تُستخدم لتجنب الجمود عبر التحقق من أن النظام في حالة آمنة قبل تخصيص الموارد.","❌ خاطئ. جدولة المعالج تستخدم خوارزميات أخرى مثل RR وSJN.","❌ خاطئ. جدولة القرص تستخدم FCFS وSSTF وSCAN.","❌ خاطئ. تخصيص الذاكرة يستخدم First Fit وBest Fit."],"81":["❌ خاطئ. لوحة المفاتيح جهاز محرفي (Character device). يكون صحيحاً عند السؤال عن أجهزة المحارف.","❌ خاطئ. الطابعة عادة جهاز محرفي.","✅ صحيح! القرص الصلب جهاز كتلي (Block device) لأنه يقرأ ويكتب البيانات في كتل.","❌ خاطئ. الفأرة جهاز محرفي."],"82":["✅ صحيح! التخزين المؤقت (Spooling) يزيد كفاءة عمليات I/O بتخزين البيانات مؤقتاً (مثل طابور الطباعة).","❌ خاطئ. Spooling لا يدير جدولة المعالج.","❌ خاطئ. Spooling لا يقلل تجزئة الذاكرة.","❌ خاطئ. Spooling لا يمنع الجمود."],"83":["❌ خاطئ. FCFS تخدم الطلبات حسب ترتيب وصولها وليس الأقرب.","✅ صحيح! SSTF (أقصر وقت بحث أولاً) تختار الطلب الأقرب لموقع الرأس الحالي فتقلل وقت البحث.","❌ خاطئ. Round Robin خوارزمية جدولة عمليات وليست جدولة أقراص.","❌ خاطئ. LRU خوارزمية استبدال صفحات وليست جدولة أقراص."],"84":["❌ خاطئ. القرص الصلب جهاز كتلي يقرأ كتلاً من البيانات.","❌ خاطئ. SSD جهاز كتلي.","❌ خاطئ. الطابعة قد تكون محرفية لكن ليست الجواب هنا.","✅ صحيح! لوحة المفاتيح جهاز محرفي (Character device) لأنها ترسل البيانات محرفاً بمحرف."],"85":["✅ صحيح! DMA يسمح للأجهزة بنقل البيانات مباشرة من/إلى الذاكرة بدون تدخل المعالج، مما يحرره لمهام أخرى.","❌ خاطئ. DMA لا يحسن جدولة المعالج.","❌ خاطئ. DMA لا يحسن أداء نظام الملفات مباشرة.","❌ خاطئ. DMA لا يكشف الجمود."],"86":["✅ صحيح! الهدف الرئيسي لأمن نظام التشغيل هو منع الوصول غير المصرح به لحماية البيانات والموارد.","❌ خاطئ. تحسين أداء المعالج ليس من أهداف الأمن.","❌ خاطئ. تقليل تجزئة الذاكرة من وظائف إدارة الذاكرة.","❌ خاطئ. زيادة كفاءة الجدولة من وظائف المجدول."],"87":["✅ صحيح! جدار الحماية (Firewall) يمنع الوصول غير المصرح به للشبكة بفلترة حركة البيانات.","❌ خاطئ. جدولة المعالج ليست من وظائف جدار الحماية.","❌ خاطئ. منع أخطاء الصفحات من وظائف إدارة الذاكرة.","❌ خاطئ. تخصيص الذاكرة ليس من وظائف جدار الحماية."],"88":["❌ خاطئ. FCFS تنفذ حسب ترتيب الوصول بدون شرائح زمنية.","❌ خاطئ. SJN تنفذ الأقصر أولاً بدون شرائح زمنية.","✅ صحيح! Round Robin تعطي كل عملية شريحة زمنية ثابتة (Time Quantum) ثم تنتقل للتالية في طابور دائري.","❌ خاطئ. Priority Scheduling تعتمد على الأولوية وليس شرائح زمنية."],"89":["✅ صحيح! في الجدولة الاستباقية، يمكن مقاطعة العملية الجارية ونقلها لطابور الاستعداد لتنفيذ عملية أخرى ذات أولوية أعلى.","❌ خاطئ. هذا وصف الجدولة غير الاستباقية (Non-preemptive).","❌ خاطئ. الأولوية قابلة للتغيير وليست دائمة.","❌ خاطئ. العملية لا تُمنع من المعالج بل تُقاطع مؤقتاً."],"90":["❌ خاطئ. Round Robin للأغراض العامة وليس حصرياً للوقت الحقيقي.","❌ خاطئ. SRTF جيدة لتقليل وقت الانتظار لكنها ليست الأنسب لأنظمة الوقت الحقيقي.","✅ صحيح! EDF (أقرب موعد نهائي أولاً) مصممة خصيصاً لأنظمة الوقت الحقيقي حيث تعطي الأولوية للمهام ذات المواعيد الأقرب.","❌ خاطئ. Multilevel Feedback Queue للأغراض العامة."]});
@@ -0,0 +1 @@
+explanationChunk({"91":["✅ صحيح! الذاكرة الافتراضية هي جزء من القرص الصلب يُستخدم كامتداد للذاكرة RAM.","❌ خاطئ. ROM ذاكرة قراءة فقط وليست ذاكرة افتراضية.","❌ خاطئ. ذاكرة التخزين المؤقت (Cache) جزء من المعالج.","❌ خاطئ. الذاكرة الافتراضية مفهوم برمجي وليست ميزة عتادية."],"92":["❌ خاطئ. الترحيل يقلل التجزئة الخارجية ولا يزيدها.","✅ صحيح! عيب الترحيل هو التخبط (Thrashing) عند التحميل الزائد.","❌ خاطئ. الترحيل لا يحتاج تخصيص متجاور.","❌ خاطئ. الترحيل لا يزيد وقت التنفيذ بشكل مباشر."],"93":["✅ صحيح! خطأ الصفحة يحدث عندما تحاول العملية الوصول لصفحة غير موجودة في الذاكرة الفيزيائية.","❌ خاطئ. نفاد الذاكرة مشكلة مختلفة عن خطأ الصفحة.","❌ خاطئ. التحميل الزائد للمعالج لا يسمى خطأ صفحة.","❌ خاطئ. فشل جدولة القرص مشكلة مختلفة."],"94":["❌ خاطئ. العملية لا تعود مباشرة للتنفيذ بل تنتظر في طابور الاستعداد.","✅ صحيح! بعد اكتمال خدمة I/O، تنتقل العملية لحالة الاستعداد (Ready).","❌ خاطئ. العملية كانت بالفعل في حالة الانتظار.","❌ خاطئ. العملية لم تنتهِ بل تحتاج استكمال التنفيذ."],"95":["✅ صحيح! حالة السباق (Race Condition) تحدث عندما تصل عدة عمليات لنفس البيانات بشكل متزامن والنتيجة تعتمد على ترتيب الوصول.","❌ خاطئ. أجزاء الذاكرة المشتركة آلية اتصال وليست المشكلة.","❌ خاطئ. قسم الدخول جزء من حل المشكلة وليس المشكلة.","❌ خاطئ. تزامن العمليات هو الحل وليس المشكلة."],"96":["❌ خاطئ. القسم الحرج مفهوم وليس أداة تزامن.","❌ خاطئ. الأنبوب (Pipe) أداة اتصال وليس تزامن.","✅ صحيح! الإشارة (Semaphore) أداة تزامن للتحكم في الوصول للموارد المشتركة.","❌ خاطئ. الجمود مشكلة وليس أداة تزامن."],"97":["❌ خاطئ. العنوان الفيزيائي هو عنوان الذاكرة الفعلي.","❌ خاطئ. العنوان المطلق مصطلح آخر للعنوان الفيزيائي.","✅ صحيح! العنوان المنطقي (Logical Address) هو ما ينشئه المعالج ويُحوّل لعنوان فيزيائي عبر MMU.","❌ خاطئ. الجواب الثالث هو الصحيح."],"98":["❌ جزئياً صحيح - الاستبعاد المتبادل شرط واحد فقط.","❌ جزئياً صحيح - التقدم شرط واحد فقط.","❌ جزئياً صحيح - الانتظار المحدود شرط واحد فقط.","✅ صحيح! المتطلبات هي: الاستبعاد المتبادل، التقدم، والانتظار المحدود."],"99":["❌ خاطئ. وجود دورة لا يعني بالضرورة وجود جمود إذا كانت الموارد متعددة النسخ.","✅ صحيح! العبارة خاطئة - وجود دورة شرط ضروري لكنه ليس كافياً دائماً."],"100":["❌ خاطئ. العبارة غير صحيحة.","✅ صحيح! العبارة خاطئة - التشغيل ثنائي الوضع يسمح لنظام التشغيل بحماية نفسه."],"101":["✅ صحيح! الخيط (Thread) هو وحدة تنفيذ خفيفة الوزن داخل العملية.","❌ خاطئ. وحدة تخزين الذاكرة ليست خيطاً.","❌ خاطئ. الخيط ليس مكوناً لنظام الملفات.","❌ خاطئ. الخيط ليس نوعاً من الذاكرة الافتراضية."],"102":["✅ صحيح! الخيوط المتعددة تتشارك نفس موارد العملية (الذاكرة، الملفات المفتوحة).","❌ خاطئ. الخيوط يمكن أن تعمل على نفس المعالج أو معالجات مختلفة.","❌ خاطئ. الخيوط تستطيع التواصل عبر الذاكرة المشتركة.","❌ خاطئ. الخيوط تتشارك نفس مساحة الذاكرة."],"103":["✅ صحيح! كلمات المرور (Passwords) هي أكثر طرق المصادقة شيوعاً.","❌ خاطئ. تجزئة الملفات مفهوم تخزين وليس مصادقة.","❌ خاطئ. التخبط مشكلة ذاكرة وليس طريقة مصادقة.","❌ خاطئ. الذاكرة الافتراضية تقنية إدارة ذاكرة."],"104":["✅ صحيح! قوائم التحكم في الوصول (ACL) تُحدد صلاحيات الوصول للملفات.","❌ خاطئ. ACL ليست لكشف الجمود.","❌ خاطئ. ACL ليست لجدولة العمليات.","❌ خاطئ. ACL ليست لإدارة الذاكرة."],"105":["❌ خاطئ. SJN تعاني من المجاعة وليس تأثير القافلة.","❌ خاطئ. Round Robin تعطي شرائح زمنية متساوية.","✅ صحيح! FCFS تعاني من تأثير القافلة عندما تحجز عملية طويلة المعالج.","❌ خاطئ. الجدولة متعددة المستويات لا تعاني من القافلة بنفس الطريقة."],"106":["❌ خاطئ. FCFS تنفذ حسب ترتيب الوصول.","✅ صحيح! SJN تنفذ العملية ذات أقصر وقت تنفيذ أولاً.","❌ خاطئ. Round Robin تعطي شرائح زمنية.","❌ خاطئ. Priority Scheduling تعتمد على الأولوية."],"107":["❌ خاطئ. FIFO بسيطة لكن قد تستبدل صفحات مهمة.","✅ صحيح! LRU تُستخدم في معظم أنظمة التشغيل الحديثة لأنها تقترب من الأداء المثالي.","❌ خاطئ. OPT مثالية نظرياً لكن صعبة التطبيق.","❌ خاطئ. Round Robin خوارزمية جدولة وليست استبدال صفحات."],"108":["✅ صحيح! الترحيل عند الطلب يحمّل الصفحات فقط عند الحاجة لتوفير الذاكرة.","❌ خاطئ. التخصيص المسبق عكس مفهوم الترحيل عند الطلب.","❌ خاطئ. تقليل حمل المعالج ليس هدف الترحيل عند الطلب.","❌ خاطئ. تخزين الملفات ليس وظيفة الترحيل عند الطلب."],"109":["❌ خاطئ. الكومة (Heap) تحتوي على الذاكرة المخصصة ديناميكياً.","❌ خاطئ. المكدس (Stack) يحتوي على المتغيرات المحلية.","✅ صحيح! قسم البيانات (Data Section) يحتوي على المتغيرات العامة.","❌ خاطئ. قسم النص (Text Section) يحتوي على كود البرنامج."],"110":["✅ صحيح! التبديل (Swapping) هو نسخ العملية من الذاكرة إلى القرص.","❌ خاطئ. الجمود مشكلة تزامن وليس عملية نقل.","❌ خاطئ. الترحيل عند الطلب يحمّل صفحات محددة وليس عمليات كاملة.","❌ خاطئ. خطأ الصفحة حدث وليس عملية نقل."],"111":["❌ خاطئ. النواة تبقى في الذاكرة طوال الجلسة.","✅ صحيح! العبارة خاطئة - في الأنظمة الحديثة النواة تتكون من وحدات قابلة للتحميل.","❌ خاطئ. النواة أول جزء يُحمّل أثناء الإقلاع.","❌ خاطئ. النواة هي النواة المركزية لنظام التشغيل."],"112":["✅ صحيح! PCB بنية بيانات تخزن معلومات العملية مثل المعرف والحالة والسجلات.","❌ خاطئ. PCB ليست آلية للتحكم بأجهزة I/O.","❌ خاطئ. PCB ليست ميزة أمان.","❌ خاطئ. PCB ليست نظام إدارة ملفات."],"113":["✅ صحيح! الذاكرة الافتراضية توفر ذاكرة إضافية باستخدام مساحة القرص.","❌ خاطئ. إعدادات العتاد تُخزن في BIOS/UEFI.","❌ خاطئ. تحسين الواجهة ليس من وظائف الذاكرة الافتراضية.","❌ خاطئ. إدارة الشبكة من وظائف نظام الشبكات."],"114":["✅ صحيح! كل خيط يحتاج مكدس منفصل لتتبع استدعاءات الدوال.","❌ خاطئ. العبارة صحيحة - المكدسات المنفصلة ضرورية."],"115":["✅ صحيح! النواة (Kernel) تعمل في جميع الأوقات على الحاسوب.","❌ خاطئ. العبارة صحيحة - النواة تعمل باستمرار منذ الإقلاع."],"116":["❌ خاطئ. الترحيل يحل التجزئة الداخلية.","❌ خاطئ. التقسيم قد يزيد التجزئة الخارجية.","✅ صحيح! الضغط (Compaction) يحل التجزئة الخارجية بتجميع المساحات الفارغة.","❌ خاطئ. التبديل ينقل عمليات كاملة ولا يحل التجزئة."],"117":["❌ خاطئ. إدارة التخصيص الديناميكي من وظائف مدير الذاكرة.","❌ خاطئ. خوارزميات استبدال الصفحات لا تزيد سرعة المعالج.","✅ صحيح! الهدف هو تقليل أخطاء الصفحات باختيار أفضل صفحة للاستبدال.","❌ خاطئ. الصفحات في الذاكرة مؤقتة وليست دائمة."],"118":["❌ خاطئ. FIFO بسيطة لكنها ليست مثالية.","❌ خاطئ. LRU جيدة لكنها ليست مثالية نظرياً.","✅ صحيح! OPT تستبدل الصفحة التي لن تُستخدم لأطول فترة - مثالية نظرياً.","❌ خاطئ. LFU ليست مثالية."],"119":["✅ صحيح! جدول الصفحات يربط بين العناوين المنطقية والفيزيائية.","❌ خاطئ. معلومات التحكم بالعمليات مخزنة في PCB.","❌ خاطئ. تخصيص موارد المعالج من وظائف المجدول.","❌ خاطئ. إدارة عمليات I/O من وظائف مدير الإدخال/الإخراج."],"120":["✅ صحيح! التخبط يحدث عندما تقضي العملية وقتاً في تبديل الصفحات أكثر من التنفيذ.","❌ خاطئ. عدم كفاءة جدولة المعالج مشكلة أخرى.","❌ خاطئ. كثرة العمليات قد تسبب التخبط لكنها ليست التعريف.","❌ خاطئ. نفاد مساحة القرص مشكلة مختلفة."]});
@@ -1,11 +1,23 @@
 import json
+import os
 
-with open("questions.json", "r", encoding="utf-8") as f:
-    data = json.load(f)
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
-with open("questions_data.js", "w", encoding="utf-8") as f:
-    f.write("const QUESTIONS_DATA = ")
-    json.dump(data, f, ensure_ascii=True)
-    f.write(";")
+def gen_data(questions=None):
+    """Write questions_data.js (QUESTIONS_DATA global for file:// pages)"""
+    if questions is None:
+        with open(os.path.join(SCRIPT_DIR, "questions.json"), "r", encoding="utf-8") as f:
+            questions = json.load(f)
 
-print(f"Done! Created questions_data.js with {len(data)} questions")
+    with open(os.path.join(SCRIPT_DIR, "questions_data.js"), "w", encoding="utf-8") as f:
+        f.write("const QUESTIONS_DATA = ")
+        json.dump(questions, f, ensure_ascii=True)
+        f.write(";")
+    return len(questions)
+
+def main():
+    count = gen_data()
+    print(f"Done! Created questions_data.js with {count} questions")
+
+if __name__ == "__main__":
+    main()
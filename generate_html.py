@@ -1,8 +1,17 @@
 #!/usr/bin/env python3
-"""Generate OS Quiz HTML from questions.json"""
-import json, os, html
+"""Generate OS Quiz HTML from questions.json
+
+The page is a static shell, two content-hashed assets (assets/quiz.<hash>.css
+and .js) and an inline data script of per-question fragments (data,
+explanations, tooltip). os_quiz.html and each asset are only rewritten when
+their bytes change, and hashed assets the page no longer references are
+removed from assets/.
+"""
+import hashlib, json, os, html, re
+from topic_index import TopicIndex
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSET_DIR = os.path.join(SCRIPT_DIR, 'assets')
 
 # Topic classification by question ID
 TOPIC_MAP = {
@@ -19,184 +28,69 @@ TOPIC_MAP = {
     "استدعاءات النظام": [38,39],
 }
 
+# English names accepted by TOPIC_INDEX.query / select
+TOPIC_ALIASES = {
+    "Basics": "أساسيات نظام التشغيل",
+    "Processes": "إدارة العمليات",
+    "Scheduling": "جدولة المعالج",
+    "Memory": "إدارة الذاكرة",
+    "File Systems": "أنظمة الملفات",
+    "Deadlock": "الجمود (Deadlock)",
+    "Threads": "الخيوط (Threads)",
+    "Synchronization": "التزامن (Synchronization)",
+    "I/O": "الإدخال/الإخراج والأجهزة",
+    "Security": "الأمن والحماية",
+    "System Calls": "استدعاءات النظام",
+}
+
+DEFAULT_TOPIC = "أساسيات نظام التشغيل"
+
+def _bank_ids():
+    """Question IDs of questions.json (none before the bank is parsed)"""
+    try:
+        with open(os.path.join(SCRIPT_DIR, 'questions.json'), 'r', encoding='utf-8') as f:
+            return [q['id'] for q in json.load(f)]
+    except FileNotFoundError:
+        return []
+
+# questions no topic lists are indexed under DEFAULT_TOPIC
+TOPIC_INDEX = TopicIndex(TOPIC_MAP, default=DEFAULT_TOPIC, aliases=TOPIC_ALIASES, ids=_bank_ids())
+
 def get_topic(qid):
-    for topic, ids in TOPIC_MAP.items():
-        if qid in ids:
-            return topic
-    return "أساسيات نظام التشغيل"
+    """Primary (first listed) topic of a question"""
+    return TOPIC_INDEX.primary(qid)
+
+def get_topics(qid):
+    """Every topic a question is listed under"""
+    return list(TOPIC_INDEX.topics_of(qid))
 
 def load_questions():
     with open(os.path.join(SCRIPT_DIR, 'questions.json'), 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def generate():
-    questions = load_questions()
-    
-    # Build JS data
-    js_questions = []
-    for q in questions:
-        topic = get_topic(q['id'])
-        opts_js = []
-        for o in q['options']:
-            opts_js.append({
-                't': o['text'],
-                'c': o['correct']
-            })
-        js_questions.append({
-            'id': q['id'],
-            'q': q['text'],
-            'topic': topic,
-            'opts': opts_js
-        })
-    
-    questions_json = json.dumps(js_questions, ensure_ascii=False)
-    
-    html_content = f'''<!DOCTYPE html>
+def load_explanations(questions):
+    """Explanations per question and Arabic tooltips.
+
+    Detailed explanations from add_explanations, add_exp_31_90 and
+    add_exp_91_180 where written, the generic correct/wrong text otherwise.
+    """
+    import add_explanations, add_exp_31_90, add_exp_91_180
+    explanations = add_explanations.get_all_explanations(questions)
+    for detailed in (add_exp_31_90.D, add_exp_91_180.D):
+        for qid, exps in detailed.items():
+            if qid in explanations and not add_explanations.DETAILED.get(qid):
+                explanations[qid] = exps
+    return explanations, add_explanations.QAR
+
+SHELL = '''<!DOCTYPE html>
 <html lang="ar" dir="rtl">
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">
 <title>بنك أسئلة نظم التشغيل - 180 سؤال</title>
 <link rel="preconnect" href="https://fonts.googleapis.com">
-<link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&family=Tajawal:wght@400;500;700;800&display=swap" rel="stylesheet">
-<style>
-*,*::before,*::after{{box-sizing:border-box;margin:0;padding:0}}
-:root{{
---bg:#0f0f1a;--bg2:#1a1a2e;--bg3:#25253d;--card:#1e1e35;--card-hover:#252545;
---text:#e8e8f0;--text2:#a0a0c0;--text3:#707090;
---accent:#7c5cfc;--accent2:#a78bfa;--accent-glow:rgba(124,92,252,0.3);
---correct:#10b981;--correct-bg:rgba(16,185,129,0.15);--correct-border:rgba(16,185,129,0.4);
---wrong:#ef4444;--wrong-bg:rgba(239,68,68,0.15);--wrong-border:rgba(239,68,68,0.4);
---bookmark-red:#ef4444;--bookmark-yellow:#f59e0b;--bookmark-green:#10b981;--bookmark-blue:#3b82f6;
---radius:12px;--radius-sm:8px;--shadow:0 4px 24px rgba(0,0,0,0.3);
---font-ar:'Tajawal',sans-serif;--font-en:'Inter',sans-serif;
-}}
-[data-theme="light"]{{
---bg:#f0f0f8;--bg2:#e8e8f2;--bg3:#dddde8;--card:#ffffff;--card-hover:#f5f5ff;
---text:#1a1a2e;--text2:#4a4a6a;--text3:#8a8aa0;
---shadow:0 4px 24px rgba(0,0,0,0.08);
-}}
-html{{scroll-behavior:smooth}}
-body{{font-family:var(--font-ar);background:var(--bg);color:var(--text);line-height:1.7;transition:all .3s}}
-.en{{font-family:var(--font-en);direction:ltr;text-align:left}}
-
-/* HEADER */
-.header{{position:sticky;top:0;z-index:100;background:var(--bg2);border-bottom:1px solid var(--bg3);padding:12px 20px;backdrop-filter:blur(12px)}}
-.header-top{{display:flex;align-items:center;justify-content:space-between;gap:12px;flex-wrap:wrap}}
-.header h1{{font-size:1.2rem;font-weight:800;background:linear-gradient(135deg,var(--accent),var(--accent2));-webkit-background-clip:text;-webkit-text-fill-color:transparent}}
-.header-btns{{display:flex;gap:6px;flex-wrap:wrap}}
-.btn{{padding:6px 14px;border:1px solid var(--bg3);border-radius:var(--radius-sm);background:var(--bg3);color:var(--text);cursor:pointer;font-family:var(--font-ar);font-size:.82rem;transition:all .2s;white-space:nowrap}}
-.btn:hover{{background:var(--accent);border-color:var(--accent);color:#fff}}
-.btn.active{{background:var(--accent);border-color:var(--accent);color:#fff}}
-.btn-danger{{border-color:var(--wrong);color:var(--wrong)}}
-.btn-danger:hover{{background:var(--wrong);color:#fff}}
-
-/* PROGRESS */
-.progress-wrap{{margin-top:10px}}
-.progress-bar{{height:8px;background:var(--bg3);border-radius:99px;overflow:hidden}}
-.progress-fill{{height:100%;background:linear-gradient(90deg,var(--accent),var(--accent2));border-radius:99px;transition:width .4s ease;width:0%}}
-.progress-text{{font-size:.8rem;color:var(--text2);margin-top:4px;display:flex;justify-content:space-between}}
-
-/* FILTER BAR */
-.filter-bar{{position:sticky;top:72px;z-index:90;background:var(--bg);padding:10px 20px;display:flex;gap:6px;flex-wrap:wrap;border-bottom:1px solid var(--bg3)}}
-.filter-bar .btn{{font-size:.78rem;padding:5px 12px}}
-.bookmark-dot{{width:10px;height:10px;border-radius:50%;display:inline-block;margin-inline-end:4px;vertical-align:middle}}
-
-/* SIDEBAR NAV */
-.sidebar{{position:fixed;left:0;top:0;bottom:0;width:60px;background:var(--bg2);border-right:1px solid var(--bg3);z-index:80;overflow-y:auto;padding:80px 6px 20px;transition:width .3s;scrollbar-width:thin}}
-.sidebar::-webkit-scrollbar{{width:4px}}
-.sidebar::-webkit-scrollbar-thumb{{background:var(--bg3);border-radius:9px}}
-.sidebar.expanded{{width:220px}}
-.nav-btn{{width:100%;aspect-ratio:1;border:none;border-radius:var(--radius-sm);font-size:.7rem;font-weight:700;cursor:pointer;margin-bottom:3px;position:relative;transition:all .2s;display:flex;align-items:center;justify-content:center;background:var(--bg3);color:var(--text2)}}
-.nav-btn:hover{{transform:scale(1.1);z-index:2}}
-.nav-btn.answered-correct{{background:var(--correct-bg);color:var(--correct);border:1px solid var(--correct-border)}}
-.nav-btn.answered-wrong{{background:var(--wrong-bg);color:var(--wrong);border:1px solid var(--wrong-border)}}
-.nav-btn .bm-indicator{{position:absolute;top:2px;right:2px;width:8px;height:8px;border-radius:50%;border:1px solid var(--bg2)}}
-.nav-btn .bm-indicator-2{{position:absolute;top:2px;left:2px}}
-
-/* MAIN */
-.main{{margin-right:0;margin-left:68px;padding:20px;max-width:900px}}
-@media(min-width:1200px){{.main{{margin:0 auto;padding-left:80px}}}}
-
-/* QUESTION CARD */
-.q-card{{background:var(--card);border:1px solid var(--bg3);border-radius:var(--radius);padding:20px;margin-bottom:16px;transition:all .3s;position:relative}}
-.q-card:hover{{border-color:var(--accent-glow)}}
-.q-card.filtered-out{{display:none}}
-.q-header{{display:flex;justify-content:space-between;align-items:flex-start;gap:12px;margin-bottom:14px}}
-.q-number{{background:linear-gradient(135deg,var(--accent),var(--accent2));color:#fff;min-width:36px;height:36px;border-radius:50%;display:flex;align-items:center;justify-content:center;font-weight:800;font-size:.85rem;flex-shrink:0}}
-.q-text{{flex:1;font-size:1rem;font-weight:600;line-height:1.8}}
-.q-text .en{{display:block;font-size:.95rem;margin-bottom:4px}}
-.q-text .ar{{display:block;font-size:.85rem;color:var(--text2)}}
-.q-actions{{display:flex;gap:4px;flex-shrink:0}}
-.q-actions .btn{{padding:4px 8px;font-size:.75rem}}
-
-/* BOOKMARK MENU */
-.bm-menu{{position:absolute;top:50px;left:10px;background:var(--bg2);border:1px solid var(--bg3);border-radius:var(--radius-sm);padding:6px;z-index:10;display:none;box-shadow:var(--shadow)}}
-.bm-menu.show{{display:flex;flex-direction:column;gap:4px}}
-.bm-color-btn{{width:28px;height:28px;border-radius:50%;border:2px solid transparent;cursor:pointer;transition:all .2s}}
-.bm-color-btn:hover,.bm-color-btn.active{{border-color:#fff;transform:scale(1.15)}}
-
-/* OPTIONS */
-.opts{{display:flex;flex-direction:column;gap:8px}}
-.opt-btn{{padding:12px 16px;border:2px solid var(--bg3);border-radius:var(--radius-sm);background:var(--bg);cursor:pointer;text-align:right;font-family:var(--font-ar);font-size:.9rem;transition:all .2s;position:relative;display:flex;align-items:center;gap:10px}}
-.opt-btn .en{{font-family:var(--font-en);direction:ltr;flex:1}}
-.opt-btn:hover:not(.disabled){{border-color:var(--accent);background:var(--accent-glow)}}
-.opt-btn.selected{{border-color:var(--accent);background:rgba(124,92,252,0.1)}}
-.opt-btn.correct{{border-color:var(--correct-border)!important;background:var(--correct-bg)!important}}
-.opt-btn.wrong{{border-color:var(--wrong-border)!important;background:var(--wrong-bg)!important}}
-.opt-btn.disabled{{cursor:default;opacity:.85}}
-.opt-btn .opt-letter{{min-width:28px;height:28px;border-radius:50%;background:var(--bg3);display:flex;align-items:center;justify-content:center;font-weight:700;font-size:.8rem;flex-shrink:0;transition:all .2s}}
-.opt-btn.correct .opt-letter{{background:var(--correct);color:#fff}}
-.opt-btn.wrong .opt-letter{{background:var(--wrong);color:#fff}}
-.opt-icon{{margin-inline-start:auto;font-size:1.1rem}}
-
-/* EXPLANATION */
-.explanation{{display:none;margin-top:12px;padding:14px;background:var(--bg);border:1px solid var(--bg3);border-radius:var(--radius-sm);font-size:.85rem;line-height:1.9}}
-.explanation.show{{display:block;animation:fadeIn .3s ease}}
-.explanation h4{{color:var(--accent2);margin-bottom:8px;font-size:.9rem}}
-.exp-opt{{margin-bottom:8px;padding:8px 10px;border-radius:6px}}
-.exp-opt.exp-correct{{background:var(--correct-bg);border-right:3px solid var(--correct)}}
-.exp-opt.exp-wrong{{background:var(--wrong-bg);border-right:3px solid var(--wrong)}}
-.exp-opt b{{display:block;margin-bottom:2px}}
-
-/* TOOLTIP */
-[data-tooltip]{{position:relative}}
-[data-tooltip]:hover::after{{content:attr(data-tooltip);position:absolute;bottom:105%;right:0;background:var(--bg2);color:var(--text);padding:6px 10px;border-radius:6px;font-size:.78rem;white-space:pre-wrap;max-width:320px;z-index:99;box-shadow:var(--shadow);border:1px solid var(--bg3);pointer-events:none;animation:fadeIn .2s}}
-
-/* RESULT */
-.result-box{{background:var(--card);border:2px solid var(--accent);border-radius:var(--radius);padding:24px;margin:20px 0;display:none}}
-.result-box.show{{display:block;animation:fadeIn .4s}}
-.result-score{{font-size:2.5rem;font-weight:800;text-align:center;background:linear-gradient(135deg,var(--accent),var(--accent2));-webkit-background-clip:text;-webkit-text-fill-color:transparent}}
-.result-details{{display:grid;grid-template-columns:repeat(auto-fit,minmax(120px,1fr));gap:12px;margin-top:16px}}
-.result-stat{{text-align:center;padding:12px;border-radius:var(--radius-sm);background:var(--bg)}}
-.result-stat .num{{font-size:1.5rem;font-weight:800}}
-.result-stat .label{{font-size:.8rem;color:var(--text2)}}
-
-/* BOOKMARK LABEL MODAL */
-.modal-overlay{{display:none;position:fixed;inset:0;background:rgba(0,0,0,.6);z-index:200;align-items:center;justify-content:center}}
-.modal-overlay.show{{display:flex}}
-.modal{{background:var(--bg2);border:1px solid var(--bg3);border-radius:var(--radius);padding:24px;max-width:400px;width:90%}}
-.modal h3{{margin-bottom:12px}}
-.modal input{{width:100%;padding:10px;border:1px solid var(--bg3);border-radius:var(--radius-sm);background:var(--bg);color:var(--text);font-family:var(--font-ar);font-size:1rem;margin-bottom:8px}}
-.modal .btn{{margin-top:8px}}
-
-/* TOPIC FILTER */
-.topic-panel{{display:none;padding:10px 20px;background:var(--bg2);border-bottom:1px solid var(--bg3)}}
-.topic-panel.show{{display:flex;flex-wrap:wrap;gap:6px}}
-.topic-btn{{font-size:.78rem}}
-
-@keyframes fadeIn{{from{{opacity:0;transform:translateY(6px)}}to{{opacity:1;transform:translateY(0)}}}}
-
-/* MOBILE */
-@media(max-width:768px){{
-  .sidebar{{width:100%;height:auto;position:fixed;bottom:0;top:auto;left:0;right:0;padding:8px;display:flex;flex-wrap:wrap;gap:3px;justify-content:center;border-right:none;border-top:2px solid var(--bg3);max-height:40vh;overflow-y:auto}}
-  .nav-btn{{width:32px;height:32px;aspect-ratio:1;font-size:.65rem}}
-  .main{{margin-left:0;padding:12px;padding-bottom:200px}}
-  .header{{position:sticky;top:0}}
-  .filter-bar{{top:auto;position:relative}}
-  .q-card{{padding:14px}}
-}}
-</style>
+<link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&family=Tajawal:wght@400;500;700;800&display=swap" rel="stylesheet" crossorigin="anonymous">
+{style}
 </head>
 <body>
 
@@ -273,10 +167,152 @@ body{{font-family:var(--font-ar);background:var(--bg);color:var(--text);line-hei
 </div>
 
 <script>
-const QUESTIONS = {questions_json};
-''' + '''
+{data}
+</script>
+{script}
+</body>
+</html>'''
+
+STYLE = '''*,*::before,*::after{box-sizing:border-box;margin:0;padding:0}
+:root{
+--bg:#0f0f1a;--bg2:#1a1a2e;--bg3:#25253d;--card:#1e1e35;--card-hover:#252545;
+--text:#e8e8f0;--text2:#a0a0c0;--text3:#707090;
+--accent:#7c5cfc;--accent2:#a78bfa;--accent-glow:rgba(124,92,252,0.3);
+--correct:#10b981;--correct-bg:rgba(16,185,129,0.15);--correct-border:rgba(16,185,129,0.4);
+--wrong:#ef4444;--wrong-bg:rgba(239,68,68,0.15);--wrong-border:rgba(239,68,68,0.4);
+--bookmark-red:#ef4444;--bookmark-yellow:#f59e0b;--bookmark-green:#10b981;--bookmark-blue:#3b82f6;
+--radius:12px;--radius-sm:8px;--shadow:0 4px 24px rgba(0,0,0,0.3);
+--font-ar:'Tajawal',sans-serif;--font-en:'Inter',sans-serif;
+}
+[data-theme="light"]{
+--bg:#f0f0f8;--bg2:#e8e8f2;--bg3:#dddde8;--card:#ffffff;--card-hover:#f5f5ff;
+--text:#1a1a2e;--text2:#4a4a6a;--text3:#8a8aa0;
+--shadow:0 4px 24px rgba(0,0,0,0.08);
+}
+html{scroll-behavior:smooth}
+body{font-family:var(--font-ar);background:var(--bg);color:var(--text);line-height:1.7;transition:all .3s}
+.en{font-family:var(--font-en);direction:ltr;text-align:left}
+
+/* HEADER */
+.header{position:sticky;top:0;z-index:100;background:var(--bg2);border-bottom:1px solid var(--bg3);padding:12px 20px;backdrop-filter:blur(12px)}
+.header-top{display:flex;align-items:center;justify-content:space-between;gap:12px;flex-wrap:wrap}
+.header h1{font-size:1.2rem;font-weight:800;background:linear-gradient(135deg,var(--accent),var(--accent2));-webkit-background-clip:text;-webkit-text-fill-color:transparent}
+.header-btns{display:flex;gap:6px;flex-wrap:wrap}
+.btn{padding:6px 14px;border:1px solid var(--bg3);border-radius:var(--radius-sm);background:var(--bg3);color:var(--text);cursor:pointer;font-family:var(--font-ar);font-size:.82rem;transition:all .2s;white-space:nowrap}
+.btn:hover{background:var(--accent);border-color:var(--accent);color:#fff}
+.btn.active{background:var(--accent);border-color:var(--accent);color:#fff}
+.btn-danger{border-color:var(--wrong);color:var(--wrong)}
+.btn-danger:hover{background:var(--wrong);color:#fff}
+
+/* PROGRESS */
+.progress-wrap{margin-top:10px}
+.progress-bar{height:8px;background:var(--bg3);border-radius:99px;overflow:hidden}
+.progress-fill{height:100%;background:linear-gradient(90deg,var(--accent),var(--accent2));border-radius:99px;transition:width .4s ease;width:0%}
+.progress-text{font-size:.8rem;color:var(--text2);margin-top:4px;display:flex;justify-content:space-between}
+
+/* FILTER BAR */
+.filter-bar{position:sticky;top:72px;z-index:90;background:var(--bg);padding:10px 20px;display:flex;gap:6px;flex-wrap:wrap;border-bottom:1px solid var(--bg3)}
+.filter-bar .btn{font-size:.78rem;padding:5px 12px}
+.bookmark-dot{width:10px;height:10px;border-radius:50%;display:inline-block;margin-inline-end:4px;vertical-align:middle}
+
+/* SIDEBAR NAV */
+.sidebar{position:fixed;left:0;top:0;bottom:0;width:60px;background:var(--bg2);border-right:1px solid var(--bg3);z-index:80;overflow-y:auto;padding:80px 6px 20px;transition:width .3s;scrollbar-width:thin}
+.sidebar::-webkit-scrollbar{width:4px}
+.sidebar::-webkit-scrollbar-thumb{background:var(--bg3);border-radius:9px}
+.sidebar.expanded{width:220px}
+.nav-btn{width:100%;aspect-ratio:1;border:none;border-radius:var(--radius-sm);font-size:.7rem;font-weight:700;cursor:pointer;margin-bottom:3px;position:relative;transition:all .2s;display:flex;align-items:center;justify-content:center;background:var(--bg3);color:var(--text2)}
+.nav-btn:hover{transform:scale(1.1);z-index:2}
+.nav-btn.answered-correct{background:var(--correct-bg);color:var(--correct);border:1px solid var(--correct-border)}
+.nav-btn.answered-wrong{background:var(--wrong-bg);color:var(--wrong);border:1px solid var(--wrong-border)}
+.nav-btn .bm-indicator{position:absolute;top:2px;right:2px;width:8px;height:8px;border-radius:50%;border:1px solid var(--bg2)}
+.nav-btn .bm-indicator-2{position:absolute;top:2px;left:2px}
+
+/* MAIN */
+.main{margin-right:0;margin-left:68px;padding:20px;max-width:900px}
+@media(min-width:1200px){.main{margin:0 auto;padding-left:80px}}
+
+/* QUESTION CARD */
+.q-card{background:var(--card);border:1px solid var(--bg3);border-radius:var(--radius);padding:20px;margin-bottom:16px;transition:all .3s;position:relative}
+.q-card:hover{border-color:var(--accent-glow)}
+.q-card.filtered-out{display:none}
+.q-header{display:flex;justify-content:space-between;align-items:flex-start;gap:12px;margin-bottom:14px}
+.q-number{background:linear-gradient(135deg,var(--accent),var(--accent2));color:#fff;min-width:36px;height:36px;border-radius:50%;display:flex;align-items:center;justify-content:center;font-weight:800;font-size:.85rem;flex-shrink:0}
+.q-text{flex:1;font-size:1rem;font-weight:600;line-height:1.8}
+.q-text .en{display:block;font-size:.95rem;margin-bottom:4px}
+.q-text .ar{display:block;font-size:.85rem;color:var(--text2)}
+.q-actions{display:flex;gap:4px;flex-shrink:0}
+.q-actions .btn{padding:4px 8px;font-size:.75rem}
+
+/* BOOKMARK MENU */
+.bm-menu{position:absolute;top:50px;left:10px;background:var(--bg2);border:1px solid var(--bg3);border-radius:var(--radius-sm);padding:6px;z-index:10;display:none;box-shadow:var(--shadow)}
+.bm-menu.show{display:flex;flex-direction:column;gap:4px}
+.bm-color-btn{width:28px;height:28px;border-radius:50%;border:2px solid transparent;cursor:pointer;transition:all .2s}
+.bm-color-btn:hover,.bm-color-btn.active{border-color:#fff;transform:scale(1.15)}
+
+/* OPTIONS */
+.opts{display:flex;flex-direction:column;gap:8px}
+.opt-btn{padding:12px 16px;border:2px solid var(--bg3);border-radius:var(--radius-sm);background:var(--bg);cursor:pointer;text-align:right;font-family:var(--font-ar);font-size:.9rem;transition:all .2s;position:relative;display:flex;align-items:center;gap:10px}
+.opt-btn .en{font-family:var(--font-en);direction:ltr;flex:1}
+.opt-btn:hover:not(.disabled){border-color:var(--accent);background:var(--accent-glow)}
+.opt-btn.selected{border-color:var(--accent);background:rgba(124,92,252,0.1)}
+.opt-btn.correct{border-color:var(--correct-border)!important;background:var(--correct-bg)!important}
+.opt-btn.wrong{border-color:var(--wrong-border)!important;background:var(--wrong-bg)!important}
+.opt-btn.disabled{cursor:default;opacity:.85}
+.opt-btn .opt-letter{min-width:28px;height:28px;border-radius:50%;background:var(--bg3);display:flex;align-items:center;justify-content:center;font-weight:700;font-size:.8rem;flex-shrink:0;transition:all .2s}
+.opt-btn.correct .opt-letter{background:var(--correct);color:#fff}
+.opt-btn.wrong .opt-letter{background:var(--wrong);color:#fff}
+.opt-icon{margin-inline-start:auto;font-size:1.1rem}
+
+/* EXPLANATION */
+.explanation{display:none;margin-top:12px;padding:14px;background:var(--bg);border:1px solid var(--bg3);border-radius:var(--radius-sm);font-size:.85rem;line-height:1.9}
+.explanation.show{display:block;animation:fadeIn .3s ease}
+.explanation h4{color:var(--accent2);margin-bottom:8px;font-size:.9rem}
+.exp-opt{margin-bottom:8px;padding:8px 10px;border-radius:6px}
+.exp-opt.exp-correct{background:var(--correct-bg);border-right:3px solid var(--correct)}
+.exp-opt.exp-wrong{background:var(--wrong-bg);border-right:3px solid var(--wrong)}
+.exp-opt b{display:block;margin-bottom:2px}
+
+/* TOOLTIP */
+[data-tooltip]{position:relative}
+[data-tooltip]:hover::after{content:attr(data-tooltip);position:absolute;bottom:105%;right:0;background:var(--bg2);color:var(--text);padding:6px 10px;border-radius:6px;font-size:.78rem;white-space:pre-wrap;max-width:320px;z-index:99;box-shadow:var(--shadow);border:1px solid var(--bg3);pointer-events:none;animation:fadeIn .2s}
+
+/* RESULT */
+.result-box{background:var(--card);border:2px solid var(--accent);border-radius:var(--radius);padding:24px;margin:20px 0;display:none}
+.result-box.show{display:block;animation:fadeIn .4s}
+.result-score{font-size:2.5rem;font-weight:800;text-align:center;background:linear-gradient(135deg,var(--accent),var(--accent2));-webkit-background-clip:text;-webkit-text-fill-color:transparent}
+.result-details{display:grid;grid-template-columns:repeat(auto-fit,minmax(120px,1fr));gap:12px;margin-top:16px}
+.result-stat{text-align:center;padding:12px;border-radius:var(--radius-sm);background:var(--bg)}
+.result-stat .num{font-size:1.5rem;font-weight:800}
+.result-stat .label{font-size:.8rem;color:var(--text2)}
+
+/* BOOKMARK LABEL MODAL */
+.modal-overlay{display:none;position:fixed;inset:0;background:rgba(0,0,0,.6);z-index:200;align-items:center;justify-content:center}
+.modal-overlay.show{display:flex}
+.modal{background:var(--bg2);border:1px solid var(--bg3);border-radius:var(--radius);padding:24px;max-width:400px;width:90%}
+.modal h3{margin-bottom:12px}
+.modal input{width:100%;padding:10px;border:1px solid var(--bg3);border-radius:var(--radius-sm);background:var(--bg);color:var(--text);font-family:var(--font-ar);font-size:1rem;margin-bottom:8px}
+.modal .btn{margin-top:8px}
+
+/* TOPIC FILTER */
+.topic-panel{display:none;padding:10px 20px;background:var(--bg2);border-bottom:1px solid var(--bg3)}
+.topic-panel.show{display:flex;flex-wrap:wrap;gap:6px}
+.topic-btn{font-size:.78rem}
+
+@keyframes fadeIn{from{opacity:0;transform:translateY(6px)}to{opacity:1;transform:translateY(0)}}
+
+/* MOBILE */
+@media(max-width:768px){
+  .sidebar{width:100%;height:auto;position:fixed;bottom:0;top:auto;left:0;right:0;padding:8px;display:flex;flex-wrap:wrap;gap:3px;justify-content:center;border-right:none;border-top:2px solid var(--bg3);max-height:40vh;overflow-y:auto}
+  .nav-btn{width:32px;height:32px;aspect-ratio:1;font-size:.65rem}
+  .main{margin-left:0;padding:12px;padding-bottom:200px}
+  .header{position:sticky;top:0}
+  .filter-bar{top:auto;position:relative}
+  .q-card{padding:14px}
+}'''
+
+SCRIPT = '''const TOPIC_COUNTS = {};
+for (const q of QUESTIONS) for (const t of q.topics) TOPIC_COUNTS[t] = (TOPIC_COUNTS[t] || 0) + 1;
 // ============ EXPLANATIONS (Arabic) ============
-const EXPLANATIONS = {};
 function getExplanations(q) {
   if (EXPLANATIONS[q.id]) return EXPLANATIONS[q.id];
   return null;
@@ -432,10 +468,9 @@ function renderSidebar() {
 
 function renderTopics() {
   const panel = document.getElementById('topicPanel');
-  const topics = [...new Set(QUESTIONS.map(q => q.topic))];
   panel.innerHTML = '<button class="btn topic-btn '+(state.topicFilter===null?'active':'')+'" onclick="filterTopic(null,this)">الكل</button>';
-  for (const t of topics) {
-    const count = QUESTIONS.filter(q => q.topic === t).length;
+  for (const t of TOPICS) {
+    const count = TOPIC_COUNTS[t] || 0;
     panel.innerHTML += `<button class="btn topic-btn ${state.topicFilter===t?'active':''}" onclick="filterTopic('${t}',this)">${t} (${count})</button>`;
   }
 }
@@ -506,7 +541,7 @@ function applyFilter() {
     let show = true;
     
     // Topic filter
-    if (state.topicFilter && q.topic !== state.topicFilter) show = false;
+    if (state.topicFilter && !q.topics.includes(state.topicFilter)) show = false;
     
     // Status filter
     if (show) {
@@ -735,8 +770,7 @@ function showToast(msg) {
 }
 
 function getTooltip(q) {
-  // Return Arabic tooltip for question
-  return '';  // Will be populated by enrichment
+  return QAR[q.id] || '';
 }
 
 // Close menus on click outside
@@ -745,18 +779,113 @@ document.addEventListener('click', () => {
 });
 
 // ============ INIT ============
-renderAll();
-</script>
-</body>
-</html>'''
-    
+renderAll();'''
+
+def content_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def write_if_changed(path, text):
+    """Write `text` unless the file already holds exactly it; returns True if written"""
+    data = text.encode('utf-8')
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if hashlib.sha256(f.read()).digest() == hashlib.sha256(data).digest():
+                return False
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+ASSET_HASH = 10
+
+def asset(name, ext, text):
+    """Write assets/<name>.<hash>.<ext> once; returns its path relative to the page"""
+    filename = f"{name}.{content_hash(text)[:ASSET_HASH]}.{ext}"
+    path = os.path.join(ASSET_DIR, filename)
+    if not os.path.exists(path):
+        os.makedirs(ASSET_DIR, exist_ok=True)
+        write_if_changed(path, text)
+    return f"assets/{filename}"
+
+def prune_assets(keep, name='quiz'):
+    """Delete this page's hashed assets (<name>.<hash>.css/.js) other than
+    `keep` (paths from asset()); other files in assets/ are left alone"""
+    keep = {os.path.basename(path) for path in keep}
+    if not os.path.isdir(ASSET_DIR):
+        return []
+    ours = re.compile(rf'{re.escape(name)}\.[0-9a-f]{{{ASSET_HASH}}}\.(css|js)')
+    removed = [f for f in os.listdir(ASSET_DIR) if ours.fullmatch(f) and f not in keep]
+    for f in removed:
+        os.remove(os.path.join(ASSET_DIR, f))
+    return removed
+
+def js_value(value):
+    """JSON literal that is safe inside a <script> element"""
+    return json.dumps(value, ensure_ascii=False).replace('</', '<\\/')
+
+def render_question(q, topics, exps, tooltip):
+    """Data, explanation and tooltip fragments of one question"""
+    data = {
+        'id': q['id'],
+        'q': q['text'],
+        'topic': topics[0],
+        'topics': topics,
+        'opts': [{'t': o['text'], 'c': o['correct']} for o in q['options']],
+    }
+    return [
+        js_value(data),
+        f"{q['id']}:{js_value(exps)}" if exps else '',
+        f"{q['id']}:{js_value(tooltip)}" if tooltip else '',
+    ]
+
+def render_fragments(questions, index, explanations, tooltips):
+    """Fragments of every question, in bank order"""
+    return [render_question(q, list(index.topics_of(q['id'])), explanations.get(q['id']),
+                            tooltips.get(q['id'], ''))
+            for q in questions]
+
+def render(fragments, topics, inline=False):
+    """The full page from question fragments"""
+    data = '\n'.join([
+        'const QUESTIONS = [\n' + ',\n'.join(f[0] for f in fragments) + '];',
+        f'const TOPICS = {js_value(topics)};',
+        'const EXPLANATIONS = {' + ',\n'.join(f[1] for f in fragments if f[1]) + '};',
+        'const QAR = {' + ','.join(f[2] for f in fragments if f[2]) + '};',
+    ])
+    if inline:
+        style = f'<style>\n{STYLE}\n</style>'
+        script = f'<script>{SCRIPT}</script>'
+    else:
+        style = f'<link rel="stylesheet" href="{asset("quiz", "css", STYLE)}">'
+        script = f'<script src="{asset("quiz", "js", SCRIPT)}"></script>'
+    return SHELL.format(style=style, data=data, script=script)
+
+def generate(topic_map=None, inline=False):
+    """Write os_quiz.html; `topic_map` replaces TOPIC_MAP (e.g. a classifier's output).
+
+    With `inline` the CSS and JS are embedded so the page is a single file.
+    Returns True if the page changed.
+    """
+    questions = load_questions()
+    index = TOPIC_INDEX if topic_map is None else \
+        TopicIndex(topic_map, default=DEFAULT_TOPIC, aliases=TOPIC_ALIASES,
+                   ids=[q['id'] for q in questions])
+    explanations, tooltips = load_explanations(questions)
+
+    fragments = render_fragments(questions, index, explanations, tooltips)
+    used = {t for q in questions for t in index.topics_of(q['id'])}
+    topics = [t for t in index.topics if t in used]
+
     output_path = os.path.join(SCRIPT_DIR, 'os_quiz.html')
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    print(f"Generated {output_path}")
+    changed = write_if_changed(output_path, render(fragments, topics, inline))
+    # the page just written references these assets only (none when inline)
+    removed = prune_assets([] if inline else [asset('quiz', 'css', STYLE), asset('quiz', 'js', SCRIPT)])
+    print(f"{'Generated' if changed else 'Unchanged'} {output_path} ({len(questions)} questions"
+          f"{f', {len(removed)} stale assets removed' if removed else ''})")
+    return changed
 
 def escapeHtml(s):
     return html.escape(s)
 
 if __name__ == '__main__':
-    generate()
+    import sys
+    generate(inline='--inline' in sys.argv[1:])
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""Streaming item analysis of response logs: difficulty, discrimination, distractors.
+
+Logs are the submission files of bulk_grader.py (student, qid, answer rows,
+CSV or JSONL), read CHUNK rows at a time in two passes:
+
+  1. per-student answered / correct totals
+  2. per-question sums, each row scored against the student's rest score
+     (their proportion correct on the other questions they answered)
+
+Every per-question statistic is a sum (answers, correct answers, rest-score
+sum and sum of squares, per-option picks and rest-score sums), so memory is
+constant per question and shards merge by addition:
+
+  p             proportion correct (item difficulty)
+  r_pb          point-biserial correlation of the item with the rest score
+                (corrected item-total discrimination)
+  options       pick rate and mean rest score per option; a distractor
+                picked by stronger students than the key is flagged
+
+    python item_analysis.py logs.csv -o item_report.json
+    python item_analysis.py day1.csv day2.jsonl --jobs 2 -o item_report.json
+    python item_analysis.py logs.csv --save shard1.npz        # partial sums
+                                # (shards saved apart should split by student,
+                                # since rest scores use that shard's totals)
+    python item_analysis.py --merge shard1.npz shard2.npz -o item_report.json
+    python item_analysis.py logs.csv --levels levels.json      # for exam_sampler --difficulty
+"""
+import argparse, json, os
+
+import numpy as np
+
+from bulk_grader import CHUNK, read_rows
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# flag thresholds of the report
+HARD_P, EASY_P = 0.2, 0.9
+LOW_DISCRIMINATION = 0.1
+RARE_DISTRACTOR = 0.05
+# p-value cut-offs of the easy / medium / hard levels written by --levels
+LEVEL_P = (0.7, 0.4)
+
+def load_key(questions=None):
+    """(answer key array indexed by qid, option counts array, questions)"""
+    from quiz_server import answer_key
+    if questions is None:
+        with open(os.path.join(SCRIPT_DIR, 'questions.json'), 'r', encoding='utf-8') as f:
+            questions = json.load(f)
+    key = np.frombuffer(answer_key(questions), dtype=np.int8).astype(np.int64)
+    n_options = np.zeros(len(key), dtype=np.int64)
+    for q in questions:
+        n_options[q['id']] = len(q['options'])
+    return key, n_options, questions
+
+def _valid(key, n_options, qids, answers):
+    """Mask of rows with a known question and an index inside its options"""
+    ok = (qids >= 0) & (qids < len(key))
+    ok[ok] = key[qids[ok]] >= 0
+    ok &= answers >= 0
+    ok[ok] = answers[ok] < n_options[qids[ok]]
+    return ok
+
+def student_totals(path, key, n_options, chunk=CHUNK):
+    """Pass 1: {student: [answered, correct]}"""
+    totals = {}
+    for students, qids, answers in read_rows(path, chunk):
+        qids = np.asarray(qids, dtype=np.int64)
+        answers = np.asarray(answers, dtype=np.int64)
+        valid = _valid(key, n_options, qids, answers)
+        ok = np.zeros(len(qids), dtype=bool)
+        ok[valid] = key[qids[valid]] == answers[valid]
+        for student, v, right in zip(students, valid.tolist(), ok.tolist()):
+            if v:
+                t = totals.get(student)
+                if t is None:
+                    t = totals[student] = [0, 0]
+                t[0] += 1
+                t[1] += right
+    return totals
+
+def merge_totals(parts):
+    out = {}
+    for part in parts:
+        for student, (answered, correct) in part.items():
+            t = out.setdefault(student, [0, 0])
+            t[0] += answered
+            t[1] += correct
+    return out
+
+class ItemStats:
+    """Additive per-question sums; arrays are indexed by question ID"""
+    FIELDS = ('n', 'correct', 'scored', 'score', 'score2',
+              'picks', 'pick_score', 'pick_scored')
+
+    def __init__(self, size, max_options):
+        self.n = np.zeros(size, dtype=np.int64)            # answers
+        self.correct = np.zeros(size, dtype=np.int64)
+        self.scored = np.zeros(size, dtype=np.int64)       # answers with a rest score
+        self.score = np.zeros(size)
+        self.score2 = np.zeros(size)
+        self.picks = np.zeros((size, max_options), dtype=np.int64)
+        self.pick_score = np.zeros((size, max_options))
+        self.pick_scored = np.zeros((size, max_options), dtype=np.int64)
+
+    def update(self, key, n_options, qids, answers, answered, correct):
+        """Add a chunk; `answered` / `correct` are each row's student totals"""
+        valid = _valid(key, n_options, qids, answers)
+        qids, answers = qids[valid], answers[valid]
+        answered, correct = answered[valid], correct[valid]
+        ok = key[qids] == answers
+        size = len(self.n)
+        self.n += np.bincount(qids, minlength=size)
+        self.correct += np.bincount(qids, weights=ok, minlength=size).astype(np.int64)
+        # rest score: the student's proportion correct without this answer
+        has_rest = answered > 1
+        rest = np.zeros(len(qids))
+        rest[has_rest] = (correct[has_rest] - ok[has_rest]) / (answered[has_rest] - 1)
+        q, r = qids[has_rest], rest[has_rest]
+        self.scored += np.bincount(q, minlength=size)
+        self.score += np.bincount(q, weights=r, minlength=size)
+        self.score2 += np.bincount(q, weights=r * r, minlength=size)
+        width = self.picks.shape[1]
+        flat = qids * width + answers
+        self.picks += np.bincount(flat, minlength=size * width).reshape(size, width)
+        flat_r = flat[has_rest]
+        self.pick_score += np.bincount(flat_r, weights=r, minlength=size * width).reshape(size, width)
+        self.pick_scored += np.bincount(flat_r, minlength=size * width).reshape(size, width)
+
+    def merge(self, other):
+        for name in self.FIELDS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        return self
+
+    def save(self, path):
+        np.savez_compressed(path, **{name: getattr(self, name) for name in self.FIELDS})
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        stats = cls(*data['picks'].shape)
+        for name in cls.FIELDS:
+            setattr(stats, name, data[name])
+        return stats
+
+    def report(self, key, n_options):
+        """{qid: {n, p, r_pb, options: [{rate, mean_score, correct}], flags}}
+        of the answered questions"""
+        out = {}
+        for qid in np.flatnonzero(self.n):
+            n = int(self.n[qid])
+            p = int(self.correct[qid]) / n
+            options = []
+            for i in range(int(n_options[qid])):
+                scored = int(self.pick_scored[qid, i])
+                options.append({
+                    'rate': round(int(self.picks[qid, i]) / n, 4),
+                    'mean_score': round(self.pick_score[qid, i] / scored, 4) if scored else None,
+                    'correct': bool(i == key[qid]),
+                })
+            r_pb = self.point_biserial(qid, key[qid])
+            out[int(qid)] = {'n': n, 'p': round(p, 4),
+                             'r_pb': None if r_pb is None else round(r_pb, 4),
+                             'options': options, 'flags': _flags(p, r_pb, options)}
+        return out
+
+    def point_biserial(self, qid, correct_option):
+        """(M1 - M0) / sd * sqrt(p q) over the answers that have a rest score"""
+        m = int(self.scored[qid])
+        k = int(self.pick_scored[qid, correct_option])
+        if m < 2 or k in (0, m):
+            return None
+        mean = self.score[qid] / m
+        sd = np.sqrt(max(self.score2[qid] / m - mean * mean, 0.0))
+        if sd == 0:
+            return None
+        m1 = self.pick_score[qid, correct_option] / k
+        m0 = (self.score[qid] - self.pick_score[qid, correct_option]) / (m - k)
+        p = k / m
+        return float((m1 - m0) / sd * np.sqrt(p * (1 - p)))
+
+def _flags(p, r_pb, options):
+    flags = []
+    if p < HARD_P:
+        flags.append('hard')
+    elif p > EASY_P:
+        flags.append('easy')
+    if r_pb is not None and r_pb < LOW_DISCRIMINATION:
+        flags.append('low discrimination')
+    key_score = next((o['mean_score'] for o in options if o['correct']), None)
+    for i, o in enumerate(options):
+        if o['correct']:
+            continue
+        if o['rate'] < RARE_DISTRACTOR:
+            flags.append(f'option {i} rarely chosen')
+        if key_score is not None and o['mean_score'] is not None and o['mean_score'] > key_score:
+            flags.append(f'option {i} draws stronger students than the key')
+    return flags
+
+def accumulate(path, key, n_options, totals, chunk=CHUNK):
+    """Pass 2 over one log file: ItemStats with each row scored by `totals`"""
+    stats = ItemStats(len(key), int(n_options.max(initial=1)))
+    for students, qids, answers in read_rows(path, chunk):
+        answered = np.fromiter((totals.get(s, (0, 0))[0] for s in students),
+                               dtype=np.int64, count=len(students))
+        correct = np.fromiter((totals.get(s, (0, 0))[1] for s in students),
+                              dtype=np.int64, count=len(students))
+        stats.update(key, n_options, np.asarray(qids, dtype=np.int64), np.asarray(answers, dtype=np.int64),
+                     answered, correct)
+    return stats
+
+def _totals_job(args):
+    return student_totals(*args)
+
+def _accumulate_job(args):
+    return accumulate(*args)
+
+def analyze(paths, jobs=1, questions=None, chunk=CHUNK):
+    """ItemStats of the log files, one file per worker process when jobs > 1"""
+    key, n_options, _ = load_key(questions)
+    if jobs > 1 and len(paths) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(min(jobs, len(paths))) as pool:
+            totals = merge_totals(pool.map(_totals_job, [(p, key, n_options, chunk) for p in paths]))
+            parts = list(pool.map(_accumulate_job,
+                                  [(p, key, n_options, totals, chunk) for p in paths]))
+    else:
+        totals = merge_totals(student_totals(p, key, n_options, chunk) for p in paths)
+        parts = [accumulate(p, key, n_options, totals, chunk) for p in paths]
+    stats = parts[0]
+    for part in parts[1:]:
+        stats.merge(part)
+    return stats
+
+def levels(report):
+    """{qid: easy|medium|hard} from the p-values (exam_sampler --difficulty)"""
+    easy, medium = LEVEL_P
+    return {qid: 'easy' if r['p'] >= easy else 'medium' if r['p'] >= medium else 'hard'
+            for qid, r in report.items()}
+
+def main(argv=None):
+    import time
+    parser = argparse.ArgumentParser(description='Item analysis of response logs.')
+    parser.add_argument('logs', nargs='*', help='CSV/JSONL files of student, qid, answer rows')
+    parser.add_argument('-o', '--output', help='per-question report JSON')
+    parser.add_argument('--jobs', type=int, default=1, help='worker processes (one file each)')
+    parser.add_argument('--save', help='write the partial sums (.npz) to merge later')
+    parser.add_argument('--merge', nargs='+', metavar='NPZ', help='merge saved partial sums')
+    parser.add_argument('--levels', help='write {qid: easy|medium|hard} JSON')
+    parser.add_argument('--chunk', type=int, default=CHUNK)
+    args = parser.parse_args(argv)
+    if not args.logs and not args.merge:
+        parser.error('give log files or --merge')
+
+    start = time.perf_counter()
+    key, n_options, questions = load_key()
+    parts = [ItemStats.load(p) for p in args.merge or ()]
+    if args.logs:
+        parts.append(analyze(args.logs, args.jobs, questions, args.chunk))
+    stats = parts[0]
+    for part in parts[1:]:
+        stats.merge(part)
+    if args.save:
+        stats.save(args.save)
+        print(f"Saved partial sums to {args.save}")
+
+    report = stats.report(key, n_options)
+    elapsed = time.perf_counter() - start
+    print(f"{int(stats.n.sum())} answers to {len(report)} questions in {elapsed:.2f}s")
+    flagged = {qid: r['flags'] for qid, r in report.items() if r['flags']}
+    for qid in sorted(flagged)[:20]:
+        r = report[qid]
+        print(f"  Q{qid}: p={r['p']:.2f} r_pb={r['r_pb']}  {', '.join(r['flags'])}")
+    if len(flagged) > 20:
+        print(f"  ... {len(flagged) - 20} more flagged questions")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print(f"Saved to {args.output}")
+    if args.levels:
+        with open(args.levels, 'w', encoding='utf-8') as f:
+            json.dump(levels(report), f, indent=1)
+        print(f"Saved levels to {args.levels}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""osquiz - single entry point for the question bank tools.
+
+    python osquiz.py parse          # QuestionsBank.txt -> questions.json
+    python osquiz.py solve          # run the answer algorithm on the bank
+    python osquiz.py analyze [name] # regenerate the analysis reports
+    python osquiz.py build-html     # questions.json -> os_quiz.html
+    python osquiz.py gen-data       # questions.json -> questions_data.js
+    python osquiz.py explain        # same as build-html (explanations render in the same pass)
+    python osquiz.py classify BANK  # label a new bank with topics (TOPIC_MAP JSON)
+    python osquiz.py search-index   # questions + explanations -> search_index.js
+    python osquiz.py trainer-spans  # keyword highlight spans -> trainer_spans.js
+    python osquiz.py serve          # graded practice service (quiz_server.py)
+    python osquiz.py grade FILE     # bulk-grade CSV/JSONL submissions
+    python osquiz.py variant SEED STUDENT...  # seeded per-student exam variants
+    python osquiz.py sample [QUOTAS] -n N     # exams meeting topic/type/difficulty quotas
+    python osquiz.py items LOG...   # item analysis (p-value, discrimination, distractors)
+    python osquiz.py review [LOG...] [--due STUDENT]  # SM-2 review decks from wrong answers
+    python osquiz.py adaptive calibrate|simulate|bench  # IRT calibration and adaptive testing
+    python osquiz.py trainer-stats LOG...  # per-rule/question agreement of trainer event logs
+    python osquiz.py synth-bank -n N -o FILE  # synthetic TCPDF bank of N questions
+    python osquiz.py bench [--sizes N...]     # scaling benchmark on synthetic banks
+
+Each subcommand imports its modules only when it runs, so `--help` stays
+cheap, and each one is also a plain function (parse, solve, analyze, ...)
+that can be called from other scripts without side effects at import time.
+"""
+import argparse, os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# analysis name -> (module, report it writes)
+ANALYSES = {
+    'answer-key': ('build_answer_key', 'answer_key.md'),
+    'keyword-deep': ('keyword_deep', 'keyword_deep_analysis.txt'),
+    'longest': ('longest_analysis', 'longest_analysis.txt'),
+    'priority': ('priority_analysis', 'priority_analysis.txt'),
+    'topic': ('topic_analysis', 'topic_analysis_output.txt'),
+    'patterns': ('verify_patterns', 'pattern_verification.txt'),
+}
+
+def load_questions(path=None):
+    import json
+    with open(path or os.path.join(SCRIPT_DIR, 'questions.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def parse(bank=None, output=None):
+    """Parse a TCPDF question bank; writes JSON when `output` is given"""
+    import json
+    from parse_questions import parse_questions
+    questions = parse_questions(bank or os.path.join(SCRIPT_DIR, 'QuestionsBank.txt'))
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(questions, f, ensure_ascii=False, indent=2)
+    return questions
+
+def solve(questions=None):
+    """Answer algorithm results: [(id, is_correct, confidence, rule)]"""
+    from simulate_v3 import solve as run
+    return run(questions if questions is not None else load_questions())
+
+def analyze(names=None, questions=None):
+    """Regenerate the named analysis reports (all by default); returns their paths"""
+    import importlib
+    if questions is None:
+        questions = load_questions()
+    written = []
+    for name in names or ANALYSES:
+        module_name, report = ANALYSES[name]
+        importlib.import_module(module_name).main(questions)
+        written.append(os.path.join(SCRIPT_DIR, report))
+    return written
+
+def build_html(topic_map=None, inline=False):
+    from generate_html import generate
+    generate(topic_map, inline)
+    return os.path.join(SCRIPT_DIR, 'os_quiz.html')
+
+def gen_data(questions=None):
+    from gen_data_js import gen_data as run
+    return run(questions)
+
+def explain():
+    """Tooltips and explanations are rendered by build_html; kept for old scripts"""
+    return build_html()
+
+def classify(questions=None):
+    """Topic labels for a bank: (TOPIC_MAP-style dict, [(id, topics, confidence)])"""
+    from topic_classifier import classify as run
+    return run(questions if questions is not None else load_questions())
+
+def search_index():
+    """Write search_index.js; returns its path"""
+    from search_index import build, INDEX_JS
+    build()
+    return INDEX_JS
+
+def trainer_spans():
+    """Write trainer_spans.js; returns its path"""
+    from trainer_spans import build, SPANS_JS
+    build()
+    return SPANS_JS
+
+def serve(host=None, port=None, questions=None):
+    """Run the graded practice service until interrupted"""
+    import asyncio
+    from quiz_server import serve as run, HOST, PORT
+    asyncio.run(run(questions if questions is not None else load_questions(),
+                    host or HOST, port or PORT))
+
+def grade(path, output=None):
+    """Bulk-grade a CSV/JSONL submission file; returns the BulkGrader"""
+    from bulk_grader import grade as run
+    return run(path, output)
+
+def _cmd_parse(args):
+    questions = parse(args.bank, args.output)
+    print(f"Parsed {len(questions)} questions")
+    for q in questions:
+        opts = len(q['options'])
+        correct = sum(1 for o in q['options'] if o['correct'])
+        if opts < 2 or correct != 1:
+            print(f"  WARNING Q{q['id']}: {opts} options, {correct} correct")
+    print(f"Saved to {args.output}")
+
+def _cmd_solve(args):
+    results = solve(load_questions(args.questions) if args.questions else None)
+    by_conf = {}
+    for qid, ok, conf, rule in results:
+        c, t = by_conf.get(conf, (0, 0))
+        by_conf[conf] = (c + ok, t + 1)
+        if args.verbose:
+            print(f"  {'✅' if ok else '❌'} Q{qid}: [{conf}] {rule}")
+    total = sum(ok for _, ok, _, _ in results)
+    print(f"Correct: {total}/{len(results)} = {total * 100 // max(len(results), 1)}%")
+    for conf in ('certain', 'probable', 'gamble'):
+        if conf in by_conf:
+            c, t = by_conf[conf]
+            print(f"  {conf}: {c}/{t}")
+
+def _cmd_analyze(args):
+    unknown = [n for n in args.names if n not in ANALYSES]
+    if unknown:
+        raise SystemExit(f"unknown analysis: {', '.join(unknown)}")
+    for path in analyze(args.names or None):
+        print(f"  wrote {os.path.relpath(path, SCRIPT_DIR)}")
+
+def _cmd_build_html(args):
+    topic_map = None
+    if args.topics:
+        import json
+        with open(args.topics, 'r', encoding='utf-8') as f:
+            topic_map = json.load(f)
+    build_html(topic_map, args.inline)
+
+def _cmd_gen_data(args):
+    count = gen_data()
+    print(f"Done! Created questions_data.js with {count} questions")
+
+def _cmd_explain(args):
+    explain()
+
+def _cmd_classify(args):
+    from topic_classifier import load_bank
+    import json
+    topic_map, results = classify(load_bank(args.bank) if args.bank else None)
+    for topic, ids in topic_map.items():
+        print(f"{topic}: {len(ids)}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(topic_map, f, ensure_ascii=False, indent=2)
+        print(f"Saved to {args.output}")
+
+def _cmd_search_index(args):
+    print(f"Wrote {search_index()}")
+
+def _cmd_trainer_spans(args):
+    print(f"Wrote {trainer_spans()}")
+
+def _cmd_serve(args):
+    from quiz_server import HOST, PORT
+    questions = load_questions(args.questions) if args.questions else None
+    print(f"Serving on http://{args.host or HOST}:{args.port or PORT}")
+    try:
+        serve(args.host, args.port, questions)
+    except KeyboardInterrupt:
+        pass
+
+def _cmd_grade(args):
+    from bulk_grader import main as run
+    run([args.submissions] + (['-o', args.output] if args.output else []))
+
+def _cmd_variant(args):
+    from exam_variants import main as run
+    run(['--seed', args.seed] + [a for s in args.students for a in ('--student', s)])
+
+def _cmd_sample(args):
+    from exam_sampler import main as run
+    run(([args.constraints] if args.constraints else []) + ['-n', str(args.count)]
+        + (['-o', args.output] if args.output else []))
+
+def _cmd_items(args):
+    from item_analysis import main as run
+    run(args.logs + (['-o', args.output] if args.output else [])
+        + (['--jobs', str(args.jobs)] if args.jobs else []))
+
+def _cmd_review(args):
+    from review_scheduler import main as run
+    run(args.logs + (['--state', args.state] if args.state else [])
+        + (['--due', args.due, '-n', str(args.n)] if args.due else []))
+
+def _cmd_adaptive(args):
+    from adaptive_test import main as run
+    run(args.args)
+
+def _cmd_trainer_stats(args):
+    from trainer_analytics import main as run
+    run(args.logs + (['-o', args.output] if args.output else []))
+
+def _cmd_synth_bank(args):
+    from synth_bank import main as run
+    run(['-n', str(args.count), '-o', args.output] + (['--check'] if args.check else []))
+
+def _cmd_bench(args):
+    from bench_scaling import main as run
+    run((['--sizes', *map(str, args.sizes)] if args.sizes else [])
+        + (['--stages', *args.stages] if args.stages else [])
+        + (['--save', args.save] if args.save else [])
+        + (['--compare', args.compare] if args.compare else []))
+
+def make_parser():
+    parser = argparse.ArgumentParser(prog='osquiz', description='OS question bank tools.')
+    sub = parser.add_subparsers(dest='command', metavar='command')
+    sub.required = True
+
+    p = sub.add_parser('parse', help='parse QuestionsBank.txt into questions.json')
+    p.add_argument('--bank', default=os.path.join(SCRIPT_DIR, 'QuestionsBank.txt'))
+    p.add_argument('--output', default=os.path.join(SCRIPT_DIR, 'questions.json'))
+    p.set_defaults(func=_cmd_parse)
+
+    p = sub.add_parser('solve', help='run the answer algorithm on the bank')
+    p.add_argument('--questions', help='questions JSON (default: questions.json)')
+    p.add_argument('-v', '--verbose', action='store_true', help='show the rule per question')
+    p.set_defaults(func=_cmd_solve)
+
+    p = sub.add_parser('analyze', help='regenerate analysis reports')
+    p.add_argument('names', nargs='*', metavar='name',
+                   help=f"one of: {', '.join(ANALYSES)} (default: all)")
+    p.set_defaults(func=_cmd_analyze)
+
+    p = sub.add_parser('build-html', help='generate os_quiz.html')
+    p.add_argument('--topics', help='topic map JSON to use instead of TOPIC_MAP')
+    p.add_argument('--inline', action='store_true', help='embed CSS and JS in the page')
+    p.set_defaults(func=_cmd_build_html)
+
+    p = sub.add_parser('gen-data', help='generate questions_data.js')
+    p.set_defaults(func=_cmd_gen_data)
+
+    p = sub.add_parser('explain', help='generate os_quiz.html with its Arabic explanations')
+    p.set_defaults(func=_cmd_explain)
+
+    p = sub.add_parser('classify', help='label a question bank with topics')
+    p.add_argument('bank', nargs='?', help='TCPDF text or questions JSON (default: questions.json)')
+    p.add_argument('-o', '--output', help='write the topic map as JSON here')
+    p.set_defaults(func=_cmd_classify)
+
+    p = sub.add_parser('search-index', help='generate the text search index (search_index.js)')
+    p.set_defaults(func=_cmd_search_index)
+
+    p = sub.add_parser('trainer-spans', help='generate the trainer\'s keyword highlight spans (trainer_spans.js)')
+    p.set_defaults(func=_cmd_trainer_spans)
+
+    p = sub.add_parser('serve', help='serve the bank without answers and check them over HTTP')
+    p.add_argument('--host')
+    p.add_argument('--port', type=int)
+    p.add_argument('--questions', help='questions JSON (default: questions.json)')
+    p.set_defaults(func=_cmd_serve)
+
+    p = sub.add_parser('grade', help='grade CSV/JSONL submission files in bulk')
+    p.add_argument('submissions', help='rows of student, qid, answer')
+    p.add_argument('-o', '--output', help='per-student report (.csv or .json)')
+    p.set_defaults(func=_cmd_grade)
+
+    p = sub.add_parser('variant', help='print seeded exam variants of students')
+    p.add_argument('seed', help='exam seed (any string)')
+    p.add_argument('students', nargs='+', metavar='student')
+    p.set_defaults(func=_cmd_variant)
+
+    p = sub.add_parser('sample', help='draw exams that meet topic/type/difficulty quotas')
+    p.add_argument('constraints', nargs='?', help='constraints JSON (default: 30 questions)')
+    p.add_argument('-n', '--count', type=int, default=1)
+    p.add_argument('-o', '--output', help='write the exams as JSON')
+    p.set_defaults(func=_cmd_sample)
+
+    p = sub.add_parser('items', help='item analysis of response logs')
+    p.add_argument('logs', nargs='+', help='CSV/JSONL files of student, qid, answer rows')
+    p.add_argument('-o', '--output', help='per-question report JSON')
+    p.add_argument('--jobs', type=int, help='worker processes (one file each)')
+    p.set_defaults(func=_cmd_items)
+
+    p = sub.add_parser('review', help='spaced-repetition review decks from wrong answers')
+    p.add_argument('logs', nargs='*', help='submission files to replay')
+    p.add_argument('--state', help='review decks file (default: reviews.npz)')
+    p.add_argument('--due', metavar='STUDENT', help='list the due questions of a student')
+    p.add_argument('-n', type=int, default=20)
+    p.set_defaults(func=_cmd_review)
+
+    p = sub.add_parser('adaptive', help='IRT calibration and adaptive testing (adaptive_test.py)')
+    p.add_argument('args', nargs=argparse.REMAINDER, help='calibrate LOG... | simulate | bench')
+    p.set_defaults(func=_cmd_adaptive)
+
+    p = sub.add_parser('trainer-stats', help='aggregate exported algorithm-trainer event logs')
+    p.add_argument('logs', nargs='+', help='trainer_log_*.json files or directories of them')
+    p.add_argument('-o', '--output', help='write the report as JSON')
+    p.set_defaults(func=_cmd_trainer_stats)
+
+    p = sub.add_parser('synth-bank', help='write a synthetic TCPDF question bank')
+    p.add_argument('-n', '--count', type=int, default=1000, help='questions')
+    p.add_argument('-o', '--output', required=True)
+    p.add_argument('--check', action='store_true', help='parse the bank back and compare')
+    p.set_defaults(func=_cmd_synth_bank)
+
+    p = sub.add_parser('bench', help='scaling benchmark of the pipeline on synthetic banks')
+    p.add_argument('--sizes', type=int, nargs='+')
+    p.add_argument('--stages', nargs='+')
+    p.add_argument('--save', help='write the run as a baseline JSON')
+    p.add_argument('--compare', help='rerun a baseline and report regressions')
+    p.set_defaults(func=_cmd_bench)
+    return parser
+
+def main(argv=None):
+    args = make_parser().parse_args(argv)
+    args.func(args)
+
+if __name__ == '__main__':
+    main()
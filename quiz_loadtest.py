@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Load test for quiz_server.py.
+
+Opens --connections keep-alive connections to a running instance and checks
+random answers for --seconds. Each connection pipelines --depth single
+checks (GET /check) per round trip, or with --batch sends --batch answers
+per POST /check and reads the streamed results. Prints checks per second and
+round-trip latency percentiles:
+
+    python quiz_server.py &
+    python quiz_loadtest.py
+    python quiz_loadtest.py --connections 64 --depth 1
+    python quiz_loadtest.py --batch 1000
+    python quiz_loadtest.py --spawn          # start a server for the run
+"""
+import argparse, asyncio, json, os, random, socket, subprocess, sys, time
+
+from quiz_server import HOST, PORT, SCRIPT_DIR
+
+async def read_response(reader):
+    """Body of one HTTP/1.1 response (Content-Length or chunked)"""
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head.split(b' ', 2)[1])
+    if status != 200:
+        raise RuntimeError(head.decode('latin-1').split('\r\n')[0])
+    lower = head.lower()
+    if b'transfer-encoding: chunked' in lower:
+        body = []
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            data = await reader.readexactly(size + 2)
+            if not size:
+                return b''.join(body)
+            body.append(data[:-2])
+    length = int(lower.split(b'content-length:', 1)[1].split(b'\r\n', 1)[0])
+    return await reader.readexactly(length)
+
+async def worker(host, port, ids, args, deadline, stats):
+    reader, writer = await asyncio.open_connection(host, port)
+    rng = random.Random()
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            if args.batch:
+                body = ''.join(f'{{"id":{rng.choice(ids)},"answer":{rng.randrange(4)}}}\n'
+                               for _ in range(args.batch)).encode()
+                writer.write(b'POST /check HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n'
+                             % len(body) + body)
+                lines = (await read_response(reader)).splitlines()
+                summary = json.loads(lines[-1])
+                stats['checks'] += summary['answered']
+                stats['correct'] += summary['correct']
+            else:
+                writer.write(b''.join(
+                    b'GET /check?q=%d&a=%d HTTP/1.1\r\nHost: x\r\n\r\n'
+                    % (rng.choice(ids), rng.randrange(4)) for _ in range(args.depth)))
+                correct = 0
+                for _ in range(args.depth):
+                    correct += json.loads(await read_response(reader))['correct']
+                stats['correct'] += correct
+                stats['checks'] += args.depth
+            stats['latency'].append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+async def run(args):
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    writer.write(b'GET /questions HTTP/1.1\r\nHost: x\r\n\r\n')
+    ids = [q['id'] for q in json.loads(await read_response(reader))]
+    writer.close()
+    stats = {'checks': 0, 'correct': 0, 'latency': []}
+    start = time.perf_counter()
+    deadline = start + args.seconds
+    await asyncio.gather(*(worker(args.host, args.port, ids, args, deadline, stats)
+                           for _ in range(args.connections)))
+    elapsed = time.perf_counter() - start
+    latency = sorted(stats['latency'])
+    pct = lambda p: latency[min(int(p * len(latency)), len(latency) - 1)] * 1000
+    mode = f"batch {args.batch}" if args.batch else f"pipeline depth {args.depth}"
+    print(f"{args.connections} connections, {mode}, {elapsed:.1f}s")
+    print(f"  {stats['checks']} checks = {stats['checks'] / elapsed:,.0f} checks/s "
+          f"({stats['correct']} correct)")
+    print(f"  round trip p50 {pct(0.5):.2f} ms  p99 {pct(0.99):.2f} ms")
+    return stats['checks'] / elapsed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Load test a running quiz_server.py.')
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--connections', type=int, default=16)
+    parser.add_argument('--depth', type=int, default=16, help='pipelined GET /check per round trip')
+    parser.add_argument('--batch', type=int, default=0, help='answers per POST /check instead')
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--spawn', action='store_true', help='start quiz_server.py for the run')
+    args = parser.parse_args(argv)
+    server = None
+    if args.spawn:
+        server = subprocess.Popen([sys.executable, os.path.join(SCRIPT_DIR, 'quiz_server.py'),
+                                   '--host', args.host, '--port', str(args.port)],
+                                  stdout=subprocess.DEVNULL)
+        for _ in range(50):
+            try:
+                socket.create_connection((args.host, args.port), timeout=1).close()
+                break
+            except OSError:
+                time.sleep(0.1)
+    try:
+        asyncio.run(run(args))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Graded practice service: serves the bank without its answers and checks them.
+
+The correct flags never leave the process. At startup every question is
+serialized once without them, and the answer key becomes a flat array of
+correct option indices indexed by question ID, so a check is one index and
+one compare:
+
+  GET  /questions                  the whole bank, options as plain strings
+  GET  /questions?offset=0&limit=20
+  GET  /questions/<id>
+  GET  /check?q=<id>&a=<option>    {"id", "correct"}
+  POST /check                      NDJSON body, one {"id", "answer"} per line;
+                                   the response streams one {"id", "correct"}
+                                   line per answer as the body is read, then
+                                   {"answered", "correct"} (chunked encoding)
+  GET  /review?student=<s>&n=10    {"student", "due"}: question IDs due for review
+
+With --reviews, a check that names a student (student=<s> on /check, a
+"student" key per POST line) also feeds their review deck
+(review_scheduler.ReviewStore: wrong answers come back on an SM-2
+schedule; a student gets a deck with their first wrong answer, so right
+answers alone add nothing), and the decks are saved to that file on
+shutdown.
+
+HTTP/1.1 keep-alive and pipelining are supported; the server is plain asyncio
+streams, one coroutine per connection:
+
+    python quiz_server.py                    # http://127.0.0.1:8765
+    python quiz_server.py --port 9000 --questions other_bank.json
+    python quiz_server.py --reviews reviews.npz
+    python quiz_loadtest.py                  # load test a running instance
+"""
+import argparse, asyncio, json, os, signal
+from array import array
+from urllib.parse import parse_qs, urlsplit
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+HOST, PORT = '127.0.0.1', 8765
+MAX_HEADER = 16 * 1024
+# bytes of a POST /check body read at a time; each block's results go out
+# as one response chunk
+READ_BLOCK = 16 * 1024
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           411: 'Length Required', 413: 'Payload Too Large'}
+
+def answer_key(questions):
+    """array('b') of correct option indices indexed by question ID (-1: no question)"""
+    key = array('b', [-1]) * (max((q['id'] for q in questions), default=0) + 1)
+    for q in questions:
+        correct = [i for i, o in enumerate(q['options']) if o['correct']]
+        key[q['id']] = correct[0] if correct else -1
+    return key
+
+def public_question(q):
+    """A question as clients see it: no correctness bits"""
+    return {'id': q['id'], 'text': q['text'], 'options': [o['text'] for o in q['options']]}
+
+def _json(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+class QuizService:
+    def __init__(self, questions, reviews=None):
+        self.key = answer_key(questions)
+        self.reviews = reviews
+        self.ids = [q['id'] for q in questions]
+        self.blobs = {q['id']: _json(public_question(q)) for q in questions}
+        self.all_questions = b'[' + b','.join(self.blobs[qid] for qid in self.ids) + b']'
+        # the two possible single-check bodies per question, built on demand
+        self._checks = {}
+
+    def check(self, qid, answer, student=None):
+        """True/False, or None for an unknown question"""
+        if not 0 <= qid < len(self.key) or self.key[qid] < 0:
+            return None
+        ok = self.key[qid] == answer
+        if student is not None and self.reviews is not None:
+            self.reviews.answer(student, qid, ok)
+        return ok
+
+    def check_body(self, qid, ok):
+        body = self._checks.get((qid, ok))
+        if body is None:
+            body = self._checks[qid, ok] = _json({'id': qid, 'correct': ok})
+        return body
+
+    def page(self, offset, limit):
+        ids = self.ids[offset:offset + limit]
+        return b'[' + b','.join(self.blobs[qid] for qid in ids) + b']'
+
+    # -- HTTP ------------------------------------------------------------------
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.IncompleteReadError:
+                    break
+                except asyncio.LimitOverrunError:
+                    self._respond(writer, 413, _json({'error': 'headers too large'}), False)
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ')
+                except ValueError:
+                    self._respond(writer, 400, _json({'error': 'bad request line'}), False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, sep, value = line.partition(':')
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and version == 'HTTP/1.1')
+                if not await self._route(method, target, headers, reader, writer, keep_alive):
+                    break
+                if not keep_alive:
+                    break
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            try:
+                await writer.drain()
+                writer.close()
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _route(self, method, target, headers, reader, writer, keep_alive):
+        """Answer one request; returns False if the connection must close"""
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+        if path == '/check' and method == 'POST':
+            return await self._stream_checks(headers, reader, writer, keep_alive)
+        if method != 'GET':
+            # its body is not read, so the connection cannot be reused
+            self._respond(writer, 405, _json({'error': 'method not allowed'}), False)
+            return False
+        params = parse_qs(url.query)
+        status, body = 200, None
+        try:
+            if path == '/check':
+                qid, answer = int(params['q'][0]), int(params['a'][0])
+                ok = self.check(qid, answer, params.get('student', [None])[0])
+                if ok is None:
+                    status, body = 404, _json({'error': f'no question {qid}'})
+                else:
+                    body = self.check_body(qid, ok)
+            elif path == '/questions':
+                if 'offset' in params or 'limit' in params:
+                    offset = int(params.get('offset', ['0'])[0])
+                    limit = int(params.get('limit', [str(len(self.ids))])[0])
+                    body = self.page(max(offset, 0), max(limit, 0))
+                else:
+                    body = self.all_questions
+            elif path == '/review':
+                student = params['student'][0]
+                limit = int(params.get('n', ['10'])[0])
+                # a read: an unknown student has nothing due and gets no deck
+                deck = self.reviews.decks.get(student) if self.reviews else None
+                due = deck.due(limit=limit) if deck is not None else []
+                body = _json({'student': student, 'due': due})
+            elif path.startswith('/questions/'):
+                body = self.blobs.get(int(path.rsplit('/', 1)[1]))
+                if body is None:
+                    status, body = 404, _json({'error': 'no such question'})
+            else:
+                status, body = 404, _json({'error': 'not found'})
+        except (KeyError, ValueError):
+            status, body = 400, _json({'error': 'expected integer parameters'})
+        self._respond(writer, status, body, keep_alive)
+        return True
+
+    async def _stream_checks(self, headers, reader, writer, keep_alive):
+        try:
+            remaining = int(headers['content-length'])
+        except (KeyError, ValueError):
+            self._respond(writer, 411, _json({'error': 'Content-Length required'}), False)
+            return False
+        writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n'
+                     b'Transfer-Encoding: chunked\r\nAccess-Control-Allow-Origin: *\r\n'
+                     + (b'' if keep_alive else b'Connection: close\r\n') + b'\r\n')
+        answered = correct = 0
+        partial = b''
+        while remaining > 0:
+            block = await reader.read(min(remaining, READ_BLOCK))
+            if not block:
+                return False
+            remaining -= len(block)
+            lines = (partial + block).split(b'\n')
+            # the last piece is a line cut by the block end (or the body's last line)
+            partial = lines.pop() if remaining else b''
+            out = []
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    item = json.loads(line)
+                    qid, answer = int(item['id']), int(item['answer'])
+                    student = item.get('student')
+                    if student is not None and not isinstance(student, str):
+                        raise TypeError('student must be a string')
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    out.append(_json({'error': 'bad line',
+                                      'line': line.decode('utf-8', 'replace')[:80]}))
+                    continue
+                ok = self.check(qid, answer, student)
+                if ok is None:
+                    out.append(_json({'id': qid, 'error': 'no such question'}))
+                else:
+                    answered += 1
+                    correct += ok
+                    out.append(self.check_body(qid, ok))
+            if out:
+                self._write_chunk(writer, out)
+                await writer.drain()
+            if len(partial) > MAX_HEADER:
+                return False
+        self._write_chunk(writer, [_json({'answered': answered, 'correct': correct})])
+        writer.write(b'0\r\n\r\n')
+        return keep_alive
+
+    @staticmethod
+    def _write_chunk(writer, lines):
+        data = b'\n'.join(lines) + b'\n'
+        writer.write(b'%x\r\n' % len(data) + data + b'\r\n')
+
+    @staticmethod
+    def _respond(writer, status, body, keep_alive):
+        writer.write(b'HTTP/1.1 %d %s\r\nContent-Type: application/json; charset=utf-8\r\n'
+                     b'Content-Length: %d\r\nAccess-Control-Allow-Origin: *\r\n%s\r\n'
+                     % (status, REASONS[status].encode(), len(body),
+                        b'' if keep_alive else b'Connection: close\r\n')
+                     + body)
+
+async def serve(questions, host=HOST, port=PORT, ready=None, reviews=None):
+    """Run the service until cancelled or sent SIGINT/SIGTERM; `ready` (an
+    asyncio.Event) is set once listening"""
+    service = QuizService(questions, reviews)
+    server = await asyncio.start_server(service.handle, host, port, limit=MAX_HEADER)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows, or not the main thread: Ctrl+C raises KeyboardInterrupt
+    if ready is not None:
+        ready.set()
+    async with server:
+        await stop.wait()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve the question bank without its answers.')
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--questions', default=os.path.join(SCRIPT_DIR, 'questions.json'))
+    parser.add_argument('--reviews', help='review decks (.npz) to load, update and save')
+    args = parser.parse_args(argv)
+    with open(args.questions, 'r', encoding='utf-8') as f:
+        questions = json.load(f)
+    reviews = None
+    if args.reviews:
+        from generate_html import TOPIC_INDEX
+        from review_scheduler import ReviewStore
+        reviews = ReviewStore.load(args.reviews, TOPIC_INDEX) if os.path.exists(args.reviews) \
+            else ReviewStore(TOPIC_INDEX)
+    print(f"Serving {len(questions)} questions on http://{args.host}:{args.port}", flush=True)
+    try:
+        asyncio.run(serve(questions, args.host, args.port, reviews=reviews))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if reviews is not None:
+            reviews.save(args.reviews)
+            print(f"Saved review decks to {args.reviews}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""Spaced-repetition review scheduler (SM-2) driven by wrong answers.
+
+A wrong answer puts the question in the student's deck, due again after
+RELEARN minutes; every later answer is an SM-2 review (quality 1 when
+wrong, 4 when right, or an explicit 0-5 grade) that resets or stretches the
+interval and adjusts the card's easiness. Questions answered right the
+first time are never scheduled.
+
+Each deck keeps its cards in a dict and its due times in a heap of
+(due, qid), plus one heap per topic (TOPIC_INDEX) for topic-filtered
+review; a rescheduled card pushes a new entry and stale entries are
+dropped when they reach the top, so next() is O(log n).
+
+State is compact: a ReviewStore of many students saves every card as one
+20-byte record of a NumPy structured array (CARD) plus the list of student
+names, in one .npz. Times are minutes since the epoch:
+
+    python review_scheduler.py logs.csv --state reviews.npz     # replay answers
+    python review_scheduler.py --state reviews.npz --due s17 -n 10
+    python review_scheduler.py --state reviews.npz --summary
+"""
+import argparse, heapq, os, time
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# first step after a wrong answer, and the SM-2 intervals of the first two
+# successful reviews, in minutes
+RELEARN = 10
+FIRST, SECOND = 24 * 60, 6 * 24 * 60
+EF_START, EF_MIN = 2.5, 1.3
+WRONG_QUALITY, RIGHT_QUALITY = 1, 4
+
+CARD = np.dtype([('student', '<u4'), ('qid', '<u4'), ('due', '<i4'), ('interval', '<u4'),
+                 ('ef', '<u1'), ('reps', '<u1'), ('lapses', '<u2')])
+
+def now_minutes():
+    return int(time.time() // 60)
+
+def _ef_code(ef):
+    # easiness stored as hundredths above EF_MIN in one byte (1.30 .. 3.85)
+    return min(int(round((ef - EF_MIN) * 100)), 255)
+
+def _ef(code):
+    return EF_MIN + code / 100
+
+class Deck:
+    """One student's cards: qid -> [due, interval, ef code, reps, lapses]"""
+
+    def __init__(self, topic_index=None):
+        self.cards = {}
+        self.topic_index = topic_index
+        self._heap = []
+        self._topic_heaps = {}
+
+    def __len__(self):
+        return len(self.cards)
+
+    def _push(self, qid, due):
+        heapq.heappush(self._heap, (due, qid))
+        if self.topic_index is not None:
+            for topic in self.topic_index.topics_of(qid):
+                heapq.heappush(self._topic_heaps.setdefault(topic, []), (due, qid))
+
+    def answer(self, qid, correct, at=None, quality=None):
+        """Record an answer; returns the card's new due time, or None if unscheduled"""
+        at = now_minutes() if at is None else at
+        if quality is None:
+            quality = RIGHT_QUALITY if correct else WRONG_QUALITY
+        card = self.cards.get(qid)
+        if card is None:
+            if quality >= 3:
+                return None
+            card = self.cards[qid] = [0, 0, _ef_code(EF_START), 0, 0]
+        due, interval, ef_code, reps, lapses = card
+        ef = max(EF_MIN, _ef(ef_code) + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        if quality < 3:
+            reps, interval, lapses = 0, RELEARN, lapses + 1
+        else:
+            reps += 1
+            interval = FIRST if reps == 1 else SECOND if reps == 2 else int(interval * ef)
+        card[:] = [at + interval, interval, _ef_code(ef), min(reps, 255), min(lapses, 65535)]
+        self._push(qid, card[0])
+        return card[0]
+
+    def _top(self, heap):
+        """Drop stale heap entries; the valid (due, qid) on top or None"""
+        cards = self.cards
+        while heap:
+            due, qid = heap[0]
+            card = cards.get(qid)
+            if card is not None and card[0] == due:
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def peek(self, topic=None):
+        """(due, qid) of the card due first, optionally within a topic"""
+        if topic is None:
+            return self._top(self._heap)
+        return self._top(self._topic_heaps.get(self.topic_index.resolve(topic), []))
+
+    def next(self, at=None, topic=None):
+        """qid of the most overdue card due by `at`, or None"""
+        top = self.peek(topic)
+        at = now_minutes() if at is None else at
+        return top[1] if top and top[0] <= at else None
+
+    def due(self, at=None, limit=None, topic=None):
+        """Cards due by `at`, most overdue first (the heap is left intact)"""
+        at = now_minutes() if at is None else at
+        heap = self._heap if topic is None else \
+            self._topic_heaps.get(self.topic_index.resolve(topic), [])
+        out, popped = [], []
+        while limit is None or len(out) < limit:
+            top = self._top(heap)
+            if top is None or top[0] > at:
+                break
+            popped.append(heapq.heappop(heap))
+            out.append(top[1])
+        for entry in popped:
+            heapq.heappush(heap, entry)
+        return out
+
+    def rebuild(self):
+        self._heap = []
+        self._topic_heaps = {}
+        for qid, card in self.cards.items():
+            self._push(qid, card[0])
+
+class ReviewStore:
+    """Decks of many students, with a heap of (next due, student) over them"""
+
+    def __init__(self, topic_index=None):
+        self.topic_index = topic_index
+        self.decks = {}
+        self._heap = []
+
+    def deck(self, student):
+        deck = self.decks.get(student)
+        if deck is None:
+            deck = self.decks[student] = Deck(self.topic_index)
+        return deck
+
+    def answer(self, student, qid, correct, at=None, quality=None):
+        # like a right answer to a question without a card: no deck either
+        if student not in self.decks and (correct if quality is None else quality >= 3):
+            return None
+        deck = self.deck(student)
+        before = deck.peek()
+        due = deck.answer(qid, correct, at, quality)
+        after = deck.peek()
+        if after is not None and after != before:
+            heapq.heappush(self._heap, (after[0], student))
+        return due
+
+    def due_students(self, at=None):
+        """Students with at least one card due by `at`, most overdue first"""
+        at = now_minutes() if at is None else at
+        out, popped, seen = [], [], set()
+        while self._heap and self._heap[0][0] <= at:
+            entry = heapq.heappop(self._heap)
+            top = self.decks[entry[1]].peek()
+            if top is not None and top[0] == entry[0] and entry[1] not in seen:
+                seen.add(entry[1])
+                out.append(entry[1])
+                popped.append(entry)
+        for entry in popped:
+            heapq.heappush(self._heap, entry)
+        return out
+
+    def next_batch(self, students, at=None):
+        """{student: next due qid or None} for many students at once"""
+        at = now_minutes() if at is None else at
+        return {s: (self.decks[s].next(at) if s in self.decks else None) for s in students}
+
+    # -- persistence -------------------------------------------------------------
+
+    def to_array(self):
+        """(CARD records of every card, student names)"""
+        names = list(self.decks)
+        records = [(code, qid, *card) for code, name in enumerate(names)
+                   for qid, card in self.decks[name].cards.items()]
+        return np.array(records, dtype=CARD), names
+
+    def save(self, path):
+        cards, names = self.to_array()
+        np.savez_compressed(path, cards=cards, students=np.array(names, dtype=str))
+
+    @classmethod
+    def load(cls, path, topic_index=None):
+        store = cls(topic_index)
+        data = np.load(path)
+        names = data['students'].tolist()
+        for name in names:
+            store.deck(name)
+        for student, qid, due, interval, ef, reps, lapses in data['cards'].tolist():
+            store.decks[names[student]].cards[qid] = [due, interval, ef, reps, lapses]
+        for name, deck in store.decks.items():
+            deck.rebuild()
+            top = deck.peek()
+            if top is not None:
+                store._heap.append((top[0], name))
+        heapq.heapify(store._heap)
+        return store
+
+    def summary(self, at=None):
+        """Vectorized totals over all cards: students, cards, due now, mean lapses"""
+        at = now_minutes() if at is None else at
+        cards, names = self.to_array()
+        due = cards['due'] <= at
+        return {'students': len(names), 'cards': len(cards), 'due': int(due.sum()),
+                'students_due': int(np.unique(cards['student'][due]).size),
+                'mean_lapses': float(cards['lapses'].mean()) if len(cards) else 0.0}
+
+def replay(store, path, key, at=None):
+    """Feed submission rows (bulk_grader format, in file order) into the store,
+    all answered at `at`; returns the rows used"""
+    from bulk_grader import read_rows
+    at = now_minutes() if at is None else at
+    rows = 0
+    for students, qids, answers in read_rows(path):
+        for student, qid, answer in zip(students, qids, answers):
+            qid, answer = int(qid), int(answer)
+            if 0 <= qid < len(key) and key[qid] >= 0:
+                store.answer(str(student), qid, key[qid] == answer, at)
+                rows += 1
+    return rows
+
+def main(argv=None):
+    from generate_html import TOPIC_INDEX
+    from item_analysis import load_key
+    parser = argparse.ArgumentParser(description='SM-2 review schedules from wrong answers.')
+    parser.add_argument('logs', nargs='*', help='submission files to replay (student, qid, answer)')
+    parser.add_argument('--state', default=os.path.join(SCRIPT_DIR, 'reviews.npz'))
+    parser.add_argument('--due', metavar='STUDENT', help='list the due questions of a student')
+    parser.add_argument('--topic', help='only questions of this topic')
+    parser.add_argument('-n', type=int, default=20)
+    parser.add_argument('--summary', action='store_true')
+    args = parser.parse_args(argv)
+
+    store = ReviewStore.load(args.state, TOPIC_INDEX) if os.path.exists(args.state) \
+        else ReviewStore(TOPIC_INDEX)
+    if args.logs:
+        key = load_key()[0]
+        start = time.perf_counter()
+        rows = sum(replay(store, path, key) for path in args.logs)
+        store.save(args.state)
+        print(f"Replayed {rows} answers in {time.perf_counter() - start:.2f}s; "
+              f"saved {os.path.getsize(args.state)} bytes to {args.state}")
+    if args.due:
+        # an hour ahead, so a just-replayed relearn step shows up
+        ids = store.deck(args.due).due(now_minutes() + 60, args.n, args.topic)
+        print(f"{args.due}: {' '.join(map(str, ids)) or 'nothing due'}")
+    if args.summary or not (args.logs or args.due):
+        print(store.summary())
+
+if __name__ == '__main__':
+    main()
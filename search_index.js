@@ -0,0 +1 @@
+const SEARCH_INDEX = {"v":1,"fields":["question","tooltip","explanation","option"],"terms":["10","11","about","above","absolute","access","accessing","accounting","achieved","acl","act","activities","additional","address","advance","advantage","algorithm","algorithms","all","allocate","allocated","allocates","allocating","allocation","allow","allowing","allows","also","among","amount","an","and","android","another","antivirus","apfs","apple","application","applications","applying","are","arrives","as","assembler","assign","assigned","assigning","associated","at","atomic","attack","attacks","attribute","audit","authentication","available","avoidance","avoiding","banker","bare","base","based","batch","be","before","best","better","between","bios","block","blocked","blocks","booting","bootloader","both","bound","bounded","brk","brought","browser","browsing","bsd","buffer","buffering","burst","busy","but","by","cache","call","called","calling","calls","can","cannot","caused","causes","central","changes","changing","character","chrome","circular","cli","close","code","collection","come","command","commands","communicate","communication","compaction","compiler","compiles","compiling","completed","completion","complexity","component","components","computations","computer","concurrency","concurrent","concurrently","condition","conditions","configuration","constitutes","consumption","contain","contained","contains","context","contiguous","control","controlling","controls","convoy","copy","copying","core","cores","corresponding","corruption","cost","counter","cpu","create","created","creates","criteria","critical","cycle","darwin","data","database","dbms","ddos","deadline","deadlines","deadlock","deadlocks","deallocate","deallocation","debugging","decrease","decreases","default","defragmentation","demand","depends","designed","detailed","details","detect","detection","determines","device","devices","different","difficult","difficulty","direct","directly","directories","directory","disadvantage","disk","distributed","divides","dma","document","documents","does","doing","done","dos","driver","drivers","dual","due","duplicate","during","dynamically","each","earliest","easier","edf","editing","editor","edits","effect","effectively","efficiency","efficient","efficiently","efs","eliminates","embedded","enable","encrypt","encrypting","encryption","enhance","enhances","ensures","ensuring","entertainment","entire","entries","entry","environment","error","errors","even","events","example","exceeds","excessive","exclusion","exclusively","exe","exec","execute","executed","executes","executing","execution","exit","ext","ext2","ext4","extension","external","fails","false","fashion","fat","fat32","fault","faults","fcfs","feature","features","feedback","fifo","file","files","firewall","first","fit","fixed","following","for","forever","fork","fragmentation","frame","frames","freebsd","frequently","friendly","from","fscrypt","full","function","functions","gaming","generally","generated","gives","global","goal","goes","google","graph","graphical","gui","handle","handles","handling","happens","hard","hardware","has","have","he","heap","helps","hfs","hierarchy","high","higher","highest","hold","id","identifies","identify","if","implement","implementing","importance","improve","improved","improves","improving","in","includes","increase","increased","increases","increasing","indexed","inefficient","information","init","inode","input","instruction","inter","interact","interacts","interface","interfering","internal","internet","interpreter","interrupt","interrupted","interrupts","intervention","into","involves","ios","ipc","is","it","its","itself","job","join","journaling","keep","keeping","keeps","kernel","key","keyboard","kill","language","large","larger","least","less","level","lfu","lightweight","like","limited","line","link","linked","linker","linux","list","lists","load","loaded","loader","loads","logging","logical","logs","long","lookaside","lost","low","lru","machine","macos","made","main","mainly","maintaining","maintains","makes","malloc","manage","management","manager","manages","managing","manipulate","manipulation","manner","many","mapping","maximize","mechanism","medium","memory","mentioned","metadata","metal","method","methods","microprocessors","microsoft","minimize","minimizes","mmu","mode","modern","modules","monitoring","more","most","mouse","moved","moving","ms","multi","multicore","multilevel","multiple","multiprogramming","multithreaded","multithreading","must","mutex","mutual","name","natively","necessary","need","needed","network","networked","networking","new","next","no","non","none","not","nt","ntfs","number","occur","occurs","of","on","one","only","open","operating","operation","operations","opt","optimal","optimize","order","organize","organizes","organizing","os","other","out","outcome","output","overhead","overloaded","page","pages","paging","parallel","parallelism","part","particular","passwords","pc","pcb","performance","performed","permanently","permissions","phishing","physical","physically","pid","pipe","place","points","pool","posix","possible","power","pre","preemption","preemptive","pretending","prevent","prevented","preventing","prevention","prevents","primary","printer","priorities","prioritizes","priority","problem","process","processe","processes","processing","processor","processors","program","programming","programs","progress","protect","protecting","protection","protects","provide","provider","provides","providing","pthread","pthreads","purpose","purposes","python","quantum","queries","queue","queued","quick","race","rag","ram","read","ready","real","recently","recording","records","recovery","reduce","reduced","reduces","reducing","refers","register","relation","release","remain","remainder","remaining","remains","remove","replacement","request","requests","required","requirements","requires","resolve","resolving","resource","resources","response","responsibility","responsible","retrieval","robin","role","rom","round","rr","rtos","run","runin","running","runs","safe","same","scan","schedule","scheduled","scheduler","schedules","scheduling","secondary","section","security","seek","segmentation","segments","selects","semaphore","semaphores","separate","separately","sequentially","serve","service","services","session","set","settings","several","share","shared","sharing","shell","short","shortest","signal","simulate","simultaneously","single","size","sized","sjf","sjn","slot","slower","smallest","so","software","solaris","solution","some","source","space","spaces","specifies","speed","spend","spends","spoofing","spooling","srtf","ssd","sstf","stack","stacks","start","starts","starvation","state","stop","storage","store","stores","structure","structured","structures","such","suffers","supports","suppose","swapping","switch","switching","synchronization","system","systems","table","takes","tasks","technique","technology","temporary","term","terminate","terminated","terminates","text","than","that","the","their","them","then","there","these","this","thrashing","thread","threaded","threads","throughput","time","times","tlb","to","too","tool","track","tracking","trails","transfer","transfers","translating","translation","tries","true","trying","two","txt","type","types","typing","ubuntu","uefi","ufs","unable","unauthorized","underutilized","unit","unix","unused","usage","use","used","user","users","using","utilities","utility","utilization","variables","various","virtual","virtualization","wait","waiting","waits","want","wasted","wating","way","we","web","what","when","which","why","will","windows","with","within","without","word","work","worst","write","xp","zfs","اب","ابد","ابسط","ابقاء","ابن","اتصال","اتصالات","اثناء","اجزاء","اجهزه","احاديه","احتفاظ","احتماليه","احتوي","احد","احدي","اخر","اخراج","اخري","اخطاء","اداء","اداره","اداه","ادخال","ادق","ادله","ادوات","ادوار","اذا","اربعه","اساسي","اساسيه","استباق","استباقيه","استبدال","استبعاد","استجابه","استخدام","استخدامه","استخدامها","استدعاء","استدعاءات","استعاده","استعداد","استعلامات","استغلال","استغلاله","استكمال","استهلاك","اسم","اسماء","اسمه","اشارات","اشاره","اصغر","اصلا","اصلاح","اصليه","اضافيه","اطار","اطارات","اطول","اعدادات","اعلي","اغراض","افتراضي","افتراضيا","افتراضيه","افضل","اقراص","اقرب","اقصر","اقلاع","اكبر","اكتمال","اكثر","اكفا","ال","الاب","الاتصال","الاتصالات","الاجهزه","الاحتفاظ","الاخراج","الاخري","الاخطاء","الاداء","الاداره","الادخال","الادله","الاربعه","الاساسي","الاساسيه","الاستباق","الاستباقيه","الاستبعاد","الاستجابه","الاستخدام","الاستعداد","الاسم","الاشارات","الاشاره","الاصليه","الاطارات","الافتراضي","الافتراضيه","الاقرب","الاقصر","الاقلاع","الاكثر","الاله","الامان","الامتداد","الامكان","الامن","الامنيه","الانبوب","الانتاجيه","الانتحال","الانترنت","الانتظار","الانتقال","الانسب","الانظمه","الاهميه","الاوامر","الاوقات","الاول","الاولويه","الاولي","البحث","البرامج","البرمجه","البرنامج","البطء","البقيه","البنك","البيانات","التاليه","التبديل","التجزئه","التجميع","التجنب","التحقق","التحكم","التحميل","التخبط","التخزين","التخصيص","التداخل","التدقيق","الترتيب","الترجمه","الترحيل","الترفيه","التزامن","التسجيل","التسلسل","التشغيل","التشفير","التصيد","التطبيق","التطبيقات","التطبيقيه","التظاهر","التعامل","التعريف","التعقيد","التعليمه","التعيين","التغييرات","التفاعل","التقدم","التقسيم","التقليدي","التقنيات","التكلفه","التنسيق","التنفيذ","التنقيح","التهديدات","التوازي","التواصل","التي","الثالث","الثاني","الجاريه","الجدوله","الجزء","الجلسه","الجمود","الجهاز","الجواب","الحاجه","الحاسوب","الحالات","الحالي","الحجم","الحديثه","الحرج","الحزم","الحسابات","الحقيقي","الحل","الحمايه","الحمل","الخادم","الخارجيه","الخاصه","الخدمات","الخدمه","الخروج","الخلفيه","الخوارزميات","الخيار","الخيط","الخيوط","الدائري","الداخليه","الداله","الدخول","الدفعات","الدليل","الدوال","الدور","الديناميكي","الذاكره","الذريتان","الذريه","الذي","الرئيسي","الرئيسيه","الرابط","الراس","الربط","الرد","الزائد","الزمنيه","السؤال","السباق","السجلات","السماح","السياق","الشبكات","الشبكه","الشخصيه","الشروط","الشريحه","الصحيح","الصدفه","الصفحات","الصفحه","الصلب","الصناعي","الضائعه","الضروري","الضغط","الطابعه","الطاقه","الطباعه","الطريقه","الطلب","الطلبات","الطوابير","الطويله","العاب","العاليه","العامه","العباره","العتاد","العشوائي","العمل","العمليات","العمليتان","العمليه","العناوين","العنوان","العيب","الغاء","الغرض","الفارغه","الفاره","الفراغات","الفعلي","الفوريه","الفيروسات","الفيزيائي","الفيزيائيه","القافله","القديم","القرص","القسم","القياسيه","الكامله","الكبيره","الكتابه","الكتل","الكتله","الكشف","الكود","الكومه","المؤقت","المباشر","المتبادل","المتبقي","المتجاور","المترجم","المترجمه","المتزامنه","المتصل","المتصله","المتطلبات","المتعدده","المتعددين","المتغيرات","المتوازيه","المثالي","المجاعه","المجدول","المجمع","المحارف","المحاسبه","المحدود","المحليه","المحمل","المحموله","المختلفه","المخزن","المخصصه","المدمج","المدي","المذكوره","المرتبط","المركزيه","المرور","المزدوجه","المزوده","المسؤول","المسؤوله","المسؤوليه","المساحات","المساحه","المسبق","المستخدم","المستخدمه","المستخدمين","المستدعي","المستندات","المستويات","المشابهه","المشاركه","المشترك","المشتركه","المشكله","المصادقه","المصدر","المصدري","المصرح","المصرفي","المطلق","المعالج","المعالجه","المعرف","المعيار","المفاتيح","المفتوحه","المفرط","المفسر","المفهرس","المقابل","المقاطعات","المقاطعه","المقفله","المقيده","المكدس","المكدسات","المكون","الملف","الملفات","المنجزه","المنخفض","المنطق","المنطقي","المنطقيه","المنع","المنفصله","المهام","الموارد","المواعيد","الموزع","الميزه","الناتجه","النسخ","النص","النظام","النقل","النهائيه","النواه","النوع","النوي","اله","الهجمات","الهدف","الهرمي","الواجهه","الواحد","الواحده","الوزن","الوصفيه","الوصول","الوضع","الوظائف","الوظيفه","الوقت","الويب","الي","اليه","امان","امتداد","امتلاء","امر","امكان","امكانيه","امن","امنه","امنيه","ان","انبوب","انتاجيه","انتحال","انترنت","انتظار","انتقال","انتهت","انخفاض","انسب","انشطه","انظمه","انهاء","اهداف","اهم","اهميتها","اهميه","او","اوامر","اوقات","اول","اولا","اولويات","اولويه","اولي","اي","ايضا","ايقونات","باجهزه","باحداث","باختيار","باستخدام","باستمرار","باعطاء","باقي","بالاجهزه","بالاحتفاظ","بالادخال","بالتتابع","بالتسجيل","بالتطبيقات","بالتعريف","بالتفاعل","بالجمود","بالضروره","بالطلبات","بالعتاد","بالعمل","بالعمليات","بالفعل","بالمعالج","بالمعني","بالوصول","بانك","ببرامج","بتجميع","بتجنب","بتخزين","بتخصيص","بتشغيل","بتعدد","بتكرار","بتنفيذ","بجدول","بجدوله","بجميع","بجهاز","بحث","بحمايه","بدون","برامج","برمجه","برمجي","برمجيات","برمجيه","برنامج","برنامجا","بسبب","بسجلات","بسطر","بسهوله","بسيط","بسيطه","بشكل","بطء","بطريقه","بعد","بعده","بعضها","بعمليه","بفعاليه","بفلتره","بقاء","بقيه","بكتابه","بكفاءه","بكل","بل","بلا","بمحرف","بمشاركتها","بناء","بنفس","بنقل","بنك","بنيه","به","بها","بواسطه","بيئه","بيانات","بين","بينها","بينهما","تاثير","تاخير","تاليه","تبادل","تبدا","تبديل","تبقي","تتابع","تتبع","تتتبع","تتحقق","تتحكم","تتشارك","تتضمن","تتعامل","تتفاعل","تتكون","تتم","تجاوز","تجريد","تجزئه","تجعل","تجمع","تجميع","تجنب","تحاكي","تحاول","تحتاج","تحتجزها","تحتفظ","تحتوي","تحجز","تحدث","تحدد","تحديد","تحديدا","تحرم","تحرير","تحسن","تحسين","تحقق","تحقيق","تحكم","تحمل","تحمي","تحميل","تخبط","تخبطا","تختار","تخدم","تخزن","تخزين","تخصص","تخصيص","تداخل","تدخل","تدقيق","تدير","ترتيب","ترجمه","ترحيل","ترسل","ترفيه","تزامن","تزيد","تساعد","تسبب","تسببه","تستبدل","تستخدم","تستطيع","تسجيل","تسلسل","تسمح","تسمي","تشغيل","تشفير","تشفيرا","تشمل","تشير","تصفح","تصل","تصيد","تضمن","تطبيق","تطبيقات","تطبيقها","تطبيقي","تطبيقيه","تظاهر","تعامل","تعاني","تعبير","تعتمد","تعدد","تعريف","تعطي","تعظيم","تعقيد","تعليمه","تعمل","تعني","تعود","تعيين","تغيير","تغييرات","تفاصيل","تفاعل","تقاطع","تقترب","تقدم","تقديم","تقسم","تقسيم","تقسيمها","تقضي","تقضيه","تقلل","تقليدي","تقليل","تقنيا","تقنيات","تقنيه","تقوم","تكلفه","تكون","تلف","تماما","تمثل","تملك","تمنح","تمنع","تنتظر","تنتظره","تنتقل","تنته","تنسيق","تنشئ","تنظم","تنظيم","تنفذ","تنفيذ","تنفيذها","تنقصه","تنقيح","تنهي","تهديدات","توازي","تواصل","توجد","توزيعات","توسع","توفر","توفير","تي","ثابته","ثالث","ثانوي","ثاني","ثم","ثنائي","جاريه","جانب","جاهزه","جدار","جدول","جدوله","جديد","جديدا","جديده","جزء","جزئي","جزئيا","جلسه","جمود","جمودا","جميع","جميعها","جهاز","جواب","جيده","حاجه","حاسوب","حالات","حاله","حالي","حاليا","حتي","حجم","حد","حدث","حدوثه","حديثه","حذف","حرج","حركه","حزم","حسابات","حسب","حصريا","حصول","حفظ","حقيقي","حل","حمايه","حمل","حواسيب","حول","حياه","حيث","خادم","خارجيه","خاصه","خاصيه","خاطئ","خاطئه","خداع","خدمات","خدمه","خروج","خصيصا","خطا","خفيفه","خلال","خلفيه","خوارزميات","خوارزميه","خيار","خيط","خيطا","خيوط","دائري","دائما","دائمه","داخل","داخليه","داله","دخول","دفعات","دليل","دوال","دور","دوره","ديناميكي","ديناميكيا","ذات","ذاكره","ذريتان","ذريه","ذكر","ذي","رئيسي","رئيسيه","رابط","راس","ربط","رد","رسم","رسوميه","زائد","زمنيا","زمنيه","زياده","سؤال","سئلت","سباق","سببه","سجلات","سرعه","سريع","سريعا","سريعه","سطر","سطرا","سلامه","سماح","سهله","سواء","سياق","شبكات","شبكه","شبكيه","شخص","شخصيه","شرائح","شرط","شروط","شريحه","شيء","شيوعا","صحيح","صحيحا","صحيحه","صدفه","صعبه","صفحات","صفحه","صلاحيات","صلب","صناعي","ضائعه","ضروره","ضروري","ضروريه","ضغط","ضمان","ضمن","طابعه","طابور","طاقه","طباعه","طبقه","طبيعي","طبيعيه","طرفيات","طرق","طريق","طريقه","طلب","طلبات","طوابير","طوال","طور","طويل","طويله","عاب","عاده","عال","عاليه","عام","عامه","عباره","عبر","عتاد","عتاديه","عداد","عدد","عدم","عده","عشوائي","عكس","علاقه","علي","عمل","عمليات","عمليتان","عمليه","عموما","عن","عناوين","عند","عندما","عنه","عنهما","عنوان","عيب","غاء","غرض","غير","فائده","فارغه","فاره","فتحجز","فتره","فتقلل","فراغات","فستنتهي","فشل","فعل","فعلا","فعلي","فعليا","فعليه","فقط","فلا","فلن","فهرس","فهناك","فوريه","فوق","في","فيروسات","فيزيائي","فيزيائيه","فيقضي","فيما","فيه","قائم","قائمه","قابله","قافله","قبل","قد","قدر","قديم","قراءه","قرص","قريب","قسم","قصير","قصيره","قله","قليلا","قوائم","قواعد","قياسيه","قيد","كافيا","كامتداد","كامله","كانت","كانظمه","كبير","كبيره","كتابه","كتل","كتلا","كتله","كتلي","كثره","كذلك","كشف","كفاءه","كل","كلاهما","كلمات","كود","كوسيط","كومه","لا","لابقاء","لاتاحه","لاجهزه","لاداره","لاستخدام","لاطول","لاعلام","لاغراض","لامن","لانشاء","لانظمه","لانه","لانها","لانهاء","لاي","لبرنامج","لتتبع","لتجنب","لتحميل","لتحويل","لتخزين","لتخصيص","لتسريع","لتشغيل","لتطبيقات","لتعدد","لتقليل","لتلقي","لتنظيم","لتنفيذ","لتوفير","لجدوله","لجميع","لحاله","لحدوث","لحل","لحمايه","لخدمه","لخيط","لذاكره","لصفحه","لطابور","لعده","لعمليات","لعنوان","لغه","لكشف","لكل","لكن","لكنه","لكنها","لكود","للابد","للاجهزه","للاستبدال","للاستجابه","للاشارات","للاغراض","للبرامج","للبرمجه","للتاليه","للتبديل","للتحكم","للتحميل","للتخبط","للترجمه","للترحيل","للتزامن","للتطبيقات","للتعامل","للتغيير","للتنفيذ","للجمود","للحصول","للحواسيب","للخيوط","للذاكره","للشبكه","للعمليات","للعمليه","للعنوان","للقرص","للمستخدم","للمستخدمين","للمشاركه","للمعالج","للملف","للملفات","للمهام","للموارد","للنصوص","للوقت","لم","لماذا","لمراقبه","لمستخدم","لمشاركه","لمفسر","لمنع","لمهام","لموارد","لمواردها","لموقع","لن","لنظام","لنفترض","لنفس","له","لها","لوحه","لوضع","ليس","ليست","مؤشرات","مؤقت","مؤقتا","مؤقته","ما","ماديا","ماذا","مباشر","مباشره","مبني","مبنيا","متاحه","متبادل","متبقي","متجاور","متجاوره","مترجم","مترجمه","متزامن","متزامنه","متساويا","متساويه","متصفح","متصل","متصله","متطلبات","متطلباتها","متعدد","متعدده","متعددين","متغيرات","متفاوته","متقدم","متنوعه","متواز","متوازيه","متوسط","مثال","مثالا","مثالي","مثاليه","مثل","مجازي","مجاعه","مجانا","مجدول","مجرد","مجمع","مجموعه","محارف","محاسبه","محدد","محدده","محدود","محدوده","محرر","محرفا","محرفي","محرفيه","محظوره","محليه","محمل","محموله","مختلف","مختلفه","مخزن","مخزنه","مخصص","مخصصه","مدمج","مدمجا","مده","مدي","مدير","مذكوره","مرتبط","مرتبطه","مركزيه","مرور","مزامنه","مزدوجه","مزوده","مسؤول","مسؤوله","مسؤوليه","مساحات","مساحه","مسبق","مسبقا","مستخدم","مستخدما","مستخدمه","مستخدمين","مستدعي","مستندات","مستوي","مستويات","مشابهه","مشاركه","مشاكل","مشترك","مشتركه","مشغولا","مشكله","مصادقه","مصدر","مصدري","مصرح","مصرفي","مصطلح","مصمم","مصممه","مضاد","مطلق","مطلوبه","مع","معا","معالج","معالجات","معالجه","معرف","معظم","معلومات","معماريه","معني","معيار","معين","معينه","مفاتيح","مفاهيم","مفتوح","مفتوحه","مفرط","مفسر","مفصله","مفهرس","مفهوم","مقابل","مقاطعات","مقاطعه","مقدار","مقفله","مقيده","مكدس","مكدسات","مكون","مكونا","مكونات","ملاحظه","ملف","ملفا","ملفات","مما","مملوك","من","مناسبه","منجزه","منخفض","منخفضه","منذ","منطق","منطقي","منطقيه","منظمه","منع","منفصل","منفصله","منها","مهام","مهمه","موارد","مواعيد","موجوده","موزع","موعد","موقع","ميزه","ناتجه","نتيجه","نريد","نسبي","نستخدم","نسخ","نسخته","نسخه","نص","نصوص","نصيه","نظام","نظريا","نفاد","نفس","نفسه","نقل","نهائي","نهائيه","نواه","نوع","نوعا","نوي","هجمات","هجوم","هدر","هدف","هذا","هذه","هرمي","هما","هنا","هناك","هو","هي","وابقائه","واجهزه","واجهه","واحد","واحدا","واحده","وادارتها","واداره","واسترجاع","واستعاده","واضحه","والاخراج","والادله","والاستعاده","والانتظار","والاوقات","والايقونات","والبرمجيات","والبرنامج","والبيانات","والتحكم","والترحيل","والتزامن","والتطبيقات","والجهاز","والحاله","والحجم","والذاكره","والربط","والسجلات","والصلاحيات","والغاء","والفيزيائيه","والقرص","والمستخدم","والمكدس","والموارد","والمواعيد","والموقع","والنتيجه","وبنيه","وتتحكم","وتجعل","وتخزين","وتخصيص","وتعدل","وتعديله","وتكلفه","وتنظيمها","وتنفذها","وتوزيعه","وتوفر","وجدولتها","وجود","وحالتها","وحجمه","وحدات","وحده","وحل","ورقم","وزن","وسائط","وستبقي","وسجلاتها","وسهله","وصف","وصفيه","وصول","وصولا","وصولها","وضع","وطلبات","وظائف","وظيفه","وعداد","وعمليات","وغيرها","وقت","وقتا","وقته","وقتها","ولا","ولن","وليس","وليست","ومتي","ومجدوله","ومحدده","ومساحه","ومسارات","ومكونات","ومواعيدها","ومواقع","ونظام","ونقل","ونقلها","وهو","ويب","ويتحقق","ويحول","ويدير","ويستخدم","ويكتب","ويمكن","وينقلها","ويوفر","ياتي","يبدا","يبطئ","يبطئها","يتحكم","يتضمن","يتطلب","يتعامل","يتعلق","يتفاعل","يتم","يجب","يحتاج","يحتوي","يحدث","يحدد","يحرره","يحسن","يحل","يحمل","يحمي","يحول","يختار","يختلف","يخدم","يخزن","يخصص","يدعم","يدعمه","يدل","يدير","يربط","يزيد","يزيده","يزيدها","يساعد","يسبب","يسبق","يستخدم","يستغل","يسمح","يسمي","يشار","يشغل","يشير","يصف","يصل","يعاني","يعدل","يعطي","يعمل","يعني","يعيد","يغرق","يقرا","يقسم","يقضي","يقلل","يقوم","يقيس","يكشف","يكون","يلغي","يلي","يمكن","يمكنها","يملك","يمنع","ينتظر","ينتقل","ينشئ","ينشئه","ينظم","ينفذ","ينقل","يه","يهدف","يوجد","يوزع","يوفر"],"postings":[[530,1,143,2,2110,1],[802,1],[99,32,1025,639,893],[118,80,48,32,64,80,80,768,304],[1556],[404,49,464,49,394,19,16,96,29,144,368,48,147,113,66,126,81,65],[2870],[2322,2,46,1,179],[1232],[1664,1,1],[2773],[2592],[1811],[195,1,1356,2,1,1,1],[1732],[256,192,288,1888,96],[560,448,272,2,46,352,16,16,230,762],[240,784,384,32,432,16],[22,46,178,48,29,1,1,97,80,96,672,304,266],[100,305,240,273,127,113,574,177,240],[227,1,828,1232,356],[84,48,658,384,80,144],[1957,155,99,128,221,291],[112,3,1,1,27,64,373,16,463,12,112,3,1,1,59,38,191,398,194,159,33,11,2,2,47,114,63],[1363,237,160,853,251],[1236],[432,336,160,128,52,892,80,400,387,1],[1744],[323,1,2303],[352],[496,16,16,16,112,16,16,16,32,176,64,176,144,80,83,189,160,256,192,96,32,240,96,32,16,5,11,16,48,21,11],[21,48,15,111,1,1,110,1,1,1,31,64,143,241,384,30,16,50,158,93,80,67,288,61,16,16,16,148,15,1,2,10,16,16,48,20,2,90,16,48,37,11,16,19,80,45,52,15,82,1],[866,4,28,4],[1968,707,66],[550,2223],[146],[802],[20,1,671,1666,511,11],[720],[259],[68,236,192,1072,96,208,53,832,1],[560],[464,995,861,372,81],[882,3],[2614],[1429],[2742],[368,805],[928,912,1044],[304],[1973,1],[1968],[1984],[2544],[1648],[2196],[1268,15],[1235],[1280,2],[2818,4],[195],[150,714,480,1360],[722,4,92,1],[83,1,972,176,192,356,188],[259,1149,20],[242,2,1038],[2627],[228,418,1802,291,1,15],[1810],[368,224,704,2,494],[69],[228,12,336,819,1456],[1781],[960,2],[341],[338,1,1],[341,1232],[642],[83],[2883],[614,1772,3],[866],[1936],[1222,1008,191,48],[323,1,1,29,656],[464],[1888],[85,75,99,45,768,160,320,259,816],[1458,3,478],[608,32,341,59],[176,304,400,64,576,240,80,224,48,48,112,176,32,32],[2675],[2256],[480,752,192,356],[1637,944],[1072],[624,852],[1782],[259],[2741],[1298,46,2],[674,3],[1219,15,1,16],[514,368,64,1536,2],[610],[547,1549,790],[19,640,1984],[565,446,19,301,80,274,14,1010],[517,367,162,1098,340],[965,1183,332],[1637,944],[2128,84,220],[1858,3],[501,45,160,112,4,1276,1,787],[2886],[547,159,3,1645,4],[1428,76],[916,1759],[2629,127],[660,28,192,720,21,320,891],[288],[336],[660,1119,61,931],[2692],[2416],[1520,992,100,79,67,109],[480,740,302,1],[1216],[1812],[1782],[854,1869],[592],[192],[1584,160],[642,2017,77,20],[115,466,475,4,12,115,290],[102,266,35,189,19,355,191,507,128,116,143,176,205],[1796,160,576,113,208],[788],[320,1360],[2404],[1760],[512,1270,911,110,65],[2867],[195,1,1],[259],[36],[291,304],[32,3,2,14,2,31,48,206,2,1,65,45,13,2,2,159,112,17,31,61,67,175,3,16,14,114,16,31,32,47,1,16,16,34,31,32,59,181,143,33,15,32,33,123,69,16,14,109,19,99,93,130,63,80,30,3],[386,1,2,254,401],[2643,226],[384,2020],[464],[482,2,1055,29],[1584],[866],[1363,157,147,79,3,46,83,154,180,128,2,106,309],[662,2223],[658,2224],[1970,3],[1445],[2704],[64,2,1011,139,6,10,16,19,1,1,14,259,42,84,96,274,28,1,51,176,128,32,143],[230,224,810,54,48,698,581],[405],[2272],[930,3],[35,1],[1110],[160],[262],[178,4,1546,37],[1520],[720],[2368],[597],[1366],[1222,26,21,399,572,182],[1171],[518,266,2,52,319,139,2,46,2,594,226,46,31,35,157,83,320,10],[788,575,433,546,511],[1636,946,157,1,127,16],[1888],[2755],[1190,170],[688,1715,413],[789,1166,258,251,390],[96,1056,2,1073],[1472,1184,96],[100,162,142,49,464,193,64,31,80,16,27,19,112,35,266,51,115,16,207,171,128,277,81],[724],[576],[1360,1,1],[2884],[549],[592,1008,96,720,400,48],[336],[32],[898,1,1887,3],[518,266,2,52,2000],[1157],[1600],[229,1,2400,29,97],[2404],[1779,2],[918,957,82],[67,1,1,126,173,1040,229,944,11,19,17],[1445],[2662,64],[1442,3],[549],[2884],[2884],[320,1360],[2416],[1252,63,67],[2660,64],[100,305,2107],[274],[2694],[770,4,2044,3],[2195],[1206],[274],[134,138,658,4],[1813],[262],[2512,166],[2288],[2772],[1779],[1939],[482,4,1039],[1632,944],[2240,2,4],[2613],[2512],[916],[528,144,624,1488,96],[2288],[628],[1219,352],[2582],[1168,1,1],[1042],[352,694,79,571,304,148,495,115],[84],[560],[1923,434,334],[102,74,227,17,81,241,237,29,100,370,42,176,306,2,130,26,181,139,16,3,131,46,65,111],[482,1,127,32,400],[146],[274,3],[146,16,3,109,864,1],[1168,291],[112,114,848,1,781],[1494],[356,16,1216,16,224,16],[2614],[144,1,1],[162,2,110,1],[1488,278],[1078,46,97,176,480],[320,1,1,240,448,1,15,4,252,48,1,79,1,271,3,13,1,1007,3],[928,534,335],[2772],[1442,4],[434,4,1276,1,175,1],[112,16,3,3,10,16,37,59,3,1,1,11,2,339,81,16,125,131,170,2,30,3,1,1,11,16,3,1,48,113,256,31,15,131,143,11,32,3,1,2,13,19,13,15,2,18,12,1,48,32,19,42,3,17,18,31,15,17,49,16,10,3,1,1,1,30,16,15,19,47,15,18,269,51],[99,2,688,367,50,528,221,93,32,133,251,390],[1392,2],[242,1,80,1,236,5,446,19,252,49,1,79,33,1,240,11,3,16,66,110,818,1],[242,1,1,1,1037],[576,832],[112,96,32,32,32,112,80,16,16,80,16,48,32,32,64,16,48,32,96,32,64,48,80,80,48,64,32,32,64,16,96,128,80,32,80,16,144,80,32,112,32,208,32,64,32,32,32,96],[720,112,374,10,64,160,64,64,96,96,36,28,115,13,64,48,32,64,16,80,32,32,16,32,96,16,48,16,16,68,16,1,30,19,111,1,26,16,3,1],[69],[610,30,1,1,398,1,1],[112,112,2,532,304,12,1,109,38,95,64,94,177,204,118],[195],[578],[1138],[1124,770],[2304],[85,27,1318,250,80,580,65,187,19,130,129],[274],[2448],[384,160,160,80,1568,320],[496],[2805],[1744],[1552],[1408],[1744],[752,624],[1504],[674,3],[1248,336],[1813,385,285],[946,1536,1],[916,49,299,886,106],[134,1994,112],[1958,58,50,1,109,4,34,28,4,13,3,272],[320],[1301,46,112,941,2],[19,2,527,111,1,28,100,674,350,543,77,339,45,37],[83,1],[1638,186,756],[2160],[1746,1],[1251,1021],[146,16,4,972,3],[2560],[853],[1429],[323],[1216,3,17],[595,1],[1173],[1251],[64,256,1264],[1888],[1238],[2704],[406,511,447],[451,2210],[742,510],[1380,1487],[52,49,27,16,16,16,16,48,80,64,96,144,16,100,108,64,52,12,3,1,60,96,16,48,48,176,38,29,29,112,64,16,3,17,2,45,1,17,11,16,67,16,18,139,208,128,176,32,6,15,17,10,16,6,10,32,16,3,13,3,45,4,12,32,16,5],[1744,480],[37,720,158,289,111,50,511,736,34],[452,674,1502,31,66,31],[260,479,368,368,3],[1237,145],[117,1069,3],[1924],[368,1427,113],[386,4],[98,30,1,1,1070,1,1,1200,1],[965,1051,837],[980],[2128],[2816],[688,256],[21,398,98,367,929,385,106,3,49,124,3,1],[2592,19],[224],[2774],[2098,4,42],[912,2,1266,79,275],[1427],[1222,954],[1363],[83,493,387,818,315,64,53,251],[1968],[802,4],[2130],[16,16,16,3,1,1,11,3,2,11,16,48,16,16,16,16,16,16,16,67,1,1,27,16,32,16,32,32,32,16,16,64,32,16,16,32,16,16,16,32,16,16,16,16,16,16,16,16,32,16,16,16,48,32,16,16,19,3,10,16,16,32,48,16,16,16,16,32,16,16,16,48,16,16,16,3,2,11,16,16,16,32,32,32,64,16,32,16,4,1,1,10,16,16,32,32,16,20,12,16,32,16,16,16,32,32,16,32,16,16,16,16,48,16,16,16,16,16,16,16,16,48,16,16,16,32,16,16,16,48,16,16,16,16,16,4,1,27,16,16,16,16,16,32,16,32],[83,1,1,1419,320,851,1,1,1,13,1,1,1,173,1,1,1],[2288],[1600],[50,2,271,1,240,448,16,384,271,17,386,624],[2672,1,1],[256,2],[464,1443],[2854],[2048],[514,2,174,3,173,81,832,1,1,1,58,2,418,540],[2720],[1299,51],[68,574,400],[661],[630,221,1805],[1108],[1334,382,176,2],[741,1888],[2496],[1890,4],[1619],[916],[2693],[517,367,1600],[21,2379,2],[116,1072],[882,4,1212,2],[146,2,12,1,1,368,2,270,3,61,1,271,1648,2],[598],[1664],[963,146,622,2,48],[1780],[2098,3,61,3],[2160,723],[2372],[1554,3],[2544],[80,2],[1936],[230],[627,2,225],[1330,4,380,2,174,2],[2096],[146,3,13,368,4,268,2,62,3,269,1648,4],[1780],[400,48,96,528,304,768,64,448],[144],[2544],[2368],[2675],[642,400],[964,191,50,111,498,61,35,237,269,355],[400,99,1,76,36,50,45,1,2,272,74,32,582,128,205,16,1,2,13,15,2,1,17,14,47,32,1,2,13,3,26,16,5,11,3,1,1,30,2,1,15,14,1,1,16,49,13,1,2,45,1,16,15,34,15,2,10,19,1,15,1,1,1,96,10,54,80,42,37],[836,113,1537,349,1],[19,640,128,93,1552,64,307],[548,1407,257,60,70,13,176,29,293],[1520],[613],[101,2577],[1925],[1190],[756],[1796,849],[82],[85,96,15,12,19,1,1,1,10,160,5,47,48,76,21,15,33,62,33,1,17,32,46,15,67,31,14,19,63,11,4,12,16,16,4,50,63,33,32,31,43,21,17,58,5,14,2,14,1,32,96,2,16,16,16,62,2,26,19,2,27,3,64,32,50,63,33,16,16,32,30,13,4,15,13,4,18,14,1,32,14,17,96,32,17,11,3,19,46,1,43,4,15,1,15,3,15,15,32,63,113,15,19],[22,16,16,16,224,32,1232],[99,32,1025,47,1202],[2818,4],[1184,464,1024],[112],[1462],[146,528,1,127],[755],[1328],[1554],[1600],[1712],[1780],[2368],[336,1587,273,464,64],[1712],[1302],[1427],[1408],[898,1,1887,3],[770,2,124,1888],[436,2428],[437,1005,4,240],[432,336,160,308,396,448,115,317,64,16,21,14,64,176],[210,4,522,2,192,2],[2576,304],[432,16,1184,976,16,64,32,16,128],[1216,422],[2674],[1219,352],[197,974,816],[272],[1824],[2694],[1731],[818,3,574,419,336,159,77,3,17,95,27,290,2],[2532],[2133],[50,334,259,351,50,2,92,1604],[84,480,448,16,380,4,271,17],[1219,1069,597],[1056,370],[38,16,16,16,32,80,80,48,16,1216],[208,400,96,112,48,128,96,403,109,176,4,204,368,32],[866],[162,1,111,2,862,2],[195,1,1,543,1872,34,10,213],[480,644,92],[1120,800],[19,3,16,10,6,10,6,16,10,16,6,77,3,10,32,6,10,16,6,10,6,10,19,1,1,1,10,6,10,48,16,6,10,16,32,16,16,16,16,54,10,16,16,19,1,1,11,16,16,16,16,4,12,16,16,16,16,16,32,32,16,32,16,22,10,32,64,16,4,28,32,32,16,32,22,26,19,29,16,16,16,16,32,19,1,1,11,20,28,16,16,6,16,10,36,2,26,80,48,4,1,1,16,10,48,32,19,61,16,64,64,16,16,48,16,32,32,32,37,11,16,16,20,44,48,96,16,4,12,19,1,2,10,4,12,3,1,12,32,20,12,16,16,19,2,49,15,11],[432,336,96,656,116,204,355,387,10,99,13,163,1],[416,1120,16,224,965,143,2],[596,1,1039,95,1137],[610,190],[16,480,16,16,5,11,112,16,32,16,32,64,48,32,67,13,176,224,336,68,1,1,15,11,192,16,32,16,16,80,64,32,16,32,32,16,16,16,112,224,32,16,16,16,32],[1600,406,15,33],[304,117,894,499,96,106,837],[1714,176,3],[1717,171,5],[404,2370],[1520],[101],[789],[2213,251],[147,1,268,272,34,1,1,1,1,42,2,1,1,1,1,26,18,1,1,1,1,10,48,32,16,16,656,528,48,16,16,32,48,128,48,48,16,16,16,32,211,13,2,1,1,1,1,26],[68,1360,172,37,123,821,11,19],[1492,223,176,35],[1520],[2016,837],[2659],[1476,17],[178,4,10,3,1,1,32,849,46,97,176,91,3,221,5,49,106,5,11,5,11,35,275],[578,1153,176,16,960],[178,1,31,1,367,1,49,430,1,32,129,18,234,256,37,94,258,113,240],[2885],[2688],[480,32,320,112,515,322,1022],[352,1168],[1650,1],[594],[368,1,1,222,1,1,1198,1,1,112],[1365,15,988,499],[304,544],[1429,449],[1155,48,787],[1970,1],[1108,447,352],[2196],[594],[1538,2],[240,1280],[2403],[2640],[384,1,1],[464],[854],[2643],[1219],[1424,2],[1968],[758,560,1293],[1430],[454,925,685],[1232,35,771,80,176,160,143],[259,765,373,1195,278],[96,160,496,1440,416,160],[1300,49],[2742],[2704],[562,4,63,128,253,4,13,210,173,4,15,269,4,287,719],[1072,496],[48,3,1,1,14,2,14,1,1,17,76,2,156,3,1,12,16,35,96,61,32,3,1,15,32,1,64,34,15,75,2,3,45,1,67,26,2,14,16,35,1,1,31,306,26,16,54,13,13,22,93,16,34,27,48,16,32,3,29,84,15,35,61,18,14,17,44,2,2,12,2,2,96,17,32,11,3,19,16,61,61,20,17,30,32,18,11,20,33,17,16,64,13,1,92],[325],[64,4,65,107,101,257,48,94,50,90,84,92,69,33,78,17,1,142,32,92,64,148,28,165,187,83,2,75,67,77,195,241],[435,1,1,2427],[2741],[432,1204,559,387,109,2],[176,115,129,60,115,384,1,802,58,160,2,2,92,38,26,2,3,334,274],[661],[19,1,1,529,159,219,180,65,225,634,309,16,1,138,16,48,291],[1572],[1600],[2340],[2292,303],[2032],[848,963,387,106,468],[20],[2406],[2356],[386,1],[384],[96,304,240,272,48,144,64,32,160,32,336,80,800],[2544],[674,4],[562,68,780],[2885],[50,2,31,354,990,15,4,240],[994,4],[852],[480,740,302,1],[1248,1,1],[1106,1,15,4,332,1,989,1,1],[610],[48,2,33,911,1,432,79,2,1135],[528,5,187,2,3,45,3,47,620,1378,1],[1334,382,176],[259],[2368],[1269],[1317,416,144],[453,2270],[261,479,369,75,1685],[1381],[464,2227],[292],[2864],[306,4],[69],[482,3],[1444],[1779],[85],[1712,5,155,16,5],[981],[2150,106],[2256],[452,1116,1060],[741,736],[1856],[2064],[1248,1026,2,47,177,127],[19,113,416,111,577,399,274,363,16,32,35,176,1,47,35,13,17,34,77,16,32],[469,286,97],[2208],[832,1120,64,48,32,80,112,32,16,192,16,16,272,16],[2533],[562,1,447,3,13,3,301,3,77,3,29,1,239,2,14,3,13,4,892,4,92,1],[1248,896,48,576],[1458,2],[562,1,447,3,13,3,301,3,77,3,29,1,239,2,14,3,13,4,892,4,92,1],[1013,16,253,51,80,271,17],[530,3],[432,496,708,559,387,285,1],[51],[50,500,444,2,511,273,60,432,240,100,65],[1492,434,586],[2678],[325,603,592,115,941,3,34,79,48],[1282],[2197],[51],[80,754,3,45,1,1602,349,3],[133,1120,143],[32,374,32,122,2,4,63,158,45,16,160,2,4,10,3,63,3,112,16,16,47,1,31,12,36,18,26,2,4,10,70,175,11,6,10,2,4,222,18,14,33,48,31,18,28,1,1,65,47,63,35,15,97,15,15,47,114,75,4,124,20],[1940],[482,1,1,1,1,1039,14,29,178,3,1],[1206,170,291,130,171,37,29,2,300,37,129,42,5],[1328,4],[210,2,366,2,512,128,640],[1524],[83,1,1,923],[1538,3],[304,2],[1638,186,756],[2405],[2886],[565,446,19,301,80,274,14,1010],[20,1484,496,16,16,16,16,16,80,16,16,16,16,32,16,16,16,16,16,32,16,48,32,32,16,16,16,16,288],[416,1712,112,20,332],[1779],[64,2580],[1812],[1520],[1635,944,178],[1524,1068,86,192],[723,29,96,1234,1,544,128],[514,1,175,1,255,2],[82],[564,444,4,16,304,80,32,239,17,1010],[306,1,2],[2196],[768,1312,803],[435,307,29,209,1664,49,175],[261,846,19,46,31,785],[576],[2706,4],[562,448,2,14,2,254,128,2,270,1,15,2],[1408],[2630],[324,1372],[69],[548,111,33,1804,275,34,1],[1138],[1568],[1504],[800,1296,790],[100,127,624,323,318,268,51,115,223,171,240,19,34,112],[1638,942],[1172],[260,655,289,672,898],[336],[1923],[1970,2],[1312,1,1],[1442,2],[1346,2],[1282,48,2],[293,1453,2],[1824],[386,2,1040,1246],[2676],[1024,52],[48,547,397,515,1,1,1],[306,2,1],[1204,256,160,320,287,221,85,271],[99,1057,47,531,78,66,30],[131,1664,610],[96,1699],[101],[2227],[2320],[112,1568],[272],[1504],[82,3,125,3,16,349,4,476,3,33,127,541,1,99,61,525],[642,4],[2659,77,3,1,16],[1526,10,422,172,2,178,109,177,12,22,29,35,62],[16,4,108,16,16,114,222,16,16,5,11,54,10,16,16,16,6,10,22,10,6,10,32,16,48,19,13,48,67,1,2,10,5,59,96,2,14,48,52,113,11,224,21,159,1,1,16,10,117,16,11,48,16,6,26,16,16,16,64,20,2,42,32,16,32,16,16,4,12,16,16,6,10,67,29,4,12,32,48,64,64,32,16,16,16,3,2,27,53],[150,106,16,592,576,272,85],[144,48,758,954,35],[1520],[2643,96],[208,368,406,74,32,176],[1138],[2804],[80,2],[644,399,467],[66,1,927,3],[2677],[1746,4,1134],[1108,815,273],[19,541,99,221,64,547,13,278,13,205,32,128,112,16,80,64,48,32,166,125,80,1,2],[20,1,1,16,10,3,1,1,1,16,13,13,16,6,10,16,48,16,32,6,10,16,6,16,10,19,1,1,1,16,58,16,6,26,16,16,16,16,16,16,16,36,1,11,16,16,32,32,32,4,12,32,16,16,16,32,16,16,16,16,16,16,3,1,28,16,16,16,32,16,16,32,32,3,1,1,27,16,32,22,10,16,19,29,16,16,16,16,19,3,10,19,2,11,21,11,16,16,16,6,10,67,13,32,16,16,16,16,32,3,2,1,26,5,27,16,32,16,21,43,16,16,32,32,48,16,16,48,16,16,16,32,32,32,4,1,11,16,16,19,2,11,16,16,48,16,16,32,16,3,13,16,4,1,11,22,10,16,3,1,12,4,2,26,20,1,11,16,16,19,1,12,32,21,11],[2704],[259],[1584],[1584],[86],[464],[624,2,494,100,254,2,177,267],[384,2,2,1,1,1226,2,801,209,2,10,4,28,3,1,1,27,37],[435],[288,96,1,1,46,1200,192,752,36,1,1,13,16,3,10,22,13,13,36,2,10,3,2,1,109,1,1,1],[466,1,386],[323,1,1,11,16,2,99,16,1,58,5,29,68,90,2,1,2,17,10,3,15,3,47,28,4,65,11,80,2,318,4,76,2,30,4,34,218,227,189,99,128,479,1,65],[1840],[1936,1,1],[20,1,30,17,15,1,1,11,133,1,10,112,48,32,32,179,1,1,1,122,22,58,67,1,1,1,10,32,80,5,11,96,6,42,16,20,18,10,48,48,3,35,10,19,64,13,64,32,128,4,28,21,30,1,1,1,10,32,16,16,16,64,32,32,48,32,32,48,3,61,16,32,35,64,13,116,76,5,1,16,13,3,13,32,2,48,1,14,1,1,106,3,1],[1925],[1536],[1907,141,806],[2320],[2544],[260,1103,849],[2342],[2096],[1936],[1491],[355,16,1216,16,173,51,16,845],[68],[304],[1168,1,1],[336,96,176,53,59,48,48,166,191,287,162,176,1007,11],[304],[2480],[530,2],[1810],[146],[2757,1],[1379,16,637,308],[1123],[1620,1184],[128,1,17,4,490,1,1,222,1,1,32,3,139,1,1],[227,1],[1110,1210,48,356],[2416,244],[144,16,80,800,96,16,112,16,32,22,106,19,205,48,4,140,16,20,2,10,400,160,341],[419,351,1,1,124,48,21,190,658,155,32,48,100,108,48,3,33,1,15,1,123,3,301,32],[768,1312,512],[53,1377,381,845,96],[2496],[2806],[35,2,414,15,2,159,112,17,1871,34,64],[1744],[1780,332],[181,923,117,235,166,32,154,277,107,22,15,191,31,66,81],[930,1],[306,1,1,2,300,609,15,1,1440],[352,2,116,524,131,379,5,64],[1251],[464],[229],[52],[2646],[464],[614,2269],[16,32,32,112,32,32,288,48,48,16,96,32,128,64,96,32,64,80,128,16,96,80,48,176,16,128,480,224,16,16,64,32,32,64],[51,1,1,1067,356,15,1,1,1,10,227,189,528],[83,1,1,27,48,48,32,32,32,32,48,32,16,48,16,16,16,32,16,32,16,48,16,16,16,16,32,32,16,16,32,32,32,64,16,16,32,32,48,48,32,48,32,32,16,64,32,32,48,16,16,96,32,16,48,32,4,76,32,80,16,32,32,32,16,32,48,32,32,16,32,16,16,32,32,80,32,48,48,32,64,16,16,32,32,32,16,48],[32],[69],[146,1,15,368,1,143,2,126,1,63,2,30,2,236,1,1,1648,1],[368,320,256,64,629,59,816,69,11,19,205,69],[227,2349],[1125,238,1250],[674,1],[768],[242,3],[610],[898,2],[1138,4],[642,400],[66],[274],[465],[642,400],[978,544,16,591,304],[2130,80,96,128,64],[1778],[578,480,464],[786,368,144,64,688,32,80,48,32,32,64,96,80,48,287,1],[434],[1218,16,1311],[450,784],[1585],[290],[18,224,176,80,768],[738,816,415,1,704,64],[338,80,496,591,401,96,15,1,96,95,241],[66,1216,80,64,175,160,161],[930,144,48,272,480,367,1,368],[1362,16,336,655,289],[18,160,32,191,1,96,48,31,33,48,48,80,96,80,16,79,32,1,64,224,16,256,144,16,64,32,48,48,16,16,16,16,16,32,16,16,16,16,31,1,15,1,16,31,1,16,16,16,16,16,16,16,32,16,16,16,32,16,15,1,16,16,32,64,15,49,48,32,47,1],[1537,1,1264],[338,80,496,591,401,96,15,1,96,95,241],[2370],[786,1168,272,239,1],[130,2544],[2770],[18,47,256,1,1263,1],[1218],[97,1,96,319,1,239,1,1439,416,1,159,1,16,16],[257,449,1280,368,367],[1218],[1425,1],[1330,383,1,159,1,15],[1218,352],[466,64,192,32,16,80],[34,16,1056,1199,1,15,1,224,80,32,64],[802],[2642],[641,337,63],[609,1,1216,431,1],[1266],[49,1,32,272,112,960,80],[2882],[450,16,160,112,16,368,1600],[34],[1506],[450,400,1872],[1154,16,816],[194],[818],[305,1],[1538],[242],[273,1],[930],[1042],[1810],[194],[194,384],[322],[1810],[1426],[530,912],[162],[146,15],[178,752,144,31,1,351,1,160,32,159,1,272,111,1,16,16,192,32,64,80],[1874],[1329,1,608,864],[1330,112],[562,447,1,320,80,287,1],[961,1,816,64],[242,864,1088],[914,591,1,1168],[337,1,256,32,112,16,896,272],[2658],[98,31,1,1071,1,1200],[642,400],[2129,304],[2306,192],[1154,896,32,80,48,32,32,64,96,80,48,287,1],[1218,1327],[338,80,1488,208,95,241],[1601],[930,1311,1,368],[1714,655,289],[2418,240,64],[418,1488,111,1,96,95,241],[2226],[1218],[97,1,96,319,1,239,1,1439,416,1,159,1,32],[257],[1218],[1425,1],[1218,352],[466,288],[2305,1],[49,1,32,272,112,960,80],[1154],[305,1],[1538],[1042],[194],[162],[178,752,175,1,351,1,160,32,159,1,272,111,1,16,16,192,32,64,80],[1330,112],[562,848],[961,1,816,64],[338],[882,1215,1],[130,1024,848,32,304,32,128,48],[1170],[465,1],[1378,959],[1969],[1538],[466,384],[1970],[2770],[50,303,1,112,768,16,192,64,64],[1409],[1442],[1778],[2705,1],[2145,1,336],[1841,1],[50,32,112,368],[562,64,384,16,384,16,16,256,1007,1],[322],[1329,1],[418,272,16,224,1072,128,208,16,143,1],[210,528,16,176],[177,1,112,191,1,112,384,768,95,257,64],[114],[322],[498],[98,32,528,32,240,224,48,96,16,32,16,16,16,127,1,224,464,192,47,1,304],[113,128,32,528,64,160,192,192,32,448,80,160,112,352],[210,368,480,32,672,96,880],[113,112,1,832,127,1,288,383,1,112],[882],[1266],[1282],[98,304,208,112,240,192,511,1,240,48,96,176,304,320],[1474,16],[625,1,495,1,352,176,271,1],[82,64,16,1040,111,1,144,768,192,48],[114,464,480,15,1,112,544,144,80],[2610],[2545,1],[2706],[546],[178,32,368,48,432,32,144,240,255,1,32,96],[2770],[1954,655,1,16,48,16,64],[258,2112],[2561,1],[17,1,399,1,79,1,15,1,31,1,111,1,31,1,15,1,15,48,17,15,16,1,15,32,16,32,16,16,17,15,176,224,1,223,1,111,1,64,31,192,64,64,32,32,32,16,16,16,32,32,16,1,15,48,96,16,32,32,128,32,16,1,31,1,15,16,16],[130,144,656],[1970],[1714,175],[18,528],[690],[1970],[610,1344,112,112,80],[514,320,320,768,912],[2754],[978],[1186],[258],[466],[1570],[210,368,512,768],[898],[1266],[34],[2306],[50,127,1,144,32,272,352,32,464,32,416,400,144,160,112,16],[930],[2370],[2689,1],[1634,944],[305,225,31,1184,145,111,32,128,112,96,64,48,32,161],[66,1488],[338],[1426,847],[34,592,224,175,209,144,31,16,1,256,944],[481,1,31,1,431,1,1856],[1778],[66,160,224,624,143,1,15,1,15,16,1,16,32,48,176,128,96,272,31,1,48,176,128,32,144],[785,1,112],[50,32,112,144,160,848,208],[1730,960],[962,879,1],[994],[1330],[130,447,1],[162,1551,1,64],[482,1056,31],[1970],[337,1],[529,192,1,96,623,1],[1522,896],[1393,1],[2658],[1970],[113,113,960,288,383,1],[290],[18,400],[1505,528,32,368],[482],[946,1536],[241,1,1199],[66],[290,144,1183,1,1056],[289,144,16,1,1183,1,784,159,1,31,1,15,1,15,1,15,1,15,16,32,1,15,16,1,111,1,15,1],[1218,16,16],[225,1,1632],[386],[482,1040],[722,96],[97,1,1055,1],[1826],[2145,1,47,576,1],[914,960,80],[178,16,32,15,1,159,1,48,48,79,1,16,16,32,64,32,16,32,48,16,64,32,16,16,64,63,1,48,96,32,32,48,16,16,63,1,32,32,32,64,16,16,16,64,16,15,1,16,31,1,64,80,64,32,16,16,32,32,15,1,16,15,1,16,16,32,16,16,96,32,16,15,1,16,48,47,1,16,16,32,96,112,16],[306],[305],[354,112,15,1,208,191,64,1,304,303,288,961],[34,367,1,448,256,32,239,1,767,1,511],[449,1,95,1,527,1136],[882,1216,303,1],[1330],[18],[466],[1474,16],[626,96,31,1,95,1],[18,32,16,16,16,16,32,16,64,48,192,96,80,656],[481,1,1040],[290],[1234],[2658,79,1,16],[818,992,320,16],[1810,320,16,160,80,16,96,31,1],[674],[1217,1],[626],[50,32,112,144,1216],[514,176,256,16],[193,1,32,400,448,48,272,319,17,143,1,15,16,1,16],[194,1295,1,272,128],[1298,48,112,943,1],[722],[226],[1825],[1858],[1298,48],[850],[1314],[1682],[178,288,864,399,1,32],[1330],[434],[1026],[2802],[850],[194,336,912,303,1],[354,16,1216,16,176,48,16],[18,528,112,31,1,96,144,16,864,544,80,336,47,1,32],[114,1072],[50,2816],[65,1,16,16,32,111,1,63,1,31,1,64,64,32,64,32,16,32,64,32,16,79,1,47,1,64,16,112,16,32,128,272,63,81,256,32,64,16,16,16,16,32,15,1,48,16,32,16,32,16,16,16,64,31,1,16,32,16,32,32,16,32,16,223,1,16],[306],[50,128,144,32,15,1,96,95,32,1,48,335,1,16,15,1,32,16,368,64,16,112,16,63,1,47,17,31,1,31,97,655,1],[194,1712,32],[194,1359,1],[2657],[258],[97,1,303,1,239,272,48,144,1,63,32,160,32,336,80,800,1],[1858],[1298,1184],[1074],[626,480,448],[770],[546,2224],[1554],[1106,384,704],[321,1,704,655,1],[162,976],[98,160,432,144,272,64,32,80,16,48,112,32,271,1,48,112,208,16,175,401],[482,1056,31],[306,688],[2418],[626,224],[258],[130,944],[226],[1266],[178,304,400,96,1119,1],[1746],[1313,1,144,479,289,192,48],[34,1152,175],[1218,352],[482],[114,464,480,15,1,112],[498,48,160,112,1280,256],[882,1216],[2417,1],[114,1072],[2530],[1570],[210,224,303,1,16,176,703,1,943],[2593,1],[1745,1],[2194],[1714],[1025,1,656],[81,1,48,272,240,144,592,528,48,240,16,128,192,320],[882],[1298,47],[2322,48,176],[1570],[1746,656],[2098],[146,16],[2113],[1937],[226,848,672,543],[770],[81,1],[242,1024],[1170],[1778],[1650],[258],[257,1],[882],[2065,496],[2209],[1858],[226,2336],[1730],[161,257,96,176,80,112,63,1,16,176,1008,48,63,49,48,127,336],[226,160,1327],[770,127,1,256,1439,1,191,1],[2674],[546],[1682],[866],[722,31,1,95,1],[2674],[1522,16,96,944,288],[1073,449],[1650],[801,1],[2097,1],[1378,16,639,1],[1281,1],[1554],[33,1,16,80,192,80,48,15,1,160,96,16,16,32,63,65,16,96,64,16,16,160,32,48,16,16,32,32,95,1,80,48,48,144,32,16,32,32,127,1,64,32,111,1,16,96,96,48,144,112],[434,1760,671,1],[1794],[465,1],[1298,48],[1634],[626],[2098],[114,1072],[194],[2177,1,80,272],[913,1],[2594],[338],[290,1456],[1826],[690,192],[1169,1,16,16,784,416],[98,15,1,16,31,1,32,63,1,15,1,128,208,80,16,80,48,128,176,16,47,1,48,112,256,16,16,80,208,15,1,48,16,16,16,16,16,16,32,16,16,16,32,15,1,16,16,32,16,16,48,16,15,33,16,15,1,16,48,16,16,272,16],[466],[850],[578],[1554],[194,1712],[1266],[1826],[722,1360,560],[514,144,32,544,15,1,32,304,448,80,159,1,16,32,128,96,48,16,16,128],[1442],[722],[257,192,1],[1073],[1586],[1746],[18,591,1,15,1,15,81,47,1,192,16,63,81,160,319,448,1,207,1,63,1,16,31,1,127,1,15,1,31,1,256],[258],[2705],[514,176,256,832,63,1,416,543,1],[850],[434,2256,175,1],[882,1215,1],[1969],[34,719,1,96,527,1,496],[2561,1],[1810],[770],[978],[1618],[98,32,1024,48,1200],[98,16,288,48,112,352,96,176,175,17,16,16,80,31,1,16,127,1,32,335,1,640,192],[1601,1],[498],[545,1],[353,1,175,192,1,48,48,80,31,1,511,1,1248,16],[610,2272],[82,112,383,1,480,304,143,256,1,335,1],[465,513,544,272,848],[130,1024,640,208,32,304,32,128,48],[1169,1],[2449],[1042],[465,1],[482],[1378,959],[1282],[1969,576],[50,16,415,1,735,65,143,80,129,191,753],[1538],[466,384],[1969,1],[2770],[50,303,1,112,272,384,96,16,16,192,64,64],[1409],[994],[626],[1442],[2593,1],[146,112,15,448,48,32,16,1,47,65,208,575,1,64,1039],[66],[34,1344],[2610],[2706],[2705,1],[130,16,496,272,32,96,592],[882,80,1183,1,335,1],[130,192,1519,1],[50,32,112,48,320,1216],[561,1,448,320,80,32,255,1],[2706,32],[562,64,128,256,16,208,176,16,16,256,288,719,1],[322],[113,96,32,32,64,48,32,16,64,32,32,16,32,16,48,16,16,16,16,32,32,16,16,1,31,32,32,64,16,16,1,31,32,48,48,32,48,32,32,16,64,32,32,64,16,96,32,16,80,80,32,80,16,32,32,32,16,32,48,64,16,32,1,15,16,32,32,80,32,48,48,32,64,16,16,32,32,32,16,48],[530,2048],[2482],[1794,1056],[914],[1874],[1186,624,1072],[1842],[754],[482],[2434],[1234],[338],[722,2160],[257,1],[18],[1058],[2818],[2642],[770,816],[1970],[2162,80,32,159,81],[769,1,128],[1906,144],[370,1136],[338],[898],[2081,1,144,304],[1970],[1154],[1858],[1234],[1314],[1057,1],[433,1,304,191,1,1936],[2865],[1122],[1106,895,1,720],[194],[1954],[514,80],[514,320,2000],[1329,1],[1601,1],[722,400,240,48,1296,176],[210,208,272,16,32,191,1,176,896,31,97,208,16,143,1,15,1,47],[210,448,16,63,1,16,176],[1458],[18,528,112,2112],[658],[177,1,112,191,1,16,16,64,16,64,48,79,1,32,16,144,192,576,95,160,1,95,1,64,608,32,32],[178,1983],[226,32,368,448,1584,96],[2369,1,175],[2098],[2754],[274],[1714,176],[145,1,288,1040,47,1,1200,32,32,80,16],[114,1072],[98,2512],[482,480,80,464,1152],[1234],[2594],[594],[2417,1],[1394],[466],[322],[2481,1],[402,2111,1],[18,351,1],[66,64,64,64,192,48,112,48,48,160,224,16,320,80,848,32,16,208,32,32],[34],[1346],[2626],[2705,1],[578,1104],[1362],[498],[97,1,848,848],[1170,208,16,639,1],[305],[146],[1633,944],[98,32,48,480,32,240,16,32,176,48,96,16,32,16,16,16,127,1,224,48,239,177,128,64,47,1,304],[18,560,64,48,32,64,288,832,223,177,143,1,176,112],[930],[18],[321,1,704,655,1],[322],[113,128,32,528,64,160,192,192,1,31,448,80,160,112,352],[2449,1],[962,1712],[210,16,352,48,16,288,128,32,32,640,96,64,736,79,1,16],[1778],[722,2160],[2321,529],[2049,1,272,224],[1217],[2162,80,32,240],[450,1184,944,48,128],[1745,224,256],[2018,32,32,47,1,111,33,224,64],[690,256],[1778],[849,1],[2289,1],[2818],[113,1,111,1,32,496,304,16,111,1,128,64,96,176,207,1,112],[2674],[2641,1],[882],[1266],[1106,1088],[1490],[530,192,16,768],[66],[2369,1],[370,223,1,1151,1],[1682],[482,640,400],[1666,624],[834,416],[338],[1026],[546],[914],[402,48,288,640,432,960],[1282],[1233],[98,271,1,32,191,17,112,240,192,384,127,1,127,1,112,48,96,176,207,1,96,112,208],[2161],[2033,1],[962,512,16,288],[625,1,495,1,352,176,271,1],[626],[1009,1,320],[1330],[1794,16],[82,16,48,16,1040,111,1,144,160,32,80,208,288,192,48,64,272],[2162,352],[98,15,1,16,79,1,192,176,208,48,80,128,16,15,1,80,31,1,63,1,32,112,80,256,144,32,48,64,32,16,47,1,32,32,32,48,15,1,48,16,96,64,63,1,48,224,16],[2593,1,16],[1362],[2545,1],[658,1376,32,16,32,64,64,32,32,16,111,1,16,16,31,49,16],[562,448,224,96,80,111,1,176,1008],[546,160,1231,1,159,257],[178,32,368,48,432,32,144,239,1,255,1,32,96,256,112,240],[1346],[2770],[1074,448,15,1,224,192,176,176,288,15,1,16,32,16,16,64],[34,704,176,192,768,752,32],[2273],[626,400,896],[1122],[1714,176],[146,95,1,672,351,1,15,1,159,224,49,159,17,415,113,47,1,16],[1634,944,176],[257,1,2112],[2561,1],[434,495,1,127,49,895,1,79,1,399,1,383,1],[1521,544,48,48,112,176,32,32],[17,1,399,1,32,47,1,15,1,15,1,15,1,111,1,15,1,15,1,15,1,15,32,16,17,15,1,15,1,15,32,16,16,1,15,16,1,15,17,15,176,224,1,223,1,111,1,64,31,192,16,32,16,16,48,32,16,16,1,31,16,16,16,16,16,32,16,1,15,16,1,31,48,32,16,1,15,16,16,32,128,32,16,1,15,16,1,15,16,16],[130,143,1,656,272],[274],[178,112,688,1248],[1186],[610,1776],[561,960,1],[1970],[2290,223,1],[610,64,1040,175,497,96,399],[18,512,16,112],[258],[498],[546,144],[1970],[610,655,1,688,112,112,79,1],[1026,655,1],[66],[562,448,400,111,1,176,1008],[433,1,16,1183,976,17,63,33,15],[66,448,271,1,48,224,96,768,912],[562,448,16,384,32,240,16,1007,1],[754],[2626,32,64,32],[978],[690,944,208,736],[50,384,32,2192],[1506],[1186,1552],[1426],[258],[594],[466,256,2096],[1426],[1714],[1570],[18],[577],[210,368,512,768],[1058],[338,1584],[354],[1122,63,144,1329,208],[898],[34,720,352,272,352,144],[66],[1266],[178,31,1,367,401,79,1,31,1,144,31,385,432,32,304,48,128],[305],[34],[65,257,800,224],[258],[226,432],[1218],[2578],[1409],[258,767,1,208,192,1167,1,272],[66,256,1183,1],[2674],[1410,95,1],[1506],[2306],[385],[2034,32,64,32,16,64,48,16,16,48,64,16,96,16],[98,688,1424],[561,1,272,160,16,400,287,1,592,416],[50,48,79,1,144,32,48,16,80,128,112,240,16,15,1,112,48,304,32,112,79,1,224,80,32,32,64,16,15,1,16,144,16,16,112,15,16,1,128,48,16,48,16],[2610],[34,1072],[930],[2674],[2370],[2689,1],[1634,944],[306],[162],[2514],[1810,496],[2194,160,416],[305,225,31,1184,145,111,32,128,112,96,64,48,32,161],[562,15,1,831,1],[66,1488],[1938],[338],[1410],[1601,1],[1426,847],[18],[50,944,1648],[1393,1],[193,1,752,959,1],[33,1,96,272,32,127,65,160,47,16,1,159,16,1,48,16,112,32,48,32,15,1,32,16,16,15,16,1,64,191,1,15,17,208,16,48,48,32,16,32,64,16,32,64,32,16,96,16,16,48,112,79,1,127,1,16],[386,656],[385],[642,400,1696],[481,1,31,1,319,112,1,32,480,64,256,480,160,384],[2610],[18,224,48,128,80,768,304],[1778],[65,1,160,224,624,143,1,15,1,15,1,15,1,16,32,48,176,47,1,80,96,272,31,1,48,176,128,32,144,48],[66],[242,1024,575,1,432],[418],[785,1,112,16,383,1,47,1,592],[50,32,112,144,160,848,208],[1442,448],[1730,960],[962,879,1],[994],[49,1,15,1,415,1,112,399,1,128,160,224,16,272,944],[1330],[994],[2674],[130,128,319,1,528,16,32,16,816],[2658],[1762],[450],[162,1551,1,64],[114],[482,1056,31],[1394],[1970],[337,1],[498,64,16,432,320,80,288,1008],[1442],[1970],[2738],[322,207,192,1,96,623,1],[1522,47,849],[930,463,1,608,288,48,256],[1106,624,928],[674,48],[2689],[2274],[738,704],[1970],[113,1,112,848,112,288,383,1],[290,304,272],[1985,1],[34,16,16,16,16,16,16,16,16,16,16,16,16,32,16,32,16,16,32,16,16,32,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,32,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,32,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16],[354,1232,16,176],[1970],[18,399,1,240,1471,112,17,335,225],[18,1487,1,495,1,15,1,15,1,15,16,1,15,80,16,48,32,1,15,16,16,16,16,1,31,16,1,47,32,32,1,15,16,16,1,15,288],[482],[530,912],[1489,1,272],[1618],[274],[946,1536],[241,1,783,257,127,32,432,1,15],[434,127,448,272,1,47,1,351,16,16,1,224,767],[66],[290,96,48,1183,1,208,848,64],[385,49,1184],[289,144,1,15,1,1183,1,191,593,159,1,31,1,15,1,15,1,15,1,15,16,1,15,16,1,15,16,1,111,1,15,1],[1218,16,16,160],[34,1552],[1426,448],[226,1392],[225,1,720,912],[385,1],[482,1040],[722,96],[97,1,1055,1],[1826],[18,1231,896,1,47,576,1],[1585,1,688],[914,960,80],[1746],[322,687,1,416,16,255,1],[178,16,15,1,16,15,1,159,1,48,48,79,1,16,16,32,64,32,16,32,48,16,64,32,16,16,64,15,1,15,1,15,1,15,1,48,80,16,32,32,47,1,16,16,63,1,32,32,32,64,16,16,16,64,16,15,1,16,31,1,64,64,16,64,32,16,16,16,16,32,15,1,16,15,1,16,16,32,16,16,96,32,16,15,1,16,48,47,1,16,16,32,32,64,112,16,16],[306],[305],[18],[354,112,15,1,208,191,64,1,304,303,288,961],[34,111,1,255,1,448,256,32,239,1,767,1,511],[449,1,95,1,527,1136],[882,1216,303,1],[1330],[18],[466],[1249,1,335],[946,1248,288],[1474,16],[530,192],[466,96,64,96,31,1,95,1,160,16,383,1,272,16],[34,720,368,80,32,144,1376],[18,32,16,16,16,16,32,16,64,48,192,96,80,656],[18],[481,1,1040],[626,496],[290,304,1200,752],[258,208,448,288,672,896],[850],[322],[1938],[2482],[2098],[2674],[1234],[2305,1],[946],[2658,79,1,16],[818,992,320,16],[1394,416,320,16,160,80,16,96,31,1],[2818],[802],[674,1295],[1010,400,272,16],[1570,16],[1217,1],[562,64,128,272,383,1],[818,160],[1650],[18,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,15,1,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,15,1,16,16,16,16,16,16,16,16,16,16,16,16],[18,32,16,16,16,16,32,16,64,48,80,112,96,80,656],[370,1232,224,16],[514,176,256,16],[1714,175],[193,1,32,352,48,432,16,48,208,64,319,1,16,32,111,1,15,16,1,16,288,672],[178,16,1295,1,272,112,16],[130,1024,48,464,320],[1298,48,112,943,1],[722],[226],[770,816],[1586,239,801],[1826],[1858],[2289],[2577,1],[1298,48],[50,32,272,112,848,96,96],[850],[1314],[2818],[66],[1122],[898],[113,1537],[258,975],[1185,1,463,1,32,991],[178,288,448,64,256,96,399,1,32],[1330,640,176],[434],[1778],[146],[81,1],[1026,656],[2802],[1298],[1122],[850],[2738],[194,336,912,303,1],[354,16,1216,16,176,48,16],[450,448,32,112,16,48,128,48,272,80,944],[18,528,112,31,1,96,144,16,864,352,80,32,80,79,1,80,256,47,1,32],[1458],[290,304],[466,272,1872,32,15,209],[1218,704,367,1],[210,223,1,16,272,16,191,1,591,1,672,319,1,112,64,32,144,16],[114,1072],[1730],[18,176],[194,176,63,1,32,63,33,32,79,17,32,47,1,64,31,1,32,32,80,192,48,47,48,65,111,1,63,49,64,47,1,95,1,128,160,64,303,1,80,112,15,1,79,81,15],[50,719,1,128,112,1856],[65,1,16,16,32,111,1,63,1,31,1,64,16,48,32,64,16,16,16,32,64,32,16,79,1,47,1,64,16,32,32,31,1,16,16,32,128,64,16,191,1,63,81,96,96,48,16,32,48,15,1,16,16,16,16,31,1,15,1,48,16,32,16,31,1,16,16,16,64,31,1,16,16,16,16,32,32,16,32,16,223,1,16],[306],[49,1,16,112,48,80,16,31,1,15,1,96,95,1,31,1,48,96,96,80,16,47,1,15,1,15,1,16,16,16,351,1,15,1,64,15,1,112,16,48,15,1,47,16,1,31,1,31,97,64,127,176,1,159,1,127,1],[1745],[18,32,16,16,16,16,32,16,64,32,16,192,96,271,1,48,80,16,95,81,79,65,192,463,1,63,1,47,1,31,80,1,32,32,47,32,16,1,191,1,15,1,15,1,128,143,1,15,1],[194,1712,32],[18,32,16,16,16,16,32,16,64,48,192,96,80,96,224,336,176,31,224,1,32,687],[322,799,1,368,32,160,239,1],[82],[642],[194,1359,1],[1473,1,1183,96,1],[258,144,1871],[97,1,303,1,239,272,48,144,1,63,32,160,32,336,80,800,1],[226,831,1,320,16,32,64,112,175,256,1],[34],[1858],[1298,1184],[322],[1890],[1330],[1074],[322],[1490],[370,1136],[114,96,64,96,720,1664],[610,16,192,288,448],[258,176,2256],[994,1392],[18,224,48,128,16,64,16,80,176,496,192,112,160,544],[114,912,1600],[322],[114,1072],[1585],[530,240],[690,2128],[50,15,33,16,15,16,1,15,1,16,63,1,64,15,1,15,1,16,31,1,16,64,47,1,96,15,1,15,1,47,49,31,1,16,63,1,48,15,16,1,16,16,15,64,1,80,15,1,15,48,48,1,32,16,112,15,1,64,16,32,95,32,1,31,16,1,64,31,1,15,16,1,32,32,16,143,16,80,1,31,32,48,64,64,1,63,1,16,47,48,32,64,16,1,31,16,16,48,16,16,16],[546,2224],[1554],[194,912,384,416,288],[1122],[2865],[481,1],[1345],[594],[1426,352],[321,1,704,655,1],[258,1024,127],[258,192,176,400,96,224,368,144,64,704],[465,1],[162,976],[1458],[98,160,144,48,128,112,144,80,192,64,32,80,16,48,112,32,271,1,48,112,208,16,175,128,1,272],[2370],[482,1040,16,31,177],[82],[322],[1122],[258],[1665,1],[658],[306,80,608,192],[177,1,800],[1586],[1106,352],[1058,704,96,560],[322,624,560,80],[722],[322,2335],[626,224],[258],[130,111,1,335,497,112,16,96],[1346],[114,112,16,127,1,208,15,465,128,607],[1297,1,48],[1922,736],[66],[1249,17,975,1,176],[1250,64,64,544],[66,224,272,128,64,272,383,1,416],[338],[1650],[178,304,400,96,768,351,1],[18],[1746],[66,128,64,16,32,144,176,64,128,96,112,80,64,48,16,16,64,48,64,48,16,16,80,15,81,192,528,208,32,16,16,16,32,144],[466],[1761],[770],[882,784,751,1],[2369,1,287,96],[1890],[914],[2545],[1377,1],[386],[257,1184,1],[274,1024],[66,960,320,368],[642,400],[802],[738],[1826],[1282],[738],[194],[1154],[642,608],[1938],[210],[721,1],[449,1,2175,96],[1442],[882],[2465,1],[353,1,688,384,1216],[849,1,880,575],[34,1216,416],[1186],[1506],[1217],[1857],[1378],[2193,16],[2642],[2594],[1490],[1426],[769,1,128,1183,1],[1761],[1554],[658,16,208],[1666],[194],[498,848,368,175,481],[690,208,688,1040],[850,176,416,448,32],[882],[66],[1362],[1874],[770],[306],[530,912],[2033,528],[737],[1409,1],[642],[1538,256,848],[1778],[626,496],[1937],[1473],[2690],[18,512],[1265,1,991,1],[1426],[50,944,176,336,655,1,319],[1218],[1970],[674],[1825],[1073,288,97,496,144,463,305],[1394],[402,592,32,31,1,1055,160],[49,177,767,432,561],[1554],[402,48,464],[658,1343,1],[850],[850],[1490],[130,1855,1],[1666,415,1,320],[1442],[1538,992],[1170],[1442],[1506],[33],[2369],[770,128],[722],[2145,1],[1234],[1362],[482],[2289,1],[1330],[1890],[545,1,159,1,47,1,847,1,16,160,160,319,96,416,1],[1505],[1522,880],[66,800],[34,160],[1298,48],[241,1],[34,32,64,79,17,112,16,144,111,1,48,47,33,16,63,33,15,1,32,16,79,96,17,80,16,48,128,16,192,32,112,80,128,47,368,32,225,32,96,32,112],[130,176,80,320,144,144,96,112,144,48,48,176,48,128,96,32,432,32,416],[114],[1313,1,144,479,1,288,192,48],[1314,112],[1874,928],[17,1,31,32,80,64,32,48,208,32,96,16,96,32,128,64,96,32,64,80,128,16,96,65,15,48,176,16,128,272,432,16,16,64,32,32],[658],[193,400,1824,448],[34,1152,175,113,1248],[450,239,1,224,32,416,144,896,415,1],[866],[865,1],[242],[1218,352],[482],[114,464,480,15,1,112,288],[1057,1],[498,48,160,112,1280,256,528],[882,1216],[1521,1,1232,112,16],[2417,1,95],[2706],[322,688,16,656],[674,2208],[114,1072],[114,464,480,1472],[1569,1],[2626],[770,127,1,1887,1,95,1],[210,224,303,1,16,176,656,47,1,48,895,113,175,1,16],[2593,1],[1745,1],[578],[1138],[1218],[434],[2194,688],[82],[529,144,624,1488,96],[2882],[1714],[1714,175,1],[130,240,544,240,15,1,112,32,480,527,1,352],[66],[1025,1,48,608],[802],[81,1,48,272,240,144,48,48,320,176,528,48,240,16,128,144,48,304,16],[594,336],[882],[65,593,1984],[1298,47],[2322,48,176],[66],[722,48,992,496],[1570],[2818],[2882],[1346],[1298,48],[1346],[66],[1746,656],[961,1,1136,64],[146,16],[226,432,320,1760],[898,320,272,144,288,80,111,113,192,48,32,240,128],[1937],[1906,496],[770],[226,848,672,543],[770],[274],[466],[81,1],[98,304,384,48,112,208,720,32,48,192,64,128,144,352,16],[242,1024],[1170],[369,1],[1778],[1650],[2418],[258],[257,1],[833,1,48,80,991,1,143,81,655,1],[2017,1,47,1,111,33,32,47,32,16,1,191,1,15,1,15,1,287,1],[2209],[1858,720],[98,16,112,624,320,464,127,49,112,224,415,1,16],[1730],[2642],[161,257,96,96,48,32,64,16,112,16,47,1,16,175,1,831,1,31,1,47,1,96,48,63,49,48,32,95,305,31],[2786],[226,160,1327],[722,47,1,80,47,1,256,927,1,511,1,191,1],[2674],[546],[2497,1],[1682],[866],[722,31,1,95,1,1232,672],[2034,80,176,160],[2674],[482,1040,16,96,944,288],[34,431,1],[1058,15,1,416,32,16,31,81,112,160],[1649,1],[801,1],[2097,1],[1378,16,639,1],[1281,1],[1554],[530,191,1,48,128],[1442],[546,2224],[1554],[2257,1],[274,336,79,1,255,1,319,1,688,64,16,16,16,16,32,15,1,48,63,16,1,16,16,16,144,48,15,1,48,32,223,1],[882],[33,1,16,80,192,16,64,48,15,1,160,96,16,16,32,63,65,16,96,64,16,16,160,32,48,16,16,32,32,32,63,1,80,48,48,144,32,16,32,32,127,1,64,32,111,1,16,96,96,48,144,112],[433,1,1200,560,496,48],[434,240,288,1184,31,1,16,16,32,16,272,335,1],[370,224,1200],[162,176,784,591,1],[369,1,1424,112,64],[866],[898],[465,1],[514,320,1824,176],[353],[1298,48],[1218],[801,1],[1634],[626],[2098],[2369,1],[114,1072],[178,32,16,96,112,1024,80,112,80,1008],[194],[2177,1,80,272],[913,1,512],[353,1],[2594],[338],[178,112,688,768,80],[1825,1],[689,1,191,1,1951],[658,960,320],[289,1],[498],[130,1039,1,16,16,783,1,416],[2882],[98,15,1,15,1,15,16,1,32,63,1,15,1,128,208,80,16,80,48,48,80,175,1,16,31,1,15,1,48,112,256,16,16,16,64,64,144,15,1,48,16,16,15,1,16,15,1,16,32,16,16,16,32,15,1,16,16,32,16,16,48,16,15,1,32,16,15,1,16,48,16,16,272,16],[114,95,208,80,32,80,16,48,32,32,80,80,96,96,48,160,48,17,111,64,16,96,128,80,128,368,32,240,64,32,32,32,96],[802],[34,31,17,15,1,15,1,16,111,32,1,32,31,64,1,15,1,15,48,1,15,1,48,48,15,1,16,15,1,32,47,33,15,17,15,16,1,15,32,48,1,31,16,1,16,47,1,16,63,1,48,15,17,15,1,15,65,64,15,1,16,15,1,15,17,15,17,64,96,63,1,32,15,32,1,16,31,1,15,49,15,17,16,32,15,64,1,95,17,48,16,31,17,47,33,32,48,112,63,16,1,47,17,96,32,15,33],[242],[466],[850],[626,400],[1842],[578],[1554],[194,1712],[98],[754,479,1,32,112,16,640,31,1,48,176,160,144,16],[706,1120,944],[1825,1,752],[290,768],[722,720,640,560,96],[1714],[66,64,384,32,112,32,544,15,1,32,96,160,48,48,272,128,80,159,1,16,31,1,32,96,48,32,16,32,16,16,16,16,112,16,32],[1442,1263],[1490],[722],[1442],[1154],[257,192,1,287,192,529,336,831,96],[1073],[626,496,399,1],[465],[322],[642,400],[1586,175,1],[290],[642,400,1360],[1746],[674,496,1712],[514,432,1536],[17,1,80,31,1,15,1,15,1,112,128,15,1,79,1,15,1,15,1,16,63,1,15,1,15,16,1,15,1,15,1,16,16,47,1,16,16,16,15,1,15,1,31,16,1,15,16,16,17,15,1,63,81,15,1,15,1,47,49,32,80,15,1,223,193,15,1,143,1,47,16,1,31,1,15,16,16,32,17,15,16,1,15,17,15,16,16,1,15,16,16,16,1,15,1,16,15,1,15,1,15,16,48,1,31,1,15,1,15,1,15,1,15,32,128,32,17,15,1,15,1,31,16,1],[1714,176],[1490,432],[770,128,31,1,591,113,943,1,112],[98,1503,1],[258,1504,976],[1442],[2705],[514,176,176,80,832,63,1,416,543,1],[337,96,1,176,111,48,49,32,320,1647],[305,304,1,207,801],[434,2256,175,1],[1969],[1970],[226],[34,704,15,1,96,527,1,352,144,736],[66,16,144,128,111,385,576],[18,1200],[2561,1],[305,1],[1346],[322],[17,17,16,16,15,1,15,1,64,16,16,31,113,15,1,47,1,64,16,16,15,97,31,16,1,95,1,128,31,48,144,33,31,32,48,112,16,1,15,81,15,33,31,1,63,1,111,33,47,65,63,208,1,47,416,1,31,16,80,1,16,15,1],[49,177,31,81,31,17,63,1,64,31,1,144,95,161,31,1,16,79,384,1,111,1,80,63,65,15,208,32,81,95,160,64,17,111,112,1,127,1],[34],[146],[418,96,176,96,96,928,384,111,1,48,127,1,336],[18,751,1,128,672,511,561,144],[434,2352,96],[18,560,16,144,240,80],[2241],[2242,319,1],[2530],[2738],[34],[2017,1],[786,1168],[1266],[1218,352],[130],[2482],[18,528,2224],[578,592],[178,800,224,831,305],[2433,1],[2226],[2658],[658],[786],[1794],[1154],[498],[18],[594,1200],[130],[402,1871],[1906],[578,1871,1],[2049,1],[178,112,688],[1378,1200],[2705],[1154],[1521,1],[2226],[514],[322],[2226],[2226],[1521],[802],[2754],[1954],[1010],[802],[658],[882],[1250,336],[370],[1202],[1778],[466,1152,1184],[2065,1],[194],[1618],[162],[66],[370],[98],[82,144,1200,1184,128],[98,32,1024,48,1200],[98,16,288,48,112,352,96,176,175,17,16,16,80,31,1,16,127,1,32,335,1,47,1,144,304,64,80,192],[562],[562,768],[1601,1],[2257],[18,80,32,272,95,1,48,240,128,48,192,48,176,16,416,64,32,48,192,48,16,16,112,192,144,96,80],[18,480,47,1,159,1,79,417,528,496,127,1,319],[178,800],[418,2432],[594],[322,31,1,96,16,63,192,1,16,16,15,1,48,32,48,16,15,1,79,1,319,1,111,1,32,223,1,383,32,1,96,128,352,16],[337,1,288,1296,784],[1122],[338],[34,416,32,208,256,160,16,352,384,720],[322],[50,48,80,48,112,16,80,112,16,64,32,16,96,48,112,16,32,32,32,16,64,208,80,32,80,16,112,32,80,640,16,64,224],[34,144,32,224,80,80,80,208,96,80,16,144,16,96,96,32,64,192,160,112],[834],[50],[530],[2321],[2545,1],[1601],[2706],[130,1072],[690],[2210],[1426],[66,640,160],[610,64,2208],[482],[1554],[690],[146],[1298],[482],[82],[786],[482,80],[962],[2626],[258],[514,272,48,2000],[1970],[114],[2034,80,16,160,16,144,144],[2865],[689,1,255,1,1871],[33,1009],[1217],[1474,352,864],[193,1,1552],[321,1,159,145,495,1,368,431,1],[1170],[1362],[258,992,112,1264,96],[1858],[1730,32,16,320,64,720],[2370,128],[882,1216],[82,160],[2690],[562],[130,64,1008],[1170],[273,1,624,1888],[274],[1250],[658,176,47,433,736,16,208,160,64,304,32],[882,1024,192],[258,192,784,80,160,384,752,16,16,80],[450],[1474],[1250],[114,511,449],[482],[114,31,1,16,480,399,97,15,1,128,31,145,399,48,512],[1970],[433,336,1,128,160,304,239,1,1216],[177,1,176,127,400,64,545,271,80],[465],[2130],[466,1936],[50,16],[482],[113,1,1072],[2882],[578,480],[946,895,641],[66,1520,1104],[2642],[1970],[1298,48],[578],[337,289],[258,192,736,128,160,1248],[18],[466],[1362],[18,32,16,16,16,16,32,16,64,48,48,144,96,64,16,656,527],[2690],[209,208,80,32,80,16,48,32,32,80,80,96,96,48,160,48,128,64,16,96,128,80,128,368,32,240,64,32,32,32,96],[481,321,431,1,191,1,208,944],[2866],[290],[450,864,80,1200],[2674],[738],[642,400,1360],[1553,1],[690,144,1776,224],[722,1376,784],[578,480,800],[465,513,544,272,848],[722],[818],[722,1600],[274,2544]]};
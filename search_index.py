@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Bilingual inverted index for the text search of the quiz pages.
+
+Terms come from the English question and option text and from the Arabic
+tooltips (QAR) and explanations, normalized the same way the pages normalize
+a query: lower case, Arabic diacritics and tatweel stripped, alef/yeh/teh
+marbuta variants folded, and Arabic words also indexed without a leading
+article (الترحيل -> ترحيل). The terms are sorted, so a prefix query is a
+binary search for the first matching term plus a scan of its neighbours.
+
+Each term's postings are qid * 16 + field codes (FIELDS), sorted and delta
+encoded. The index is written as search_index.js, a script the pages load
+only when the search box is first used (it works from file:// as well):
+
+    python search_index.py              # write search_index.js
+    python search_index.py thrash الترحيل  # query it from the console
+"""
+import json, os, re
+
+from generate_html import load_questions, load_explanations, write_if_changed
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_JS = os.path.join(SCRIPT_DIR, 'search_index.js')
+INDEX_VERSION = 1
+
+# field code -> where the term was found; options use OPTION + their index
+QUESTION, TOOLTIP, EXPLANATION, OPTION = 0, 1, 2, 3
+FIELDS = ['question', 'tooltip', 'explanation', 'option']
+FIELD_BITS = 16
+
+_DIACRITICS = re.compile('[\u064b-\u065f\u0670\u0640]')
+_FOLD = str.maketrans({'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا', 'ى': 'ي', 'ة': 'ه'})
+_WORD = re.compile('[a-z0-9]+|[\u0621-\u064a]+')
+_ARTICLE = re.compile('^(?:[وفبك]?ال|لل)(?=..)')
+_OPTION_PREFIX = re.compile(r'^[a-d]\)\s*', re.I)
+
+def normalize(text):
+    return _DIACRITICS.sub('', text.lower()).translate(_FOLD)
+
+def terms(text):
+    """Distinct index terms of a text (words of two or more letters)"""
+    out = set()
+    for word in _WORD.findall(normalize(text)):
+        if len(word) < 2:
+            continue
+        out.add(word)
+        bare = _ARTICLE.sub('', word)
+        if bare != word:
+            out.add(bare)
+    return out
+
+def build_index(questions, tooltips, explanations):
+    """{'v', 'fields', 'terms': sorted terms, 'postings': delta-encoded lists}"""
+    postings = {}
+    def add(text, qid, field):
+        for term in terms(text):
+            postings.setdefault(term, set()).add(qid * FIELD_BITS + field)
+
+    for q in questions:
+        qid = q['id']
+        add(q['text'], qid, QUESTION)
+        for i, opt in enumerate(q['options'][:FIELD_BITS - OPTION]):
+            add(_OPTION_PREFIX.sub('', opt['text']), qid, OPTION + i)
+        add(tooltips.get(qid, ''), qid, TOOLTIP)
+        add(' '.join(explanations.get(qid) or ()), qid, EXPLANATION)
+
+    sorted_terms = sorted(postings)
+    encoded = []
+    for term in sorted_terms:
+        prev, deltas = 0, []
+        for code in sorted(postings[term]):
+            deltas.append(code - prev)
+            prev = code
+        encoded.append(deltas)
+    return {'v': INDEX_VERSION, 'fields': FIELDS, 'terms': sorted_terms, 'postings': encoded}
+
+def build(path=INDEX_JS):
+    """Write search_index.js; returns True if it changed"""
+    questions = load_questions()
+    explanations, tooltips = load_explanations(questions)
+    index = build_index(questions, tooltips, explanations)
+    text = ('const SEARCH_INDEX = '
+            + json.dumps(index, ensure_ascii=False, separators=(',', ':')) + ';\n')
+    return write_if_changed(path, text)
+
+def search(index, query):
+    """{qid: set of field codes} for questions matching every query word as a prefix"""
+    import bisect
+    found = None
+    for word in _WORD.findall(normalize(query)):
+        if len(word) < 2:
+            continue
+        hits = {}
+        i = bisect.bisect_left(index['terms'], word)
+        while i < len(index['terms']) and index['terms'][i].startswith(word):
+            code = 0
+            for delta in index['postings'][i]:
+                code += delta
+                hits.setdefault(code // FIELD_BITS, set()).add(code % FIELD_BITS)
+            i += 1
+        if found is None:
+            found = hits
+        else:
+            found = {qid: found[qid] | fields for qid, fields in hits.items() if qid in found}
+    return found or {}
+
+def main(argv=None):
+    import sys
+    args = sys.argv[1:] if argv is None else argv
+    changed = build()
+    print(f"{'Updated' if changed else 'Unchanged'} {INDEX_JS}")
+    if args:
+        with open(INDEX_JS, 'r', encoding='utf-8') as f:
+            index = json.loads(f.read()[len('const SEARCH_INDEX = '):-2])
+        for query in args:
+            hits = search(index, query)
+            print(f"{query}: {len(hits)} questions {sorted(hits)[:20]}")
+
+if __name__ == '__main__':
+    main()
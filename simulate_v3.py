@@ -1,7 +1,6 @@
-import json, re
+import json, os, re
 
-with open("questions.json", "r", encoding="utf-8") as f:
-    questions = json.load(f)
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 def clean(text):
     return re.sub(r'^[a-d]\)\s*', '', text.strip())
@@ -181,42 +180,56 @@ def apply_algorithm(q):
     
     return (longest_winners[0][2], 'gamble', 'Tie-breaker')
 
-# RUN
-total_correct = 0
-certain_c, certain_t = 0, 0
-probable_c, probable_t = 0, 0
-gamble_c, gamble_t = 0, 0
-wrong_qs = []
+def solve(questions):
+    """Run the algorithm on every question; returns [(id, is_correct, confidence, rule)]"""
+    results = []
+    for q in questions:
+        result, confidence, rule = apply_algorithm(q)
+        results.append((q['id'], result == True, confidence, rule))
+    return results
 
-for q in questions:
-    result, confidence, rule = apply_algorithm(q)
-    is_correct = result == True
-    if is_correct: total_correct += 1
-    else: wrong_qs.append(q['id'])
-    if confidence == 'certain':
-        certain_t += 1
-        if is_correct: certain_c += 1
-    elif confidence == 'probable':
-        probable_t += 1
-        if is_correct: probable_c += 1
-    else:
-        gamble_t += 1
-        if is_correct: gamble_c += 1
+def main(questions=None):
+    if questions is None:
+        with open(os.path.join(SCRIPT_DIR, "questions.json"), "r", encoding="utf-8") as f:
+            questions = json.load(f)
+    total_correct = 0
+    certain_c, certain_t = 0, 0
+    probable_c, probable_t = 0, 0
+    gamble_c, gamble_t = 0, 0
+    wrong_qs = []
 
-print("=" * 60)
-print("📊 النتائج بعد إضافة memory كفخ + كلمات ذهبية مكررة")
-print("=" * 60)
-print(f"\n✅ المجموع: {total_correct}/180 = {total_correct*100//180}%")
-print(f"🟢 مؤكد: {certain_c}/{certain_t} = {certain_c*100//certain_t if certain_t else 0}%")
-print(f"🟡 محتمل: {probable_c}/{probable_t} = {probable_c*100//probable_t if probable_t else 0}%")
-print(f"🔴 مقامرة: {gamble_c}/{gamble_t} = {gamble_c*100//gamble_t if gamble_t else 0}%")
-print(f"\n❌ أسئلة غلط ({len(wrong_qs)}): {sorted(wrong_qs)}")
+    for q in questions:
+        result, confidence, rule = apply_algorithm(q)
+        is_correct = result == True
+        if is_correct: total_correct += 1
+        else: wrong_qs.append(q['id'])
+        if confidence == 'certain':
+            certain_t += 1
+            if is_correct: certain_c += 1
+        elif confidence == 'probable':
+            probable_t += 1
+            if is_correct: probable_c += 1
+        else:
+            gamble_t += 1
+            if is_correct: gamble_c += 1
+
+    print("=" * 60)
+    print("📊 النتائج بعد إضافة memory كفخ + كلمات ذهبية مكررة")
+    print("=" * 60)
+    print(f"\n✅ المجموع: {total_correct}/180 = {total_correct*100//180}%")
+    print(f"🟢 مؤكد: {certain_c}/{certain_t} = {certain_c*100//certain_t if certain_t else 0}%")
+    print(f"🟡 محتمل: {probable_c}/{probable_t} = {probable_c*100//probable_t if probable_t else 0}%")
+    print(f"🔴 مقامرة: {gamble_c}/{gamble_t} = {gamble_c*100//gamble_t if gamble_t else 0}%")
+    print(f"\n❌ أسئلة غلط ({len(wrong_qs)}): {sorted(wrong_qs)}")
+
+    # Show what each new rule contributed
+    print(f"\n--- تفاصيل القواعد الجديدة ---")
+    for q in questions:
+        result, confidence, rule = apply_algorithm(q)
+        if 'GoldenDup' in rule or ('memory' in rule.lower()):
+            correct_text = clean([o["text"] for o in q["options"] if o["correct"]][0])
+            emoji = "✅" if result else "❌"
+            print(f"  {emoji} Q{q['id']}: {rule} → {correct_text[:50]}")
 
-# Show what each new rule contributed
-print(f"\n--- تفاصيل القواعد الجديدة ---")
-for q in questions:
-    result, confidence, rule = apply_algorithm(q)
-    if 'GoldenDup' in rule or ('memory' in rule.lower()):
-        correct_text = clean([o["text"] for o in q["options"] if o["correct"]][0])
-        emoji = "✅" if result else "❌"
-        print(f"  {emoji} Q{q['id']}: {rule} → {correct_text[:50]}")
+if __name__ == "__main__":
+    main()
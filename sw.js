@@ -0,0 +1,73 @@
+// Generated by build_sw.py - do not edit
+const PRECACHE = {"index.html": "7b360c6019", "algorithm_reference.html": "9ffaccc4a3", "algorithm_trainer.html": "b816247764", "questions_data.js": "7dfd1ef70b", "search_index.js": "282a9bbe4e", "trainer_spans.js": "e3a91741a5", "explanations/q1-30.b5cbf5fd53.js": "b5cbf5fd53", "explanations/q121-150.40da2a7b72.js": "40da2a7b72", "explanations/q151-180.613d16327d.js": "613d16327d", "explanations/q31-60.a574efd9e3.js": "a574efd9e3", "explanations/q61-90.cbcd52ee26.js": "cbcd52ee26", "explanations/q91-120.52e07a3086.js": "52e07a3086"};
+const FONT_HOSTS = ["fonts.googleapis.com", "fonts.gstatic.com"];
+const CACHE = "os-quiz-precache";
+const RUNTIME = "os-quiz-runtime";
+const SCOPE = new URL(self.registration.scope).pathname;
+
+const versioned = (url) => url + "?v=" + PRECACHE[url];
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    (async () => {
+      const cache = await caches.open(CACHE);
+      await Promise.all(
+        Object.keys(PRECACHE).map(async (url) => {
+          if (await cache.match(versioned(url))) return; // unchanged
+          const res = await fetch(url, { cache: "no-cache" });
+          if (!res.ok) throw new Error(url + ": " + res.status);
+          await cache.put(versioned(url), res);
+        })
+      );
+      await self.skipWaiting();
+    })()
+  );
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    (async () => {
+      const cache = await caches.open(CACHE);
+      const keep = new Set(
+        Object.keys(PRECACHE).map((url) => new URL(versioned(url), location).href)
+      );
+      for (const req of await cache.keys()) {
+        if (!keep.has(req.url)) await cache.delete(req);
+      }
+      await self.clients.claim();
+    })()
+  );
+});
+
+self.addEventListener("fetch", (event) => {
+  const req = event.request;
+  if (req.method !== "GET") return;
+  const url = new URL(req.url);
+  if (url.origin === location.origin && url.pathname.startsWith(SCOPE)) {
+    const path = url.pathname.slice(SCOPE.length) || "index.html";
+    if (path in PRECACHE) {
+      event.respondWith(
+        caches
+          .open(CACHE)
+          .then((cache) => cache.match(versioned(path)))
+          .then((res) => res || fetch(req))
+      );
+      return;
+    }
+  }
+  if (url.origin === location.origin || FONT_HOSTS.includes(url.host)) {
+    event.respondWith(staleWhileRevalidate(event, req));
+  }
+});
+
+async function staleWhileRevalidate(event, req) {
+  const cache = await caches.open(RUNTIME);
+  const cached = await cache.match(req);
+  const network = fetch(req).then((res) => {
+    if (res.ok) cache.put(req, res.clone());
+    return res;
+  });
+  if (!cached) return network;
+  event.waitUntil(network.catch(() => {}));
+  return cached;
+}
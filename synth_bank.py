@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Synthetic TCPDF question banks shaped like QuestionsBank.txt, at any size.
+
+Each question is a real one from questions.json with its wording varied
+(one word swapped for another word of the bank) and its options shuffled,
+"all/none of the ..." options kept last and a)-d) prefixes re-lettered, so
+the solver rules, topics and option lengths keep the real mix, T/F pairs
+included. The page structure is the export's:
+
+  * the six-line Arabic header of page 1 and the three-line header of
+    every later page, and a " الصفحة p / N" footer every page
+  * question text wrapped onto a continuation line past WRAP characters
+  * options numbered 1) to 4) and marked + / -, "a) "-prefixed where the
+    source question is
+  * now and then a question marked "? " (Q5) and two option lines merged
+    into one (Q4), at about the real bank's rate
+  * "Powered by TCPDF (www.tcpdf.org)" above the last footer
+
+The bank is streamed to the file in two passes of the same seeded
+generator (the first only counts pages), so a million questions take
+little memory:
+
+    python synth_bank.py -n 100000 -o bank_100k.txt
+    python synth_bank.py -n 1000 -o bank_1k.txt --check    # parse it back
+"""
+import argparse, json, os, random, re
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+FIRST_HEADER = ['الجمهورية اليمنية', 'جامعة صنعاء', 'مركز الاختبارات الالكترونية', 'قائمة الاسئلة',
+                'نظم تشغيل - المستوى الثاتي -قسم علوم حاسوب - - كلية الحاسوب وتكنولوجيا المعلومات'
+                ' - الفترة - درجة الامتحان ({n})',
+                'د مالك الجبري']
+PAGE_HEADER = FIRST_HEADER[:3]
+FOOTER = ' الصفحة {page} / {pages}'
+POWERED = 'Powered by TCPDF (www.tcpdf.org)'
+# body lines on the first page and on the others (53-line pages)
+FIRST_BODY, PAGE_BODY = 44, 49
+WRAP = 105
+# one in this many questions is "?"-marked / has its first two options merged
+QMARK_EVERY, MERGED_EVERY = 180, 180
+
+_PREFIX = re.compile(r'^[a-d]\)\s*')
+_LAST = re.compile(r'\b(all|none) of\b', re.I)
+_WORD = re.compile(r'[A-Za-z]{4,}')
+
+def load_templates(path=None):
+    with open(path or os.path.join(SCRIPT_DIR, 'questions.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _vary(text, rng, vocabulary):
+    """The text with one of its longer words replaced by a word of the bank"""
+    words = list(_WORD.finditer(text))
+    if not words or rng.random() < 0.3:
+        return text
+    m = rng.choice(words)
+    return text[:m.start()] + rng.choice(vocabulary) + text[m.end():]
+
+def _options(template, rng):
+    """[(text, correct)] of a template, shuffled with all/none options last"""
+    opts = [(_PREFIX.sub('', o['text']), o['correct'], bool(_PREFIX.match(o['text'])))
+            for o in template['options']]
+    if len(opts) == 2:
+        return [(t, c) for t, c, _ in opts]
+    middle = [o for o in opts if not _LAST.search(o[0])]
+    rng.shuffle(middle)
+    opts = middle + [o for o in opts if _LAST.search(o[0])]
+    return [((f'{"abcd"[i]}) {t}' if prefixed and i < 4 else t), c)
+            for i, (t, c, prefixed) in enumerate(opts)]
+
+def questions(templates, n, seed=0):
+    """Yield n synthetic questions {'id', 'text', 'options', 'qmark', 'merged'}"""
+    rng = random.Random(seed)
+    vocabulary = sorted({w.lower() for q in templates for w in _WORD.findall(q['text'])})
+    for qid in range(1, n + 1):
+        template = rng.choice(templates)
+        opts = _options(template, rng)
+        yield {'id': qid, 'text': _vary(template['text'], rng, vocabulary),
+               'options': [{'text': t, 'correct': c} for t, c in opts],
+               'qmark': rng.randrange(QMARK_EVERY) == 0,
+               'merged': len(opts) > 2 and rng.randrange(MERGED_EVERY) == 0}
+
+def _wrap(text):
+    if len(text) <= WRAP:
+        return [text]
+    cut = text.rfind(' ', 0, WRAP)
+    return [text] if cut <= 0 else [text[:cut], text[cut + 1:]]
+
+def body_lines(templates, n, seed=0):
+    """Yield the question and option lines of the bank, without pages"""
+    for q in questions(templates, n, seed):
+        first, *rest = _wrap(q['text'])
+        yield f"{q['id']}) {'? ' if q['qmark'] else ''}{first}"
+        yield from rest
+        lines = [f"{i}) {'+' if o['correct'] else '-'} {o['text']}"
+                 for i, o in enumerate(q['options'], 1)]
+        if q['merged']:
+            lines[:2] = [lines[0] + lines[1]]
+        yield from lines
+
+def page_count(body):
+    return 1 + max(0, -(-(body - FIRST_BODY) // PAGE_BODY))
+
+def write_bank(path, templates, n, seed=0):
+    """Write a TCPDF-style bank of n questions; returns the number of pages"""
+    pages = page_count(sum(1 for _ in body_lines(templates, n, seed)))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(FIRST_HEADER).format(n=n) + '\n')
+        page, room = 1, FIRST_BODY
+        for line in body_lines(templates, n, seed):
+            if room == 0:
+                f.write(FOOTER.format(page=page, pages=pages) + '\n')
+                f.write('\n'.join(PAGE_HEADER) + '\n')
+                page, room = page + 1, PAGE_BODY
+            f.write(line + '\n')
+            room -= 1
+        f.write(POWERED + '\n' + FOOTER.format(page=page, pages=pages) + '\n')
+    return pages
+
+def expected(templates, n, seed=0):
+    """The questions parse_questions should read back from write_bank's file"""
+    out = []
+    for q in questions(templates, n, seed):
+        text = ' '.join(_wrap(q['text']))
+        out.append({'id': q['id'], 'text': text, 'options': q['options']})
+    return out
+
+def main(argv=None):
+    import time
+    parser = argparse.ArgumentParser(description='Write a synthetic TCPDF question bank.')
+    parser.add_argument('-n', '--count', type=int, default=1000, help='questions')
+    parser.add_argument('-o', '--output', required=True)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--questions', help='template questions JSON (default: questions.json)')
+    parser.add_argument('--check', action='store_true', help='parse the bank back and compare')
+    args = parser.parse_args(argv)
+    templates = load_templates(args.questions)
+    start = time.perf_counter()
+    pages = write_bank(args.output, templates, args.count, args.seed)
+    print(f"Wrote {args.count} questions on {pages} pages to {args.output} "
+          f"({os.path.getsize(args.output) / 1e6:.1f} MB) in {time.perf_counter() - start:.2f}s")
+    if args.check:
+        from parse_questions import parse_questions
+        parsed = parse_questions(args.output)
+        want = expected(templates, args.count, args.seed)
+        bad = [w['id'] for p, w in zip(parsed, want) if p != w]
+        if len(parsed) != len(want) or bad:
+            raise SystemExit(f"parse mismatch: {len(parsed)} parsed, differing ids {bad[:10]}")
+        print(f"Parsed back {len(parsed)} questions unchanged")
+
+if __name__ == '__main__':
+    main()
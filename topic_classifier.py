@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Batch topic classifier for new question banks.
+
+Trains on the hand-labelled bank (questions.json + TOPIC_MAP) and labels a
+whole new bank in one pass:
+
+  * every question becomes a TF-IDF vector over its words and word bigrams,
+    with option text weighted lower than the question text
+  * each topic is the normalized centroid of its labelled questions
+  * a new bank is one matrix product against the centroids; a softmax over
+    the cosine scores gives the confidence, and runner-up topics close to
+    the best one are kept as extra labels
+
+The result is a TOPIC_MAP-compatible dict, so generate_html needs no manual
+curation for a new semester:
+
+    python topic_classifier.py new_bank.txt -o topic_map.json
+    python topic_classifier.py --eval        # cross-validate on this bank
+"""
+import json, os, re
+from collections import Counter
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+STOP_WORDS = {'the','a','an','is','are','of','in','to','for','and','or','which','what',
+              'following','not','does','that','this','it','by','on','from','with','be',
+              'how','do','was','has','have','can','will','its','when','if','these',
+              'true','false','above','mentioned','all','none','both'}
+
+OPTION_WEIGHT = 0.5
+CHUNK = 4096
+
+def clean(text):
+    return re.sub(r'^[a-d]\)\s*', '', text.strip())
+
+def tokens(text):
+    """Words and adjacent-word bigrams, stop words dropped"""
+    words = [w for w in re.findall(r'[a-z0-9/]+', text.lower()) if w not in STOP_WORDS]
+    return words + [a + ' ' + b for a, b in zip(words, words[1:])]
+
+def term_counts(q):
+    counts = Counter(tokens(q['text']))
+    for opt in q['options']:
+        for term in tokens(clean(opt['text'])):
+            counts[term] += OPTION_WEIGHT
+    return counts
+
+class TopicClassifier:
+    def __init__(self, temperature=0.05, extra_ratio=0.85):
+        self.temperature = temperature
+        self.extra_ratio = extra_ratio
+
+    def fit(self, questions, labels, topics=None):
+        """labels: one sequence of topic names per question; `topics` fixes their order"""
+        docs = [term_counts(q) for q in questions]
+        df = Counter(term for doc in docs for term in doc)
+        # terms seen once carry no signal shared across questions
+        self.vocab = {t: i for i, t in enumerate(sorted(t for t, n in df.items() if n > 1))}
+        n = len(docs)
+        self.idf = np.zeros(len(self.vocab), dtype=np.float32)
+        for term, i in self.vocab.items():
+            self.idf[i] = np.log((1 + n) / (1 + df[term])) + 1
+
+        self.topics = [t for t in topics or () if any(t in l for l in labels)]
+        for topic_list in labels:
+            for topic in topic_list:
+                if topic not in self.topics:
+                    self.topics.append(topic)
+        y = np.zeros((n, len(self.topics)), dtype=np.float32)
+        for row, topic_list in enumerate(labels):
+            for topic in topic_list:
+                y[row, self.topics.index(topic)] = 1
+
+        X = self._matrix(docs)
+        centroids = y.T @ X
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        self.centroids = centroids / np.maximum(norms, 1e-12)
+        return self
+
+    def _matrix(self, docs):
+        """L2-normalized TF-IDF rows (sublinear tf)"""
+        X = np.zeros((len(docs), len(self.vocab)), dtype=np.float32)
+        rows, cols, vals = [], [], []
+        for row, doc in enumerate(docs):
+            for term, count in doc.items():
+                col = self.vocab.get(term)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+                    vals.append(count)
+        if rows:
+            X[rows, cols] = 1 + np.log(np.asarray(vals, dtype=np.float32))
+        X *= self.idf
+        norms = np.linalg.norm(X, axis=1, keepdims=True)
+        return X / np.maximum(norms, 1e-12)
+
+    def scores(self, questions):
+        """(n_questions, n_topics) cosine similarity, computed CHUNK rows at a time"""
+        out = np.empty((len(questions), len(self.topics)), dtype=np.float32)
+        for start in range(0, len(questions), CHUNK):
+            docs = [term_counts(q) for q in questions[start:start + CHUNK]]
+            out[start:start + len(docs)] = self._matrix(docs) @ self.centroids.T
+        return out
+
+    def predict(self, questions):
+        """[(id, [topics], confidence)]; the first topic is the primary one"""
+        S = self.scores(questions)
+        z = (S - S.max(axis=1, keepdims=True)) / self.temperature
+        P = np.exp(z)
+        P /= P.sum(axis=1, keepdims=True)
+        best = S.argmax(axis=1)
+        keep = S >= S[np.arange(len(S)), best][:, None] * self.extra_ratio
+        results = []
+        for row, q in enumerate(questions):
+            order = [int(best[row])] + [int(i) for i in np.argsort(-S[row])
+                                        if keep[row, i] and i != best[row] and S[row, i] > 0]
+            results.append((q['id'], [self.topics[i] for i in order], float(P[row, best[row]])))
+        return results
+
+def to_topic_map(results, topics):
+    """TOPIC_MAP-style {topic: [ids]} in the given topic order"""
+    topic_map = {t: [] for t in topics}
+    for qid, labels, _ in results:
+        for topic in labels:
+            topic_map.setdefault(topic, []).append(qid)
+    return {t: ids for t, ids in topic_map.items() if ids}
+
+def train_default(questions=None):
+    """Classifier trained on questions.json with the curated TOPIC_MAP labels"""
+    from generate_html import TOPIC_INDEX
+    if questions is None:
+        with open(os.path.join(SCRIPT_DIR, 'questions.json'), 'r', encoding='utf-8') as f:
+            questions = json.load(f)
+    labels = [TOPIC_INDEX.topics_of(q['id']) for q in questions]
+    return TopicClassifier().fit(questions, labels, TOPIC_INDEX.topics), questions, labels
+
+def classify(questions, clf=None):
+    """Label a bank; returns (topic_map, results)"""
+    if clf is None:
+        clf = train_default()[0]
+    results = clf.predict(questions)
+    return to_topic_map(results, clf.topics), results
+
+def cross_validate(questions, labels, folds=5):
+    """Share of questions whose predicted primary topic is one of their labels"""
+    hits = 0
+    for k in range(folds):
+        train = [i for i in range(len(questions)) if i % folds != k]
+        test = [i for i in range(len(questions)) if i % folds == k]
+        clf = TopicClassifier().fit([questions[i] for i in train], [labels[i] for i in train])
+        for i, (_, predicted, _) in zip(test, clf.predict([questions[i] for i in test])):
+            hits += predicted[0] in labels[i]
+    return hits / len(questions)
+
+def load_bank(path):
+    if path.endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    from parse_questions import parse_questions
+    return parse_questions(path)
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Label a question bank with topics.')
+    parser.add_argument('bank', nargs='?', help='TCPDF text or questions JSON (default: questions.json)')
+    parser.add_argument('-o', '--output', help='write the TOPIC_MAP as JSON here')
+    parser.add_argument('--min-confidence', type=float, default=0.5,
+                        help='list questions below this confidence for review')
+    parser.add_argument('--eval', action='store_true', help='cross-validate on the labelled bank')
+    args = parser.parse_args(argv)
+
+    clf, train_questions, labels = train_default()
+    if args.eval:
+        print(f"5-fold primary-topic accuracy: {cross_validate(train_questions, labels):.1%}")
+        return
+
+    questions = load_bank(args.bank) if args.bank else train_questions
+    topic_map, results = classify(questions, clf)
+    for topic, ids in topic_map.items():
+        print(f"{topic}: {len(ids)}")
+    low = [(qid, topics, conf) for qid, topics, conf in results if conf < args.min_confidence]
+    if low:
+        print(f"\n{len(low)} question(s) below {args.min_confidence:.0%} confidence:")
+        for qid, topics, conf in low:
+            print(f"  Q{qid}: {topics[0]} ({conf:.0%})")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(topic_map, f, ensure_ascii=False, indent=2)
+        print(f"\nSaved to {args.output}")
+
+if __name__ == '__main__':
+    main()
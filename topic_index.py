@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Multi-label topic index built once from a TOPIC_MAP-style dict.
+
+Every topic gets one bit. A question maps to the OR of its topic bits, and a
+topic maps to a sorted array of its question IDs, so membership is a dict
+lookup plus a bit test and set algebra is integer arithmetic:
+
+    idx = TopicIndex(TOPIC_MAP, aliases=TOPIC_ALIASES)
+    idx.topics_of(126)                      # every topic of Q126
+    idx.query('Memory AND NOT Threads')     # sorted question IDs
+    idx.query('الجمود (Deadlock) OR "I/O"')  # full names may contain parentheses
+    idx.select(all_of=['Memory'], none_of=['Threads'])
+
+With a `default` topic and the bank's question `ids`, a question that no
+topic lists is indexed under the default, so query, select, ids and
+topics_of all agree on it.
+"""
+import re
+from array import array
+
+class TopicIndex:
+    def __init__(self, topic_map, default=None, aliases=None, ids=()):
+        self.topics = list(topic_map)
+        if default and default not in self.topics:
+            self.topics.append(default)
+        self.bits = {t: 1 << i for i, t in enumerate(self.topics)}
+        self.default = default
+        self.aliases = {k.lower(): v for k, v in (aliases or {}).items()}
+        # query tokens: a quoted name, then a known topic or alias (longest
+        # first, so names with parentheses stay whole), then the operators
+        names = sorted({*self.topics, *(aliases or {})}, key=len, reverse=True)
+        self._token = re.compile(r'"([^"]*)"|(?<!\w)(?i:(' + '|'.join(map(re.escape, names)) + r'))(?!\w)'
+                                 r'|\(|\)|\bAND\b|\bOR\b|\bNOT\b' if names else _TOKEN.pattern)
+
+        masks, members = {}, {t: set(ids) for t, ids in topic_map.items()}
+        for topic, qids in topic_map.items():
+            bit = self.bits[topic]
+            for qid in qids:
+                masks[qid] = masks.get(qid, 0) | bit
+        if default:
+            unlisted = [qid for qid in ids if qid not in masks]
+            masks.update(dict.fromkeys(unlisted, self.bits[default]))
+            members.setdefault(default, set()).update(unlisted)
+        self.masks = masks
+        self.all_ids = array('l', sorted(masks))
+        self._ids = {t: array('l', sorted(members.get(t, ()))) for t in self.topics}
+        # few distinct masks exist, so topic tuples are shared per mask value
+        self._names = {}
+        for mask in set(masks.values()):
+            self._names[mask] = tuple(t for t in self.topics if mask & self.bits[t])
+
+    def __len__(self):
+        return len(self.masks)
+
+    def __contains__(self, qid):
+        return qid in self.masks
+
+    def resolve(self, name):
+        """Topic name from an exact name, an alias or a unique substring"""
+        if name in self.bits:
+            return name
+        key = name.strip().lower()
+        if key in self.aliases:
+            return self.aliases[key]
+        matches = [t for t in self.topics if key in t.lower()]
+        if len(matches) != 1:
+            raise KeyError(f"unknown or ambiguous topic: {name!r}")
+        return matches[0]
+
+    def bit(self, *names):
+        mask = 0
+        for name in names:
+            mask |= self.bits[self.resolve(name)]
+        return mask
+
+    def mask(self, qid):
+        return self.masks.get(qid, 0)
+
+    def topics_of(self, qid):
+        """Every topic of a question, in TOPIC_MAP order"""
+        names = self._names.get(self.masks.get(qid, 0))
+        if names:
+            return names
+        return (self.default,) if self.default else ()
+
+    def primary(self, qid):
+        """First topic of a question (the single label get_topic used to return)"""
+        names = self.topics_of(qid)
+        return names[0] if names else None
+
+    def ids(self, name):
+        """Sorted array of the question IDs of one topic"""
+        return self._ids[self.resolve(name)]
+
+    def counts(self):
+        return {t: len(ids) for t, ids in self._ids.items()}
+
+    def select(self, all_of=(), any_of=(), none_of=()):
+        """Sorted IDs in every `all_of` topic, at least one `any_of`, no `none_of`"""
+        need = self.bit(*all_of)
+        some = self.bit(*any_of)
+        avoid = self.bit(*none_of)
+        if all_of:
+            # walk the smallest required topic instead of the whole bank
+            candidates = min((self.ids(t) for t in all_of), key=len)
+        elif any_of:
+            candidates = sorted(set().union(*(self.ids(t) for t in any_of)))
+        else:
+            candidates = self.all_ids
+        masks = self.masks
+        return [qid for qid in candidates
+                if masks[qid] & need == need
+                and (not some or masks[qid] & some)
+                and not masks[qid] & avoid]
+
+    def query(self, expr):
+        """Sorted IDs matching a boolean expression of topics (AND, OR, NOT, parentheses)"""
+        test = _compile(expr, self, self._token)
+        masks = self.masks
+        return [qid for qid in self.all_ids if test(masks[qid])]
+
+_TOKEN = re.compile(r'\(|\)|\bAND\b|\bOR\b|\bNOT\b')
+
+def _tokenize(expr, token=_TOKEN):
+    tokens, pos = [], 0
+    for m in token.finditer(expr):
+        name = expr[pos:m.start()].strip()
+        if name:
+            tokens.append(('NAME', name))
+        if m.lastindex:
+            tokens.append(('NAME', m.group(m.lastindex)))
+        else:
+            tokens.append((m.group(), m.group()))
+        pos = m.end()
+    name = expr[pos:].strip()
+    if name:
+        tokens.append(('NAME', name))
+    return tokens
+
+def _compile(expr, index, token=_TOKEN):
+    """Recursive-descent compile of a topic expression into a mask predicate"""
+    tokens = _tokenize(expr, token)
+    pos = 0
+
+    def peek():
+        return tokens[pos][0] if pos < len(tokens) else None
+
+    def take(kind):
+        nonlocal pos
+        if peek() != kind:
+            raise ValueError(f"expected {kind} in topic query {expr!r}")
+        pos += 1
+        return tokens[pos - 1][1]
+
+    def parse_or():
+        left = parse_and()
+        while peek() == 'OR':
+            take('OR')
+            right = parse_and()
+            left = (lambda a, b: lambda m: a(m) or b(m))(left, right)
+        return left
+
+    def parse_and():
+        left = parse_not()
+        while peek() == 'AND':
+            take('AND')
+            right = parse_not()
+            left = (lambda a, b: lambda m: a(m) and b(m))(left, right)
+        return left
+
+    def parse_not():
+        if peek() == 'NOT':
+            take('NOT')
+            inner = parse_not()
+            return lambda m: not inner(m)
+        if peek() == '(':
+            take('(')
+            inner = parse_or()
+            take(')')
+            return inner
+        bit = index.bit(take('NAME'))
+        return lambda m: bool(m & bit)
+
+    test = parse_or()
+    if pos != len(tokens):
+        raise ValueError(f"unexpected {tokens[pos][1]!r} in topic query {expr!r}")
+    return test
+
+def check(index, ids=()):
+    """Every topic and alias must query back to exactly its own questions, and
+    every question of `ids` (the bank) must be in the topics topics_of gives it"""
+    names = [(t, t) for t in index.topics] + list(index.aliases.items())
+    for name, topic in names:
+        for expr in (name, f'"{name}"', f'({name})'):
+            if index.query(expr) != list(index.ids(topic)):
+                raise AssertionError(f"topic query {expr!r} does not match {topic!r}")
+    members = {t: set(index.ids(t)) for t in index.topics}
+    for qid in ids:
+        listed = tuple(t for t in index.topics if qid in members[t])
+        if qid not in index or listed != index.topics_of(qid):
+            raise AssertionError(f"Q{qid}: topics_of gives {index.topics_of(qid)}, "
+                                 f"the topic lists {listed}")
+
+if __name__ == '__main__':
+    import sys
+    from generate_html import TOPIC_INDEX, load_questions
+    check(TOPIC_INDEX, [q['id'] for q in load_questions()])
+    for expr in sys.argv[1:] or ['Memory AND NOT Threads']:
+        ids = TOPIC_INDEX.query(expr)
+        print(f"{expr}: {len(ids)} questions")
+        print(f"  {ids}")
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Aggregate algorithm-trainer event logs: agreement with the algorithm per rule and question.
+
+algorithm_trainer.html logs every answer as a compact event (seq, time,
+qid, choice, algo pick, rule index, ms to answer) in an IndexedDB ring
+buffer and exports it as trainer_log_<student>.json. The logs of many
+students are read into flat NumPy columns; events exported twice are
+dropped by (student, seq, time), and every statistic is a grouped reduction
+(bincount for counts and sums, one lexsort for medians):
+
+  agreement     the student picked the option the algorithm picks
+  accuracy      the student's answer is right (answer key of questions.json)
+  algo          the algorithm's pick is right
+  followed / overrode   accuracy when agreeing / disagreeing with it
+
+per rule that fired, and per question with its median time to answer:
+
+    python trainer_analytics.py logs/*.json -o trainer_report.json
+    python trainer_analytics.py logs/ --slowest 20
+"""
+import argparse, glob, json, os
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_VERSION = 1
+FIELDS = ['seq', 'time', 'qid', 'choice', 'algo', 'rule', 'ms']
+# answers slower than this (idle tabs) count for the other statistics but not the times
+MAX_MS = 10 * 60 * 1000
+
+def log_paths(paths):
+    """Files of the arguments, directories expanded to their *.json"""
+    out = []
+    for path in paths:
+        out += sorted(glob.glob(os.path.join(path, '*.json'))) if os.path.isdir(path) else [path]
+    return out
+
+def load_logs(paths):
+    """(columns {field: array, 'student': codes}, students, rules) of exported logs"""
+    students, rules, parts = [], [], []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('v') != LOG_VERSION:
+            raise ValueError(f"{path}: unsupported log version {data.get('v')!r}")
+        events = np.array(data['events'], dtype=np.int64).reshape(-1, len(FIELDS))
+        # rule indices of this log -> positions in the merged rule list
+        codes = []
+        for name in data['rules']:
+            if name not in rules:
+                rules.append(name)
+            codes.append(rules.index(name))
+        codes = np.array(codes + [-1], dtype=np.int64)  # -1: no rule fired
+        events[:, FIELDS.index('rule')] = codes[events[:, FIELDS.index('rule')]]
+        if data['student'] not in students:
+            students.append(data['student'])
+        student = np.full((len(events), 1), students.index(data['student']), dtype=np.int64)
+        parts.append(np.hstack([events, student]))
+    table = np.vstack(parts) if parts else np.zeros((0, len(FIELDS) + 1), dtype=np.int64)
+    # the same event exported in two logs of a student counts once; the time
+    # keeps apart answers that older trainers gave the same seq
+    _, first = np.unique(table[:, [-1, 0, 1]], axis=0, return_index=True)
+    table = table[np.sort(first)]
+    columns = {name: table[:, i] for i, name in enumerate(FIELDS)}
+    columns['student'] = table[:, -1]
+    return columns, students, rules
+
+def grouped_median(groups, values, size):
+    """Median of `values` per group 0..size-1 (NaN for empty groups)"""
+    order = np.lexsort((values, groups))
+    groups, values = groups[order], values[order]
+    starts = np.searchsorted(groups, np.arange(size))
+    counts = np.bincount(groups, minlength=size)
+    out = np.full(size, np.nan)
+    has = counts > 0
+    lo = starts[has] + (counts[has] - 1) // 2
+    hi = starts[has] + counts[has] // 2
+    out[has] = (values[lo] + values[hi]) / 2
+    return out
+
+def _rate(num, den):
+    """num / den rounded, None where den is 0"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rate = np.round(num / den, 4)
+    return [None if d == 0 else float(r) for r, d in zip(rate, den)]
+
+def grouped(groups, size, columns, key):
+    """{statistic: list over groups} of the events split by `groups`"""
+    qid = columns['qid']
+    known = (qid >= 0) & (qid < len(key))
+    right = np.zeros(len(qid), dtype=bool)
+    algo_right = np.zeros(len(qid), dtype=bool)
+    right[known] = key[qid[known]] == columns['choice'][known]
+    algo_right[known] = key[qid[known]] == columns['algo'][known]
+    agree = columns['choice'] == columns['algo']
+
+    def count(mask=None):
+        return np.bincount(groups, weights=mask, minlength=size)
+    n = count()
+    timed = columns['ms'] <= MAX_MS
+    return {
+        'n': n.astype(np.int64).tolist(),
+        'agreement': _rate(count(agree), n),
+        'accuracy': _rate(count(right), n),
+        'algo': _rate(count(algo_right), n),
+        'followed': _rate(count(agree & right), count(agree)),
+        'overrode': _rate(count(~agree & right), count(~agree)),
+        'median_ms': [None if np.isnan(m) else int(m) for m in
+                      grouped_median(groups[timed], columns['ms'][timed], size)],
+    }
+
+def report(columns, students, rules, key):
+    """{'students', 'events', 'rules': {rule: stats}, 'questions': {qid: stats}}"""
+    out = {'students': len(students), 'events': len(columns['qid'])}
+    rule = columns['rule']
+    fired = rule >= 0
+    by_rule = grouped(rule[fired], len(rules), {k: v[fired] for k, v in columns.items()}, key)
+    out['rules'] = {name: {stat: values[i] for stat, values in by_rule.items()}
+                    for i, name in enumerate(rules) if by_rule['n'][i]}
+
+    qids, codes = np.unique(columns['qid'], return_inverse=True)
+    by_question = grouped(codes, len(qids), columns, key)
+    # the rule that fired most often on each question
+    width = len(rules) + 1
+    fired_counts = np.bincount(codes * width + rule + 1, minlength=len(qids) * width)
+    common = fired_counts.reshape(len(qids), width).argmax(axis=1) - 1
+    out['questions'] = {int(qid): {**{stat: values[i] for stat, values in by_question.items()},
+                                   'rule': rules[common[i]] if common[i] >= 0 else None}
+                        for i, qid in enumerate(qids)}
+    return out
+
+def main(argv=None):
+    from item_analysis import load_key
+    parser = argparse.ArgumentParser(description='Aggregate algorithm-trainer event logs.')
+    parser.add_argument('logs', nargs='+', help='exported trainer_log_*.json files or directories of them')
+    parser.add_argument('-o', '--output', help='write the report as JSON')
+    parser.add_argument('--slowest', type=int, default=10, help='questions to list by median time')
+    args = parser.parse_args(argv)
+
+    columns, students, rules = load_logs(log_paths(args.logs))
+    result = report(columns, students, rules, load_key()[0])
+    print(f"{result['events']} answers from {result['students']} students")
+    print(f"  {'rule':<22}{'n':>7}{'agree':>8}{'right':>8}{'algo':>8}{'followed':>10}{'overrode':>10}")
+    fmt = lambda r: '-' if r is None else f"{r:.0%}"
+    for name, r in sorted(result['rules'].items(), key=lambda item: -item[1]['n']):
+        print(f"  {name:<22}{r['n']:>7}{fmt(r['agreement']):>8}{fmt(r['accuracy']):>8}"
+              f"{fmt(r['algo']):>8}{fmt(r['followed']):>10}{fmt(r['overrode']):>10}")
+    slow = sorted((r['median_ms'], qid) for qid, r in result['questions'].items()
+                  if r['median_ms'] is not None)[::-1][:args.slowest]
+    if slow:
+        print('Slowest questions (median time to answer):')
+        for ms, qid in slow:
+            r = result['questions'][qid]
+            print(f"  Q{qid}: {ms / 1000:.1f}s  n={r['n']} agree={fmt(r['agreement'])} "
+                  f"right={fmt(r['accuracy'])} rule={r['rule']}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=1)
+        print(f"Saved to {args.output}")
+
+if __name__ == '__main__':
+    main()
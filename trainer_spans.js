@@ -0,0 +1 @@
+const TRAINER_SPANS = {"v":1,"kinds":["trap","gold1","gold2","gold3","echo"],"spans":{"1":[[0,10,3],[],[],[0,3,3]],"2":[[9,12,4],[],[9,12,4],[]],"3":[[],[],[],[]],"4":[[0,4,2],[0,3,3,4,13,4,33,37,2],[0,4,2],[]],"5":[[52,57,2],[53,62,0],[40,46,0],[]],"6":[[9,17,3,18,23,3],[],[],[]],"7":[[14,24,4],[10,20,4],[11,21,4],[]],"8":[[3,9,3,10,18,3,19,24,3,27,31,4],[3,12,0],[],[11,15,4]],"9":[[],[],[3,8,0],[]],"10":[[3,7,3],[],[],[]],"11":[[],[],[10,16,0],[]],"12":[[16,20,2,45,49,4],[0,6,0,33,37,4],[28,32,4],[]],"13":[[],[3,15,0],[],[]],"14":[[10,16,0],[10,16,0],[3,9,0],[3,9,0,22,31,0]],"15":[[],[],[],[3,6,3]],"16":[[3,11,0,12,16,4],[13,17,4,27,32,0],[3,10,0,11,15,4],[]],"17":[[],[3,7,3],[],[]],"18":[[],[],[],[0,3,3]],"19":[[0,4,1],[0,4,1],[],[12,16,1]],"20":[[39,46,1,47,52,1,53,56,3],[48,53,1,54,57,3],[18,21,3],[]],"21":[[],[],[],[]],"22":[[],[]],"23":[[],[]],"24":[[],[],[],[]],"25":[[],[],[27,33,0],[]],"26":[[],[],[],[0,3,3]],"27":[[3,9,0],[],[],[]],"28":[[],[13,19,0],[3,10,0],[3,13,0,14,23,0]],"29":[[],[0,3,4],[0,8,3],[]],"30":[[],[],[],[]],"31":[[],[3,9,0],[],[3,6,3]],"32":[[],[],[],[]],"33":[[],[],[9,13,4,14,18,4],[3,8,0]],"34":[[3,12,2],[3,11,3],[],[]],"35":[[],[],[3,8,4,14,19,4],[12,22,4]],"36":[[],[3,15,0],[],[]],"37":[[],[],[12,18,0],[11,14,3]],"38":[[],[3,9,0],[],[3,6,1]],"39":[[],[],[],[]],"40":[[6,12,1],[],[15,21,0],[]],"41":[[5,15,3],[],[],[]],"42":[[],[],[],[]],"43":[[],[],[],[]],"44":[[3,9,0],[],[3,12,2],[]],"45":[[3,7,4],[],[3,7,4,8,12,4],[]],"46":[[],[3,10,0,38,44,0],[17,23,0],[12,18,0]],"47":[[12,20,3,21,25,4],[],[],[3,10,0,11,17,0]],"48":[[3,9,0],[],[],[]],"49":[[],[],[],[3,12,0,13,19,0]],"50":[[],[3,8,0],[],[]],"51":[[],[],[],[]],"52":[[],[3,9,0,10,17,0],[11,20,3],[]],"53":[[9,15,0],[9,17,3,18,22,4],[],[]],"54":[[],[],[3,8,0],[]],"55":[[11,20,3],[],[],[]],"56":[[],[],[],[]],"57":[[19,24,0],[],[],[15,21,0]],"58":[[],[],[],[]],"59":[[],[],[3,9,0,10,17,0],[]],"60":[[34,40,0],[],[],[]],"61":[[],[5,11,0],[],[13,19,0]],"62":[[3,8,2],[],[],[]],"63":[[],[3,11,4],[],[12,22,4]],"64":[[12,22,4],[],[],[]],"65":[[],[3,9,1],[12,18,0],[]],"66":[[],[3,13,4,14,20,0],[],[]],"67":[[],[],[],[]],"68":[[],[3,15,0],[],[]],"69":[[],[3,9,1,39,43,1,44,52,3,53,59,0],[3,10,0],[]],"70":[[],[],[],[]],"71":[[],[3,7,3],[],[]],"72":[[],[9,17,3,18,23,3],[],[12,18,0]],"73":[[18,22,4],[17,21,4],[18,22,4],[3,12,0]],"74":[[14,24,4],[10,20,4],[11,21,4],[]],"75":[[9,13,4,37,45,3],[12,16,4,25,30,0],[],[]],"76":[[21,25,4,30,34,1,51,59,1,60,64,1],[38,50,0],[23,29,0],[18,26,4]],"77":[[12,20,1,21,25,1],[],[],[]],"78":[[18,26,1],[],[],[3,12,0,13,19,0]],"79":[[12,22,0],[],[],[3,6,3]],"80":[[],[],[],[3,9,0]],"81":[[],[],[3,7,3],[]],"82":[[],[],[3,9,0,10,16,0],[3,10,0,11,20,0]],"83":[[],[12,16,4,17,21,4],[],[]],"84":[[3,7,3],[],[],[]],"85":[[29,33,3],[],[],[10,19,0]],"86":[[3,13,0,14,26,1],[],[3,11,0,12,18,0],[]],"87":[[10,22,1],[],[3,11,0],[3,12,0,13,19,0]],"88":[[],[16,20,4],[],[12,22,4]],"89":[[32,37,2],[],[],[3,12,0]],"90":[[],[22,26,4],[],[]],"91":[[3,7,2,15,19,3],[],[13,19,0],[]],"92":[[13,19,0],[],[23,29,0],[]],"93":[[36,40,4,56,62,0],[8,14,0],[],[]],"94":[[],[0,5,2],[0,7,4],[]],"95":[[],[7,13,0],[],[]],"96":[[],[],[],[]],"97":[[0,8,3,9,16,4],[9,16,4],[8,15,4],[]],"98":[[],[],[],[0,3,3]],"99":[[],[]],"100":[[],[]],"101":[[],[13,19,0],[],[21,27,0]],"102":[[3,8,3],[],[27,31,2],[22,28,0]],"103":[[],[],[],[11,17,0]],"104":[[12,16,3],[],[],[3,9,0]],"105":[[],[],[],[20,30,4]],"106":[[3,8,4,14,19,4],[],[],[12,22,4]],"107":[[],[],[11,15,4,16,27,4],[]],"108":[[8,13,1],[12,18,0],[3,9,0],[18,24,0]],"109":[[],[],[0,4,3],[]],"110":[[],[],[],[]],"111":[[22,28,0],[],[20,24,2,62,68,0],[]],"112":[[5,9,3,25,31,3,44,49,3],[],[],[]],"113":[[25,31,0],[],[],[]],"114":[[],[]],"115":[[],[]],"116":[[],[3,15,0],[],[]],"117":[[10,16,0],[16,21,0],[3,9,0,10,14,4],[9,13,3]],"118":[[],[],[3,10,4,11,15,4,16,27,4],[]],"119":[[17,22,1,26,34,3,35,41,0],[],[],[]],"120":[[20,24,3,39,44,1,45,49,1,50,59,2],[],[],[]],"121":[[],[],[],[]],"122":[[3,11,3],[],[14,20,0],[]],"123":[[],[],[],[]],"124":[[3,7,4],[3,7,4],[],[3,7,4]],"125":[[],[3,10,4],[],[]],"126":[[],[3,9,0],[],[]],"127":[[],[],[],[12,22,0]],"128":[[],[],[3,9,0],[]],"129":[[],[],[3,9,0],[]],"130":[[],[],[11,17,0],[]],"131":[[],[],[],[]],"132":[[],[],[3,9,0],[12,22,0]],"133":[[],[],[],[]],"134":[[10,16,0],[],[],[]],"135":[[],[3,9,0],[3,10,4],[]],"136":[[3,9,0],[13,21,4],[],[]],"137":[[],[12,16,3,17,23,0,24,28,1],[],[]],"138":[[],[3,11,3,37,41,3],[],[20,26,0]],"139":[[19,23,4],[26,32,0],[11,17,0,18,28,4],[]],"140":[[10,20,4],[8,18,4],[11,21,4],[3,8,4]],"141":[[],[],[3,9,0],[]],"142":[[3,9,0],[12,22,4],[],[]],"143":[[],[3,9,0],[],[12,22,0]],"144":[[3,7,4,8,17,4],[],[],[]],"145":[[],[3,13,3],[],[]],"146":[[],[34,38,3,44,56,1],[],[3,11,3,28,32,3]],"147":[[3,11,3],[],[3,12,2],[3,12,2]],"148":[[3,13,3],[],[],[]],"149":[[],[3,9,0],[],[]],"150":[[26,30,4],[33,37,4],[3,9,3,10,18,3,39,43,4],[20,24,4]],"151":[[],[11,17,0],[],[]],"152":[[],[],[3,9,0],[]],"153":[[11,17,0],[],[],[12,22,0]],"154":[[],[],[],[3,9,0]],"155":[[13,17,4,18,27,4],[16,25,4],[11,20,3],[8,15,0]],"156":[[11,20,4],[],[],[]],"157":[[],[3,9,0],[11,17,0],[]],"158":[[3,11,3],[],[],[]],"159":[[],[],[3,11,4],[3,13,3]],"160":[[],[3,9,0],[],[]],"161":[[3,8,3,13,17,4,18,24,0],[17,23,0],[27,31,2],[]],"162":[[3,9,0],[],[12,22,0],[11,17,0]],"163":[[3,10,0,43,47,2],[],[45,51,0],[]],"164":[[52,57,1],[13,19,0,37,41,2],[],[]],"165":[[5,15,3,39,44,2],[38,44,0,45,51,4],[31,40,0],[]],"166":[[37,46,1],[3,7,3,25,31,0],[],[]],"167":[[24,30,4,31,35,1,66,72,4],[32,38,4],[27,33,4],[]],"168":[[16,25,2],[],[20,26,0],[]],"169":[[],[12,22,4],[],[]],"170":[[3,10,0,11,17,0],[3,7,3],[],[]],"171":[[3,12,1],[18,27,1],[],[]],"172":[[43,50,4],[59,68,1],[3,10,4,25,30,3,31,35,3],[3,10,4]],"173":[[],[],[],[21,26,0]],"174":[[],[],[],[3,8,0]],"175":[[10,14,2],[],[],[]],"176":[[],[],[],[]],"177":[[8,15,0],[3,9,0,10,17,0],[7,16,3],[]],"178":[[14,20,0],[],[36,44,3],[]],"179":[[6,12,1],[6,12,1,38,44,0],[6,13,0],[6,14,0,45,51,0]],"180":[[5,8,1,38,41,1,42,47,1],[],[],[]]}};
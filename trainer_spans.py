@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Keyword highlight spans of the algorithm trainer, computed at build time.
+
+For every option of every question the answer engine's word lists
+(simulate_v3: trap words, tier 1-3 keywords, and echo words shared with the
+question outside STOP_WORDS) are matched once against the option text as
+shown, and each highlighted word is written as a (start, end, kind) triple.
+Offsets are UTF-16 code units into the raw option text, the unit of JS
+string indices, so the page slices the text directly. A word gets the first
+kind that applies, in KINDS order, so spans never overlap and come out
+sorted; the trainer renders an option with one linear merge of text and
+spans instead of a regex pass per keyword.
+
+The spans are written as trainer_spans.js, loaded next to questions_data.js:
+
+    TRAINER_SPANS.spans[qid][option] = [start, end, kind, start, end, kind, ...]
+
+    python trainer_spans.py             # write trainer_spans.js
+    python trainer_spans.py 12 57       # print the spans of some questions
+"""
+import json, os, re
+
+from generate_html import load_questions, write_if_changed
+from simulate_v3 import STOP_WORDS, TIER1, TIER2, TIER3, TRAP_WORDS, clean, get_words
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SPANS_JS = os.path.join(SCRIPT_DIR, 'trainer_spans.js')
+SPANS_VERSION = 1
+
+# kind index -> CSS class suffix of the trainer (kw-<kind>); earlier wins
+KINDS = ['trap', 'gold1', 'gold2', 'gold3', 'echo']
+
+# the words getWords() sees, with the word boundaries of the old \b regexes
+_WORD = re.compile(r'\b[a-zA-Z]+\b')
+
+def _utf16(text):
+    """Python index -> UTF-16 offset, or None when the two coincide"""
+    if all(ord(c) < 0x10000 for c in text):
+        return None
+    out, pos = [], 0
+    for c in text:
+        out.append(pos)
+        pos += 2 if ord(c) >= 0x10000 else 1
+    out.append(pos)
+    return out
+
+def option_spans(raw, echo):
+    """Flat [start, end, kind, ...] of one option's raw text"""
+    lists = [set(TRAP_WORDS), set(TIER1), set(TIER2), set(TIER3), echo]
+    body = clean(raw)
+    offset = raw.index(body) if body else 0
+    units = _utf16(raw)
+    out = []
+    for m in _WORD.finditer(raw, offset):
+        word = m.group().lower()
+        kind = next((k for k, words in enumerate(lists) if word in words), None)
+        if kind is None:
+            continue
+        start, end = m.span()
+        if units is not None:
+            start, end = units[start], units[end]
+        out += [start, end, kind]
+    return out
+
+def question_spans(q):
+    """Per option span lists of one question"""
+    q_words = get_words(q['text']) - STOP_WORDS
+    return [option_spans(o['text'], q_words & (get_words(clean(o['text'])) - STOP_WORDS))
+            for o in q['options']]
+
+def build(path=SPANS_JS, questions=None):
+    """Write trainer_spans.js; returns True if it changed"""
+    questions = load_questions() if questions is None else questions
+    data = {'v': SPANS_VERSION, 'kinds': KINDS,
+            'spans': {q['id']: question_spans(q) for q in questions}}
+    text = ('const TRAINER_SPANS = '
+            + json.dumps(data, separators=(',', ':')) + ';\n')
+    return write_if_changed(path, text)
+
+def main(argv=None):
+    import sys
+    args = sys.argv[1:] if argv is None else argv
+    changed = build()
+    print(f"{'Updated' if changed else 'Unchanged'} {SPANS_JS}")
+    if args:
+        by_id = {q['id']: q for q in load_questions()}
+        for qid in map(int, args):
+            for o, spans in zip(by_id[qid]['options'], question_spans(by_id[qid])):
+                marks = [f"{KINDS[k]}:{o['text'][s:e]}" for s, e, k in zip(*[iter(spans)] * 3)]
+                print(f"Q{qid} {o['text']!r}: {' '.join(marks) or '-'}")
+
+if __name__ == '__main__':
+    main()